@@ -0,0 +1,374 @@
+"""
+Contraction Hierarchies (CH)
+
+Description: Preprocessing engine for repeated shortest path queries on a
+             static DirectedWeightedGraph.
+
+             1. Node Ordering:  Vertices are contracted one at a time in order
+                                of importance (edge difference + contracted
+                                neighbours + hierarchy level), refreshed for
+                                neighbours after each contraction and lazily
+                                re-checked when a vertex reaches the front.
+             2. Shortcuts:      Contracting v adds a shortcut u -> w for every
+                                pair of neighbours whose shortest path runs
+                                through v (no witness path avoiding v).
+             3. Query:          Bidirectional Dijkstra that only follows edges
+                                towards higher ranked vertices, then shortcuts
+                                are unpacked back into original vertices.
+
+Persistence: save() writes flat typed arrays, so load() only ever parses
+             numbers & a JSON list of vertex names, never executable data.
+             Layout (native byte order, every section padded to 8 bytes):
+
+             - Header:    magic, version, byte order, V, up E, down E,
+                          shortcuts S, name bytes
+             - names:     UTF-8 JSON list of vertex names (strings or numbers)
+             - rank:      int32[V]
+             - up, down:  int64[V + 1] offsets, int32[E] targets,
+                          float64[E] weights
+             - shortcuts: int32[S] tails, int32[S] heads, int32[S] middles
+"""
+
+import json
+import struct
+import sys
+from array import array
+
+from algorithms.pathfinding import IndexedPriorityQueue
+
+# Bumped whenever the persisted layout changes
+CH_FORMAT_VERSION = 2
+
+# File header: magic, version, little endian flag, V, up E, down E, S, name bytes
+CH_MAGIC = b"DWGCH\x00\x00\x00"
+CH_HEADER = struct.Struct("<8sII5Q")
+
+
+class ContractionHierarchy:
+  """
+  Contraction Hierarchy Class:
+  names:          Maps dense id to original vertex name
+  ids:            Maps original vertex name to dense id
+  rank:           Contraction order of each dense id
+  up_*:           CSR arrays of edges u -> w with rank[w] > rank[u], indexed by u
+  down_*:         CSR arrays of edges u -> w with rank[u] > rank[w], indexed by w
+                  (down_targets holds u, the tail the backward search moves to)
+  shortcut_via:   Maps shortcut edge (u, w) to the contracted middle vertex
+  """
+  def __init__(self, names, rank, up_offsets, up_targets, up_weights,
+               down_offsets, down_targets, down_weights, shortcut_via):
+    self.names = names
+    self.ids = {name: index for index, name in enumerate(names)}
+    self.rank = rank
+    self.up_offsets = up_offsets
+    self.up_targets = up_targets
+    self.up_weights = up_weights
+    self.down_offsets = down_offsets
+    self.down_targets = down_targets
+    self.down_weights = down_weights
+    self.shortcut_via = shortcut_via
+
+  # ================== Preprocessing ================== #
+  @classmethod
+  def build(cls, graph, witness_limit=64):
+    """
+    Contract every vertex of a DirectedWeightedGraph
+
+    witness_limit caps the vertices settled by each witness search. A
+    smaller limit preprocesses faster but may add unnecessary (still
+    correct) shortcuts.
+    """
+    names = list(graph.vertex_map)
+    ids = {name: index for index, name in enumerate(names)}
+    vertex_count = len(names)
+
+    # Remaining (uncontracted) graph: out_edges[u][w] = in_edges[w][u] = weight
+    out_edges = [{} for _ in range(vertex_count)]
+    in_edges = [{} for _ in range(vertex_count)]
+    for u_name, u_object in graph.vertex_map.items():
+      u = ids[u_name]
+      for v_name, weight in u_object.neighbour_links.items():
+        w = ids[v_name]
+        if u != w:
+          out_edges[u][w] = weight
+          in_edges[w][u] = weight
+
+    shortcut_via = {}
+    contracted_neighbours = [0] * vertex_count
+    level = [0] * vertex_count
+    rank = array("i", [0]) * vertex_count
+
+    # Edges leaving the remaining graph as each vertex is contracted
+    up_lists = [None] * vertex_count
+    down_lists = [None] * vertex_count
+
+    def witness_distances(source, skipped, limit_distance):
+      """Bounded Dijkstra from source in the remaining graph avoiding skipped"""
+      distance = {source: 0}
+      priority_queue = IndexedPriorityQueue()
+      priority_queue.enqueue(source, 0)
+      settled = 0
+
+      while not priority_queue.is_empty() and settled < witness_limit:
+        u_distance, u = priority_queue.dequeue()
+        if u_distance > limit_distance:
+          break
+        settled += 1
+
+        for w, weight in out_edges[u].items():
+          if w == skipped:
+            continue
+          new_distance = u_distance + weight
+          if w not in distance or new_distance < distance[w]:
+            distance[w] = new_distance
+            priority_queue.enqueue(w, new_distance)
+
+      return distance
+
+    def find_shortcuts(v):
+      """Shortcuts (u, w, weight) needed if v were contracted now"""
+      shortcuts = []
+      for u, in_weight in in_edges[v].items():
+        # Path lengths u -> v -> w that must be preserved
+        through_v = {w: in_weight + out_weight
+                     for w, out_weight in out_edges[v].items() if w != u}
+        if not through_v:
+          continue
+
+        witness = witness_distances(u, v, max(through_v.values()))
+        for w, length in through_v.items():
+          if witness.get(w, float("inf")) > length:
+            shortcuts.append((u, w, length))
+      return shortcuts
+
+    def importance(v):
+      """Edge difference + contracted neighbours + level: lower contracts first"""
+      edge_difference = len(find_shortcuts(v)) - len(in_edges[v]) - len(out_edges[v])
+      return edge_difference + contracted_neighbours[v] + level[v]
+
+    # Initialise node ordering queue
+    priority_queue = IndexedPriorityQueue()
+    for v in range(vertex_count):
+      priority_queue.enqueue(v, importance(v))
+
+    order = 0
+    while not priority_queue.is_empty():
+      _, v = priority_queue.dequeue()
+
+      # Lazy update: re-queue if importance grew past the next candidate
+      current = importance(v)
+      if not priority_queue.is_empty() and current > priority_queue.peek()[0]:
+        priority_queue.enqueue(v, current)
+        continue
+
+      # Add shortcuts that bypass v, keeping only improvements
+      for u, w, length in find_shortcuts(v):
+        if length < out_edges[u].get(w, float("inf")):
+          out_edges[u][w] = length
+          in_edges[w][u] = length
+          shortcut_via[(u, w)] = v
+
+      # Freeze v's remaining edges: all neighbours will be ranked higher
+      rank[v] = order
+      order += 1
+      up_lists[v] = list(out_edges[v].items())
+      down_lists[v] = list(in_edges[v].items())
+
+      neighbours = set(out_edges[v]) | set(in_edges[v])
+      for w in out_edges[v]:
+        del in_edges[w][v]
+      for u in in_edges[v]:
+        del out_edges[u][v]
+      out_edges[v] = {}
+      in_edges[v] = {}
+
+      # Neighbours lose an edge & gain a contracted neighbour: refresh them
+      for u in neighbours:
+        contracted_neighbours[u] += 1
+        level[u] = max(level[u], level[v] + 1)
+        priority_queue.enqueue(u, importance(u))
+
+    up_offsets, up_targets, up_weights = cls._pack(up_lists)
+    down_offsets, down_targets, down_weights = cls._pack(down_lists)
+
+    return cls(names, rank, up_offsets, up_targets, up_weights,
+               down_offsets, down_targets, down_weights, shortcut_via)
+
+  @staticmethod
+  def _pack(edge_lists):
+    """Flatten per-vertex (target, weight) lists into CSR arrays"""
+    offsets = array("q", [0])
+    targets = array("i")
+    weights = array("d")
+    for edges in edge_lists:
+      for target, weight in edges:
+        targets.append(target)
+        weights.append(weight)
+      offsets.append(len(targets))
+    return offsets, targets, weights
+
+  @property
+  def shortcut_count(self):
+    """Number of shortcut edges added during preprocessing"""
+    return len(self.shortcut_via)
+
+  # ================== Query ================== #
+  def query(self, start_vertex, goal_vertex):
+    """Shortest path by upward bidirectional search: (path, distance, expanded_nodes)"""
+    # Check start & goal vertices exist
+    if start_vertex not in self.ids or goal_vertex not in self.ids:
+      return None, float("inf"), 0
+
+    start = self.ids[start_vertex]
+    goal = self.ids[goal_vertex]
+
+    # Forward [0] climbs up edges, backward [1] climbs reversed down edges
+    csr = ((self.up_offsets, self.up_targets, self.up_weights),
+           (self.down_offsets, self.down_targets, self.down_weights))
+    distance = ({start: 0}, {goal: 0})
+    parent = ({start: -1}, {goal: -1})
+    queues = (IndexedPriorityQueue(), IndexedPriorityQueue())
+    queues[0].enqueue(start, 0)
+    queues[1].enqueue(goal, 0)
+
+    best_distance = float("inf")
+    meeting_vertex = -1
+    expanded_nodes = 0
+
+    # Begin Main Loop: A side stops once its minimum reaches the best distance
+    while True:
+      side = -1
+      side_key = best_distance
+      for candidate in (0, 1):
+        if not queues[candidate].is_empty() and queues[candidate].peek()[0] < side_key:
+          side = candidate
+          side_key = queues[candidate].peek()[0]
+      if side == -1:
+        break
+
+      u_distance, u = queues[side].dequeue()
+      expanded_nodes += 1
+
+      # Both searches reached u: candidate path through u
+      other_distance = distance[1 - side].get(u)
+      if other_distance is not None and u_distance + other_distance < best_distance:
+        best_distance = u_distance + other_distance
+        meeting_vertex = u
+
+      offsets, targets, weights = csr[side]
+      side_distance = distance[side]
+      for edge in range(offsets[u], offsets[u + 1]):
+        v = targets[edge]
+        new_distance = u_distance + weights[edge]
+        if v not in side_distance or new_distance < side_distance[v]:
+          side_distance[v] = new_distance
+          parent[side][v] = u
+          queues[side].enqueue(v, new_distance)
+
+    # If the searches never met, return
+    if meeting_vertex == -1:
+      return None, float("inf"), expanded_nodes
+
+    # Hierarchy path: start -> meeting vertex -> goal
+    hierarchy_path = []
+    current = meeting_vertex
+    while current != -1:
+      hierarchy_path.append(current)
+      current = parent[0][current]
+    hierarchy_path.reverse()
+
+    current = parent[1][meeting_vertex]
+    while current != -1:
+      hierarchy_path.append(current)
+      current = parent[1][current]
+
+    path = [self.names[v] for v in self._unpack(hierarchy_path)]
+    return path, best_distance, expanded_nodes
+
+  def _unpack(self, hierarchy_path):
+    """Replace every shortcut edge by its original vertices"""
+    path = [hierarchy_path[0]]
+
+    # Explicit stack of edges still to expand, next edge on top
+    stack = [(u, w) for u, w in zip(hierarchy_path, hierarchy_path[1:])]
+    stack.reverse()
+
+    while stack:
+      u, w = stack.pop()
+      via = self.shortcut_via.get((u, w))
+      if via is None:
+        path.append(w)
+      else:
+        stack.append((via, w))
+        stack.append((u, via))
+
+    return path
+
+  # ================== Persistence ================== #
+  def save(self, filename):
+    """Write the hierarchy as flat binary arrays"""
+    if not all(isinstance(name, (str, int, float)) for name in self.names):
+      raise TypeError("Contraction hierarchy files require string or numeric vertex names")
+
+    names = json.dumps(self.names).encode()
+    shortcuts = list(self.shortcut_via.items())
+    sections = [
+      names,
+      array("i", self.rank),
+      array("q", self.up_offsets), array("i", self.up_targets), array("d", self.up_weights),
+      array("q", self.down_offsets), array("i", self.down_targets), array("d", self.down_weights),
+      array("i", (u for (u, _), _ in shortcuts)),
+      array("i", (w for (_, w), _ in shortcuts)),
+      array("i", (via for _, via in shortcuts)),
+    ]
+    header = CH_HEADER.pack(CH_MAGIC, CH_FORMAT_VERSION, sys.byteorder == "little",
+                            len(self.names), len(self.up_targets), len(self.down_targets),
+                            len(shortcuts), len(names))
+
+    with open(filename, "wb") as file:
+      file.write(header)
+      for section in sections:
+        data = section if isinstance(section, bytes) else section.tobytes()
+        file.write(data)
+        file.write(bytes(-len(data) % 8))
+
+  @classmethod
+  def load(cls, filename):
+    """Read a hierarchy written by save()"""
+    with open(filename, "rb") as file:
+      data = file.read()
+
+    if len(data) < CH_HEADER.size:
+      raise ValueError(f"Not a contraction hierarchy file: {filename}")
+    magic, version, little_endian, vertex_count, up_count, down_count, shortcut_count, \
+      name_bytes = CH_HEADER.unpack_from(data, 0)
+    if magic != CH_MAGIC:
+      raise ValueError(f"Not a contraction hierarchy file: {filename}")
+    if version != CH_FORMAT_VERSION:
+      raise ValueError(f"Unsupported contraction hierarchy version: {version}")
+    if bool(little_endian) != (sys.byteorder == "little"):
+      raise ValueError("Contraction hierarchy byte order does not match this machine")
+
+    # Read consecutive, 8 byte aligned sections
+    position = CH_HEADER.size
+    def section(typecode, count):
+      nonlocal position
+      size = count * struct.calcsize(typecode) if typecode else count
+      if position + size > len(data):
+        raise ValueError(f"Truncated contraction hierarchy file: {filename}")
+      chunk = data[position:position + size]
+      position += size + (-size % 8)
+      if not typecode:
+        return chunk
+      values = array(typecode)
+      values.frombytes(chunk)
+      return values
+
+    names = json.loads(section(None, name_bytes))
+    rank = section("i", vertex_count)
+    up = (section("q", vertex_count + 1), section("i", up_count), section("d", up_count))
+    down = (section("q", vertex_count + 1), section("i", down_count), section("d", down_count))
+    tails, heads, middles = (section("i", shortcut_count) for _ in range(3))
+    shortcut_via = {(u, w): via for u, w, via in zip(tails, heads, middles)}
+
+    return cls(names, rank, *up, *down, shortcut_via)
@@ -0,0 +1,471 @@
+"""
+Frozen CSR (Compressed Sparse Row) Graph
+
+Description: Read-only compaction of a DirectedWeightedGraph into flat arrays.
+             Vertex names are mapped to dense integer ids 0..V-1, and the
+             outgoing edges of vertex "i" are stored contiguously at
+             positions offsets[i] .. offsets[i + 1] - 1 of:
+
+             - targets: dense id of the edge's head vertex
+             - weights: edge weight
+
+             Every edge costs 12 bytes instead of a dict entry plus a float
+             object, and neighbour scans walk contiguous memory.
+
+Binary Snapshot: save_binary() writes the arrays to a versioned file that
+             load_binary() memory-maps, so loading is near instant and worker
+             processes mapping the same file share its pages. Layout (native
+             byte order, every section padded to 8 bytes):
+
+             - Header:  magic, version, byte order, V, E
+             - ids:     int64[V] vertex names (integer names only)
+             - x, y:    float64[V] coordinates
+             - offsets: int64[V + 1]
+             - targets: int32[E]
+             - weights: float64[E]
+
+Usage: python -m algorithms.csr_graph <graph.txt> <graph.bin>
+"""
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from algorithms.longest_path import longest_path
+from algorithms.pathfinding import DirectedWeightedGraph, IndexedPriorityQueue
+
+# CSR arrays & target ids installed once per distance matrix worker process
+_worker_state = None
+
+# Binary snapshot header: magic, version, little endian flag, V, E
+SNAPSHOT_MAGIC = b"DWGCSR\x00\x00"
+SNAPSHOT_VERSION = 1
+SNAPSHOT_HEADER = struct.Struct("<8sIIQQ")
+
+
+def _distances_to_targets(offsets, targets, weights, source, target_ids):
+  """Single-source Dijkstra that stops once every target is settled"""
+  vertex_count = len(offsets) - 1
+  distance = array("d", [float("inf")]) * vertex_count
+  settled = bytearray(vertex_count)
+  distance[source] = 0
+
+  # Targets still waiting to be settled (-1 marks an unknown target)
+  remaining = set(target_ids)
+  remaining.discard(-1)
+
+  priority_queue = IndexedPriorityQueue()
+  priority_queue.enqueue(source, 0)
+
+  while remaining and not priority_queue.is_empty():
+    u_distance, u = priority_queue.dequeue()
+    settled[u] = 1
+    remaining.discard(u)
+
+    for edge in range(offsets[u], offsets[u + 1]):
+      v = targets[edge]
+      if settled[v]:
+        continue
+      new_distance = u_distance + weights[edge]
+      if new_distance < distance[v]:
+        distance[v] = new_distance
+        priority_queue.enqueue(v, new_distance)
+
+  return array("d", [distance[t] if t != -1 else float("inf") for t in target_ids])
+
+
+def _init_matrix_worker(graph_source, target_ids):
+  """
+  Process pool initializer: receive the graph once per worker, either as
+  (offsets, targets, weights) arrays or as a snapshot filename to map
+  """
+  global _worker_state
+  if isinstance(graph_source, str):
+    graph = CSRGraph.load_binary(graph_source)
+    graph_source = (graph.offsets, graph.targets, graph.weights)
+  _worker_state = (*graph_source, target_ids)
+
+
+def _matrix_rows(source_ids):
+  """Process pool task: distance rows for a chunk of sources"""
+  offsets, targets, weights, target_ids = _worker_state
+  return [_distances_to_targets(offsets, targets, weights, source, target_ids)
+          for source in source_ids]
+
+
+class DistanceMatrix:
+  """
+  Distance Matrix Class: dense sources x targets distances
+  data:   Row-major array("d") of length rows * columns; entry (i, j) is
+          at i * columns + j
+  shape:  (rows, columns)
+  """
+  def __init__(self, data, rows, columns):
+    self.data = data
+    self.shape = (rows, columns)
+
+  def __len__(self):
+    return self.shape[0]
+
+  def __getitem__(self, index):
+    """Distance at (row, column)"""
+    row, column = index
+    rows, columns = self.shape
+    if not (0 <= row < rows and 0 <= column < columns):
+      raise IndexError(f"Index {index} out of range for shape {self.shape}")
+    return self.data[row * columns + column]
+
+  def row(self, row):
+    """Distances from one source as a zero-copy memoryview"""
+    columns = self.shape[1]
+    return memoryview(self.data)[row * columns:(row + 1) * columns]
+
+  def tolist(self):
+    """Nested lists, one per source"""
+    columns = self.shape[1]
+    return [self.data[i:i + columns].tolist() for i in range(0, len(self.data), columns)]
+
+  def to_numpy(self):
+    """(rows, columns) float64 NumPy view over the same buffer (needs NumPy)"""
+    import numpy as np
+    return np.frombuffer(self.data, dtype=np.float64).reshape(self.shape)
+
+
+class CSRGraph:
+  """
+  CSR Graph Class:
+  names:    Maps dense id to original vertex name
+  ids:      Maps original vertex name to dense id
+  x:        x coordinate per dense id
+  y:        y coordinate per dense id
+  offsets:  Start of each vertex's edge block (length V + 1)
+  targets:  Dense id of each edge's head vertex
+  weights:  Weight of each edge
+  """
+  def __init__(self, names, x, y, offsets, targets, weights):
+    self.names = names
+    self.x = x
+    self.y = y
+    self.offsets = offsets
+    self.targets = targets
+    self.weights = weights
+
+    # Name -> id table, built on first use so snapshot loads stay O(1)
+    self._ids = None
+
+    # Snapshot file & mapping when loaded by load_binary
+    self.snapshot_path = None
+    self._mapping = None
+
+  @property
+  def ids(self):
+    """Maps original vertex name to dense id"""
+    if self._ids is None:
+      self._ids = {name: index for index, name in enumerate(self.names)}
+    return self._ids
+
+  @classmethod
+  def from_graph(cls, graph):
+    """Compact a DirectedWeightedGraph into CSR arrays"""
+    names = list(graph.vertex_map)
+    ids = {name: index for index, name in enumerate(names)}
+
+    # Initialise contiguous arrays
+    x = array("d")
+    y = array("d")
+    offsets = array("q", [0])
+    targets = array("i")
+    weights = array("d")
+
+    # Append each vertex's edge block in dense id order
+    for name in names:
+      vertex = graph.vertex_map[name]
+      x.append(vertex.x)
+      y.append(vertex.y)
+
+      for v_name, weight in vertex.neighbour_links.items():
+        targets.append(ids[v_name])
+        weights.append(weight)
+
+      offsets.append(len(targets))
+
+    return cls(names, x, y, offsets, targets, weights)
+
+  @property
+  def vertex_count(self):
+    """Number of vertices"""
+    return len(self.names)
+
+  @property
+  def edge_count(self):
+    """Number of edges"""
+    return len(self.targets)
+
+  def memory_usage(self):
+    """Bytes held by the coordinate & edge arrays"""
+    return sum(len(values) * values.itemsize
+               for values in (self.x, self.y, self.offsets, self.targets, self.weights))
+
+  def neighbours(self, v_name):
+    """Yield (neighbour name, weight) for each outgoing edge of v_name"""
+    u = self.ids[v_name]
+    for edge in range(self.offsets[u], self.offsets[u + 1]):
+      yield self.names[self.targets[edge]], self.weights[edge]
+
+  def distance_matrix(self, sources, targets, workers=None):
+    """
+    Shortest distances from every source to every target
+
+    Runs one early-stopping single-source search per source. With more
+    than one worker, sources are chunked across a ProcessPoolExecutor and
+    each worker receives only the CSR arrays & target ids, once.
+    Returns a DistanceMatrix of shape (len(sources), len(targets)) over
+    one contiguous row-major array("d"); unreachable pairs and unknown
+    names are float("inf").
+    """
+    target_ids = [self.ids.get(name, -1) for name in targets]
+    source_ids = [self.ids[name] for name in sources if name in self.ids]
+
+    if workers is None:
+      workers = os.cpu_count() or 1
+    workers = min(workers, len(source_ids))
+
+    # Compute rows for known sources, serially or across the pool
+    if workers <= 1:
+      known_rows = [_distances_to_targets(self.offsets, self.targets, self.weights,
+                                          source, target_ids)
+                    for source in source_ids]
+    else:
+      chunk_size = max(1, -(-len(source_ids) // (workers * 4)))
+      chunks = [source_ids[i:i + chunk_size] for i in range(0, len(source_ids), chunk_size)]
+
+      # Mapped snapshots are shared by filename, otherwise ship the arrays
+      graph_source = self.snapshot_path or (self.offsets, self.targets, self.weights)
+      initargs = (graph_source, target_ids)
+
+      with ProcessPoolExecutor(workers, initializer=_init_matrix_worker, initargs=initargs) as pool:
+        known_rows = [row for rows in pool.map(_matrix_rows, chunks) for row in rows]
+
+    # Copy rows into one buffer; unknown sources keep their row of infinity
+    columns = len(targets)
+    data = array("d", [float("inf")]) * (len(sources) * columns)
+    known_iterator = iter(known_rows)
+    for row, name in enumerate(sources):
+      if name in self.ids:
+        data[row * columns:(row + 1) * columns] = next(known_iterator)
+    return DistanceMatrix(data, len(sources), columns)
+
+  # ================== Binary Snapshot ================== #
+  def save_binary(self, filename):
+    """Write the graph as a versioned binary snapshot"""
+    if not all(isinstance(name, int) for name in self.names):
+      raise TypeError("Binary snapshots require integer vertex names")
+
+    sections = [
+      array("q", self.names),
+      array("d", self.x),
+      array("d", self.y),
+      array("q", self.offsets),
+      array("i", self.targets),
+      array("d", self.weights),
+    ]
+    header = SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION,
+                                  sys.byteorder == "little", self.vertex_count, self.edge_count)
+
+    with open(filename, "wb") as file:
+      file.write(header)
+      for section in sections:
+        data = section.tobytes()
+        file.write(data)
+        file.write(bytes(-len(data) % 8))
+
+  @classmethod
+  def load_binary(cls, filename):
+    """Memory-map a snapshot written by save_binary: arrays are zero-copy views"""
+    with open(filename, "rb") as file:
+      mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    magic, version, little_endian, vertex_count, edge_count = \
+      SNAPSHOT_HEADER.unpack_from(mapping, 0)
+    if magic != SNAPSHOT_MAGIC:
+      raise ValueError(f"Not a graph snapshot: {filename}")
+    if version != SNAPSHOT_VERSION:
+      raise ValueError(f"Unsupported snapshot version: {version}")
+    if bool(little_endian) != (sys.byteorder == "little"):
+      raise ValueError("Snapshot byte order does not match this machine")
+
+    # Slice typed views over consecutive, 8 byte aligned sections
+    view = memoryview(mapping)
+    position = SNAPSHOT_HEADER.size
+    sections = []
+    for typecode, count in (("q", vertex_count), ("d", vertex_count), ("d", vertex_count),
+                            ("q", vertex_count + 1), ("i", edge_count), ("d", edge_count)):
+      size = count * struct.calcsize(typecode)
+      sections.append(view[position:position + size].cast(typecode))
+      position += size + (-size % 8)
+
+    graph = cls(*sections)
+    graph.snapshot_path = os.fspath(filename)
+    graph._mapping = mapping
+    return graph
+
+  def _rebuild_path(self, parent, goal):
+    """Follow parent ids back from goal & return original names"""
+    path = []
+    current = goal
+    while current != -1:
+      path.append(self.names[current])
+      current = parent[current]
+    path.reverse()
+    return path
+
+  # ============ Depth First Search Algorithm (DFS) ============ #
+  def depth_first_search(self, start_vertex, goal_vertex=None, node_budget=None, time_budget=None):
+    """Longest simple path from start to goal: returns (path, distance)"""
+    path, distance, _ = self.longest_path(start_vertex, goal_vertex, node_budget, time_budget)
+    return path, distance
+
+  def longest_path(self, start_vertex, goal_vertex, node_budget=None, time_budget=None):
+    """Longest simple path over dense ids: returns (path, distance, complete)"""
+    # Check start & goal vertices exist
+    if start_vertex not in self.ids or goal_vertex not in self.ids:
+      return None, float("-inf"), True
+
+    offsets = self.offsets
+    targets = self.targets
+    weights = self.weights
+
+    def successors(u):
+      return [(targets[edge], weights[edge]) for edge in range(offsets[u], offsets[u + 1])]
+
+    path, distance, complete = longest_path(successors, self.ids[start_vertex],
+                                            self.ids[goal_vertex], node_budget, time_budget)
+    if path is not None:
+      path = [self.names[v] for v in path]
+    return path, distance, complete
+
+  # ================== Dijkstra's Algorithm ================== #
+  def dijkstras_algorithm(self, start_vertex, goal_vertex):
+    """Shortest path from start to goal, stopping once goal is settled"""
+    # Check start & goal vertices exist
+    if start_vertex not in self.ids or goal_vertex not in self.ids:
+      return None, float("inf"), 0
+
+    start = self.ids[start_vertex]
+    goal = self.ids[goal_vertex]
+    offsets = self.offsets
+    targets = self.targets
+    weights = self.weights
+
+    # Initialise dense distance, parent & settled arrays
+    distance = array("d", [float("inf")]) * self.vertex_count
+    parent = array("i", [-1]) * self.vertex_count
+    settled = bytearray(self.vertex_count)
+    distance[start] = 0
+
+    priority_queue = IndexedPriorityQueue()
+    priority_queue.enqueue(start, 0)
+    expanded_nodes = 0
+
+    # Begin Main Loop: Always expand the closest unsettled vertex
+    while not priority_queue.is_empty():
+      u_distance, u = priority_queue.dequeue()
+      settled[u] = 1
+      expanded_nodes += 1
+
+      if u == goal:
+        break
+
+      # Relax the contiguous edge block of u
+      for edge in range(offsets[u], offsets[u + 1]):
+        v = targets[edge]
+        if settled[v]:
+          continue
+
+        new_distance = u_distance + weights[edge]
+        if new_distance < distance[v]:
+          distance[v] = new_distance
+          parent[v] = u
+          priority_queue.enqueue(v, new_distance)
+
+    # If goal not found, return
+    if not settled[goal]:
+      return None, float("inf"), expanded_nodes
+
+    return self._rebuild_path(parent, goal), distance[goal], expanded_nodes
+
+  # ==================== A* Algorithm ==================== #
+  def astar_algorithm(self, start_vertex, goal_vertex):
+    """Shortest path from start to goal guided by Euclidean distance"""
+    # Check start & goal vertices exist
+    if start_vertex not in self.ids or goal_vertex not in self.ids:
+      return None, float("inf"), 0
+
+    start = self.ids[start_vertex]
+    goal = self.ids[goal_vertex]
+    offsets = self.offsets
+    targets = self.targets
+    weights = self.weights
+    x = self.x
+    y = self.y
+    goal_x = x[goal]
+    goal_y = y[goal]
+
+    # Initialise dense distance, parent & visited arrays
+    distance = array("d", [float("inf")]) * self.vertex_count
+    parent = array("i", [-1]) * self.vertex_count
+    visited = bytearray(self.vertex_count)
+    distance[start] = 0
+
+    priority_queue = IndexedPriorityQueue()
+    priority_queue.enqueue(start, 0) # Start f(n) = 0
+    expanded_nodes = 0
+
+    # Begin Main Loop: Expand lowest f(n) vertex
+    while not priority_queue.is_empty():
+      fn, u = priority_queue.dequeue()
+      visited[u] = 1
+      expanded_nodes += 1
+
+      if u == goal:
+        break
+
+      for edge in range(offsets[u], offsets[u + 1]):
+        v = targets[edge]
+        if visited[v]:
+          continue
+
+        # 1) Calculate g(n), only improvements change the queue
+        gn = distance[u] + weights[edge]
+        if gn >= distance[v]:
+          continue
+
+        distance[v] = gn
+        parent[v] = u
+
+        # 2) Calculate h(n) & 3) enqueue f(n) = g(n) + h(n)
+        hn = ((goal_x - x[v]) ** 2 + (goal_y - y[v]) ** 2) ** 0.5
+        priority_queue.enqueue(v, gn + hn)
+
+    if not visited[goal]:
+      return None, float("inf"), 0
+
+    return self._rebuild_path(parent, goal), distance[goal], expanded_nodes
+
+
+def main():
+  """Convert a text graph file (read_graph format) into a binary snapshot"""
+  if len(sys.argv) != 3:
+    print("Usage: python -m algorithms.csr_graph <graph.txt> <graph.bin>")
+    return
+
+  graph = DirectedWeightedGraph.read_graph(sys.argv[1])[0]
+  graph.save_binary(sys.argv[2])
+  print(f"Vertices: {len(graph.vertex_map)}, Snapshot: {sys.argv[2]}")
+
+
+if __name__ == "__main__":
+  main()
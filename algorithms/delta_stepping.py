@@ -0,0 +1,184 @@
+"""
+Delta-Stepping Single-Source Shortest Paths
+
+Description: Whole-graph SSSP (Meyer & Sanders) for isochrone style queries.
+             Tentative distances are grouped into buckets of width delta.
+             The smallest non-empty bucket is emptied repeatedly, relaxing
+             only light edges (weight <= delta) since these can re-fill the
+             same bucket, then heavy edges of every vertex it settled are
+             relaxed once.
+
+             Relaxation requests for a bucket are independent, so they are
+             computed in parallel by worker processes reading a shared
+             memory copy of the CSR arrays & the current distances. The main
+             process applies the requests, keeping the tentative minimum.
+"""
+
+import os
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from multiprocessing.shared_memory import SharedMemory
+
+# Views over the shared CSR block, attached once per worker process
+_worker_state = None
+
+
+def _section_views(buffer, vertex_count, edge_count):
+  """Typed views (offsets, targets, weights, distance) over a shared block"""
+  views = []
+  position = 0
+  for typecode, itemsize, count in (("q", 8, vertex_count + 1), ("i", 4, edge_count),
+                                    ("d", 8, edge_count), ("d", 8, vertex_count)):
+    size = itemsize * count
+    views.append(buffer[position:position + size].cast(typecode))
+    position += size + (-size % 8)
+  return views
+
+
+def _block_size(vertex_count, edge_count):
+  """Bytes needed for the 8 byte aligned sections of a shared block"""
+  sizes = (8 * (vertex_count + 1), 4 * edge_count, 8 * edge_count, 8 * vertex_count)
+  return max(1, sum(size + (-size % 8) for size in sizes))
+
+
+def _relaxation_requests(offsets, targets, weights, distance, vertices, delta, light):
+  """(v, new distance, u) for light or heavy edges out of vertices that improve v"""
+  requests = []
+  for u in vertices:
+    u_distance = distance[u]
+    for edge in range(offsets[u], offsets[u + 1]):
+      weight = weights[edge]
+      if (weight <= delta) != light:
+        continue
+      v = targets[edge]
+      new_distance = u_distance + weight
+      if new_distance < distance[v]:
+        requests.append((v, new_distance, u))
+  return requests
+
+
+def _attach_worker(block_name, vertex_count, edge_count):
+  """Process pool initializer: map the shared CSR block"""
+  global _worker_state
+  # Workers share the creator's resource tracker, which already owns the block
+  if sys.version_info >= (3, 13):
+    block = SharedMemory(name=block_name, track=False)
+  else:
+    block = SharedMemory(name=block_name)
+
+  _worker_state = (block, _section_views(block.buf, vertex_count, edge_count))
+
+
+def _worker_requests(vertices, delta, light):
+  """Process pool task: relaxation requests for a chunk of a bucket"""
+  _, views = _worker_state
+  return _relaxation_requests(*views, vertices, delta, light)
+
+
+def delta_stepping(graph, source_vertex, delta=None, workers=None, parallel_threshold=512):
+  """
+  Shortest distances from source_vertex to every reachable vertex
+
+  graph:              DirectedWeightedGraph or CSRGraph
+  delta:              Bucket width, defaults to the mean edge weight
+  workers:            Processes for relaxations (default: CPU count, 1 = serial)
+  parallel_threshold: Buckets with fewer vertices are relaxed in-process
+
+  Returns (distance, parent) maps like DirectedWeightedGraph.shortest_path_tree.
+  Distances are identical to Dijkstra's; between equally short routes the
+  parent chosen may differ.
+  """
+  csr = graph if hasattr(graph, "offsets") else graph.to_csr()
+  if source_vertex not in csr.ids:
+    return {}, {}
+
+  vertex_count = csr.vertex_count
+  edge_count = csr.edge_count
+  if delta is None:
+    delta = sum(csr.weights) / edge_count if edge_count else 1.0
+  delta = max(delta, 1e-12)
+  if workers is None:
+    workers = os.cpu_count() or 1
+
+  # Copy CSR arrays into one shared block with the distance array
+  block = SharedMemory(create=True, size=_block_size(vertex_count, edge_count))
+  views = _section_views(block.buf, vertex_count, edge_count)
+  pool = None
+  try:
+    offsets, targets, weights, distance = views
+    offsets[:] = array("q", csr.offsets)
+    targets[:] = array("i", csr.targets)
+    weights[:] = array("d", csr.weights)
+    distance[:] = array("d", [float("inf")]) * vertex_count
+    parent = array("i", [-1]) * vertex_count
+
+    if workers > 1:
+      pool = ProcessPoolExecutor(workers, initializer=_attach_worker,
+                                 initargs=(block.name, vertex_count, edge_count))
+
+    # Bucket index -> set of vertices with tentative distance in that range
+    buckets = {}
+
+    def relax(v, new_distance, u):
+      """Move v to the bucket of its improved tentative distance"""
+      old_distance = distance[v]
+      if new_distance >= old_distance:
+        return
+      if old_distance != float("inf"):
+        old_bucket = buckets.get(int(old_distance // delta))
+        if old_bucket is not None:
+          old_bucket.discard(v)
+      buckets.setdefault(int(new_distance // delta), set()).add(v)
+      distance[v] = new_distance
+      parent[v] = u
+
+    def requests(vertices, light):
+      """Relaxation requests, split across workers for large buckets"""
+      vertices = list(vertices)
+      if pool is None or len(vertices) < parallel_threshold:
+        return _relaxation_requests(offsets, targets, weights, distance, vertices, delta, light)
+
+      chunk_size = -(-len(vertices) // workers)
+      chunks = [vertices[i:i + chunk_size] for i in range(0, len(vertices), chunk_size)]
+      results = pool.map(_worker_requests, chunks, repeat(delta), repeat(light))
+      return [request for chunk in results for request in chunk]
+
+    relax(csr.ids[source_vertex], 0.0, -1)
+
+    # Begin Main Loop: Empty the smallest non-empty bucket
+    while buckets:
+      index = min(buckets)
+      settled = []
+
+      # Light edges can re-fill the current bucket, so repeat until empty
+      while buckets.get(index):
+        frontier = buckets.pop(index)
+        settled.extend(frontier)
+        for v, new_distance, u in requests(frontier, light=True):
+          relax(v, new_distance, u)
+      buckets.pop(index, None)
+
+      # Heavy edges always land in later buckets: relax them once
+      for v, new_distance, u in requests(settled, light=False):
+        relax(v, new_distance, u)
+
+    # Translate dense ids back to vertex names
+    names = csr.names
+    result_distance = {}
+    result_parent = {}
+    for v in range(vertex_count):
+      if distance[v] != float("inf"):
+        result_distance[names[v]] = distance[v]
+        result_parent[names[v]] = names[parent[v]] if parent[v] != -1 else None
+
+    return result_distance, result_parent
+
+  finally:
+    if pool is not None:
+      pool.shutdown()
+    for view in views:
+      view.release()
+    block.close()
+    block.unlink()
@@ -0,0 +1,143 @@
+"""
+Dynamic Single-Source Shortest Paths
+
+Description: Keeps the shortest path tree of a registered source up to date
+             as DirectedWeightedGraph.add_edge inserts or re-weights edges,
+             repairing only the region the change affects (Ramalingam-Reps
+             style) instead of recomputing the whole tree.
+
+             1. Decrease:  A new edge u -> v, or a lower weight, that
+                           shortens the route to v seeds a Dijkstra from v
+                           which only visits vertices whose distance drops.
+             2. Increase:  A heavier tree edge u -> v invalidates v's subtree.
+                           Each subtree vertex is seeded with its best edge
+                           from outside the subtree, then a Dijkstra confined
+                           to the subtree settles the new distances.
+                           Subtree vertices left unseeded are unreachable.
+                           Heavier non-tree edges change nothing.
+"""
+
+from algorithms.pathfinding import IndexedPriorityQueue
+
+
+class DynamicShortestPathTree:
+  """
+  Dynamic Shortest Path Tree Class:
+  graph:          DirectedWeightedGraph the tree follows
+  source:         Name of the source vertex
+  distance:       Maps reachable vertex name to shortest distance
+  parent:         Maps reachable vertex name to its tree parent (None at source)
+  children:       Maps vertex name to the set of its tree children
+  last_touched:   Vertices settled by the last repair
+  """
+  def __init__(self, graph, source):
+    self.graph = graph
+    self.source = source
+    self.rebuild()
+
+  def rebuild(self):
+    """Recompute the whole tree, e.g. after a bulk edge load"""
+    self.distance, self.parent = self.graph.shortest_path_tree(self.source)
+    self.children = {}
+    for v_name, u_name in self.parent.items():
+      if u_name is not None:
+        self.children.setdefault(u_name, set()).add(v_name)
+    self.last_touched = len(self.distance)
+
+  def _set_parent(self, v_name, u_name):
+    """Move v under a new tree parent"""
+    old_parent = self.parent.get(v_name)
+    if old_parent is not None:
+      self.children[old_parent].discard(v_name)
+    self.parent[v_name] = u_name
+    if u_name is not None:
+      self.children.setdefault(u_name, set()).add(v_name)
+
+  def _propagate(self, priority_queue):
+    """Dijkstra from the queued vertices, visiting only those that improve"""
+    distance = self.distance
+    vertex_map = self.graph.vertex_map
+
+    while not priority_queue.is_empty():
+      u_distance, u_name = priority_queue.dequeue()
+      self.last_touched += 1
+
+      for v_name, weight in vertex_map[u_name].neighbour_links.items():
+        new_distance = u_distance + weight
+        if new_distance < distance.get(v_name, float("inf")):
+          distance[v_name] = new_distance
+          self._set_parent(v_name, u_name)
+          priority_queue.enqueue(v_name, new_distance)
+
+  def edge_updated(self, u_name, v_name, old_weight, new_weight):
+    """
+    Repair the tree after edge u -> v changed from old_weight (None for a
+    new edge) to new_weight. The graph must already hold the new weight.
+    """
+    self.last_touched = 0
+    if u_name not in self.distance:
+      return
+
+    # Decrease: only a shorter route to v can change anything
+    if old_weight is None or new_weight < old_weight:
+      new_distance = self.distance[u_name] + new_weight
+      if new_distance < self.distance.get(v_name, float("inf")):
+        self.distance[v_name] = new_distance
+        self._set_parent(v_name, u_name)
+        priority_queue = IndexedPriorityQueue()
+        priority_queue.enqueue(v_name, new_distance)
+        self._propagate(priority_queue)
+      return
+
+    # Increase: only v's subtree can lengthen, and only via a tree edge
+    if new_weight == old_weight or self.parent.get(v_name) != u_name:
+      return
+
+    affected = [v_name]
+    for x_name in affected:
+      affected.extend(self.children.get(x_name, ()))
+    affected_set = set(affected)
+
+    # Detach the subtree: its vertices are unreachable until re-seeded
+    for x_name in affected:
+      self._set_parent(x_name, None)
+      del self.parent[x_name]
+      del self.distance[x_name]
+
+    # Seed each vertex with its best edge from outside the subtree
+    vertex_map = self.graph.vertex_map
+    priority_queue = IndexedPriorityQueue()
+    for x_name in affected:
+      best_distance = float("inf")
+      best_parent = None
+      for y_name, weight in vertex_map[x_name].reverse_links.items():
+        if y_name in affected_set or y_name not in self.distance:
+          continue
+        candidate = self.distance[y_name] + weight
+        if candidate < best_distance:
+          best_distance = candidate
+          best_parent = y_name
+
+      if best_parent is not None:
+        self.distance[x_name] = best_distance
+        self._set_parent(x_name, best_parent)
+        priority_queue.enqueue(x_name, best_distance)
+
+    self._propagate(priority_queue)
+
+  def shortest_path(self, goal_vertex):
+    """Stored shortest path to goal_vertex: returns (path, distance)"""
+    # If goal not reached, return
+    if goal_vertex not in self.distance:
+      return None, float("inf")
+
+    path = []
+    current = goal_vertex
+
+    # Rebuild path to source
+    while current is not None:
+      path.append(current)
+      current = self.parent[current]
+    path.reverse()
+
+    return path, self.distance[goal_vertex]
@@ -0,0 +1,139 @@
+"""
+ALT Heuristic (A*, Landmarks, Triangle inequality)
+
+Description: Preprocessing step that picks k landmark vertices and stores the
+             shortest distance from every landmark to every vertex, and from
+             every vertex to every landmark. For any landmark L the triangle
+             inequality gives two lower bounds on dist(v, t):
+
+             - dist(L, t) - dist(L, v)
+             - dist(v, L) - dist(t, L)
+
+             The heuristic is the largest bound over all landmarks. It is
+             admissible & consistent for any non-negative edge weights, so it
+             stays correct when weights are travel times rather than distances.
+"""
+
+import random
+from array import array
+
+INFINITY = float("inf")
+
+
+class LandmarkIndex:
+  """
+  Landmark Index Class:
+  names:          Maps dense id to original vertex name
+  ids:            Maps original vertex name to dense id
+  landmarks:      Names of the chosen landmark vertices
+  from_landmark:  dist(L_i, v) stored at [i * V + v]
+  to_landmark:    dist(v, L_i) stored at [i * V + v]
+  """
+  def __init__(self, names, landmarks, from_landmark, to_landmark):
+    self.names = names
+    self.ids = {name: index for index, name in enumerate(names)}
+    self.landmarks = landmarks
+    self.from_landmark = from_landmark
+    self.to_landmark = to_landmark
+
+    # Goal rows are reused across the many heuristic calls of one query
+    self._goal = None
+    self._goal_rows = None
+
+  @classmethod
+  def build(cls, graph, k=8, seed=0):
+    """
+    Pick k landmarks by farthest selection & compute their distance rows
+
+    The first landmark is the vertex farthest from a seeded random vertex.
+    Each further landmark is the vertex farthest from its closest chosen
+    landmark, which spreads landmarks towards the edges of the graph.
+    """
+    names = list(graph.vertex_map)
+    ids = {name: index for index, name in enumerate(names)}
+    vertex_count = len(names)
+    k = min(k, vertex_count)
+
+    from_landmark = array("d")
+    to_landmark = array("d")
+    landmarks = []
+
+    # Closest landmark distance seen so far for each vertex
+    nearest = [INFINITY] * vertex_count
+    chosen = set()
+
+    candidate = None
+    if k > 0:
+      seed_vertex = random.Random(seed).choice(names)
+      seed_distance, _ = graph.shortest_path_tree(seed_vertex)
+      candidate = max(seed_distance, key=seed_distance.get)
+
+    while candidate is not None and len(landmarks) < k:
+      landmarks.append(candidate)
+      chosen.add(candidate)
+      forward, _ = graph.shortest_path_tree(candidate)
+      backward, _ = graph.shortest_path_tree(candidate, reverse=True)
+
+      # Append dense rows for this landmark
+      from_row = array("d", [INFINITY]) * vertex_count
+      to_row = array("d", [INFINITY]) * vertex_count
+      for v_name, distance in forward.items():
+        from_row[ids[v_name]] = distance
+      for v_name, distance in backward.items():
+        to_row[ids[v_name]] = distance
+      from_landmark.extend(from_row)
+      to_landmark.extend(to_row)
+
+      # Next candidate: a vertex no landmark reaches, else the farthest one
+      candidate = None
+      best_distance = -1
+      for v in range(vertex_count):
+        nearest[v] = min(nearest[v], from_row[v], to_row[v])
+      for v in range(vertex_count):
+        if names[v] in chosen:
+          continue
+        if nearest[v] == INFINITY:
+          candidate = names[v]
+          break
+        if nearest[v] > best_distance:
+          best_distance = nearest[v]
+          candidate = names[v]
+
+    return cls(names, landmarks, from_landmark, to_landmark)
+
+  def _rows(self, goal_vertex):
+    """Per-landmark (dist(L, t), dist(t, L)) for the current goal"""
+    if goal_vertex != self._goal:
+      vertex_count = len(self.names)
+      t = self.ids[goal_vertex]
+      self._goal_rows = [
+        (index * vertex_count,
+         self.from_landmark[index * vertex_count + t],
+         self.to_landmark[index * vertex_count + t])
+        for index in range(len(self.landmarks))
+      ]
+      self._goal = goal_vertex
+    return self._goal_rows
+
+  def heuristic(self, v_name, goal_vertex):
+    """Lower bound on dist(v, goal) from the triangle inequality"""
+    v = self.ids[v_name]
+    from_landmark = self.from_landmark
+    to_landmark = self.to_landmark
+    best = 0.0
+
+    for base, landmark_to_goal, goal_to_landmark in self._rows(goal_vertex):
+      landmark_to_v = from_landmark[base + v]
+      v_to_landmark = to_landmark[base + v]
+
+      # Skip bounds with an unreachable term: they carry no information
+      if landmark_to_goal != INFINITY and landmark_to_v != INFINITY:
+        bound = landmark_to_goal - landmark_to_v
+        if bound > best:
+          best = bound
+      if v_to_landmark != INFINITY and goal_to_landmark != INFINITY:
+        bound = v_to_landmark - goal_to_landmark
+        if bound > best:
+          best = bound
+
+    return best
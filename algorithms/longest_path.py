@@ -0,0 +1,198 @@
+"""
+Longest Simple Path Engine
+
+Description: Finds the longest simple path from a start to a goal vertex for
+             any graph exposed through a successors(u) -> (v, weight) callable.
+
+             1. Reduce:  Keep only vertices reachable from the start that can
+                         still reach the goal. Paths end at the goal, so the
+                         goal's outgoing edges are dropped.
+             2. DAG:     If the reduced graph is acyclic (Kahn's algorithm),
+                         answer with a linear time DP in topological order.
+             3. Cyclic:  Otherwise run an iterative branch & bound search
+                         with an explicit stack. A path is extended only if
+                         its distance plus an upper bound on what the unused
+                         vertices could still add beats the best path found.
+                         Optional node & time budgets stop the search early
+                         with the best path found so far.
+"""
+
+import time
+
+# Branch & bound checks the clock once per this many expansions
+TIME_CHECK_INTERVAL = 1024
+
+
+def longest_path(successors, start, goal, node_budget=None, time_budget=None, query=None):
+  """
+  Longest simple path: returns (path, distance, complete)
+
+  complete is False when a node or time budget (seconds) cut the search
+  short; path & distance are then the best found so far. query is an
+  optional search_stats.QueryStats timing the reduce, topological &
+  search phases & counting branch & bound expansions.
+  """
+  if query is not None:
+    query.phase("reduce")
+
+  # Step 1: Reachable subgraph, keeping edge order for deterministic results
+  adjacency = {start: None}
+  stack = [start]
+  while stack:
+    u = stack.pop()
+    edges = list(successors(u))
+    adjacency[u] = edges
+    for v, _ in edges:
+      if v not in adjacency:
+        adjacency[v] = None
+        stack.append(v)
+
+  if goal not in adjacency:
+    return None, float("-inf"), True
+
+  # Vertices that can still reach the goal, found over reversed edges
+  reverse = {u: [] for u in adjacency}
+  for u, edges in adjacency.items():
+    if u == goal:
+      continue
+    for v, _ in edges:
+      reverse[v].append(u)
+
+  useful = {goal}
+  stack = [goal]
+  while stack:
+    v = stack.pop()
+    for u in reverse[v]:
+      if u not in useful:
+        useful.add(u)
+        stack.append(u)
+
+  relevant = {u: [(v, weight) for v, weight in adjacency[u] if v in useful]
+              for u in useful}
+  relevant[goal] = []
+
+  # Step 2: Topological order of the reduced graph (Kahn's algorithm)
+  if query is not None:
+    query.phase("topological")
+
+  in_degree = dict.fromkeys(relevant, 0)
+  for edges in relevant.values():
+    for v, _ in edges:
+      in_degree[v] += 1
+
+  order = [u for u, degree in in_degree.items() if degree == 0]
+  for u in order:
+    for v, _ in relevant[u]:
+      in_degree[v] -= 1
+      if in_degree[v] == 0:
+        order.append(v)
+
+  if query is not None:
+    query.phase("search")
+
+  if len(order) == len(relevant):
+    return _dag_longest_path(relevant, order, start, goal) + (True,)
+
+  return _branch_and_bound(relevant, start, goal, node_budget, time_budget, query)
+
+
+def _dag_longest_path(relevant, order, start, goal):
+  """Longest path DP over a topological order: O(V + E)"""
+  best = {start: 0}
+  parent = {start: None}
+
+  for u in order:
+    if u not in best:
+      continue
+    for v, weight in relevant[u]:
+      candidate = best[u] + weight
+      if v not in best or candidate > best[v]:
+        best[v] = candidate
+        parent[v] = u
+
+  path = []
+  current = goal
+  while current is not None:
+    path.append(current)
+    current = parent[current]
+  path.reverse()
+
+  return path, best[goal]
+
+
+def _branch_and_bound(relevant, start, goal, node_budget, time_budget, query=None):
+  """Iterative exhaustive search with upper bound pruning"""
+  # Heaviest edges first so a long incumbent is found early
+  ordered = {u: sorted(edges, key=lambda edge: edge[1], reverse=True)
+             for u, edges in relevant.items()}
+
+  # Entering v adds at most its heaviest positive incoming edge
+  max_in = dict.fromkeys(relevant, 0.0)
+  for edges in relevant.values():
+    for v, weight in edges:
+      if weight > max_in[v]:
+        max_in[v] = weight
+
+  # Upper bound on what all vertices off the current path could still add
+  remaining = sum(max_in.values()) - max_in[start]
+
+  longest_path = None
+  longest_distance = float("-inf")
+  complete = True
+  expanded_nodes = 0
+  deadline = time.perf_counter() + time_budget if time_budget is not None else None
+
+  # Explicit stack of [vertex, next edge index, path distance]
+  on_path = {start}
+  current_path = [start]
+  stack = [[start, 0, 0]]
+
+  while stack:
+    frame = stack[-1]
+    u, index, path_distance = frame
+    edges = ordered[u]
+
+    # Goal reached or edges exhausted: record & backtrack
+    if u == goal or index == len(edges):
+      if u == goal and path_distance > longest_distance:
+        longest_distance = path_distance
+        longest_path = current_path.copy()
+      stack.pop()
+      current_path.pop()
+      on_path.discard(u)
+      if u != start:
+        remaining += max_in[u]
+      continue
+
+    frame[1] = index + 1
+    v, weight = edges[index]
+    if v in on_path:
+      continue
+
+    # Prune branches that cannot beat the best path, with float slack
+    bound = path_distance + weight + remaining - max_in[v]
+    if bound + 1e-9 * (1 + abs(bound)) <= longest_distance:
+      continue
+
+    # Respect node & time budgets
+    expanded_nodes += 1
+    if node_budget is not None and expanded_nodes > node_budget:
+      complete = False
+      break
+    if deadline is not None and expanded_nodes % TIME_CHECK_INTERVAL == 0 \
+    and time.perf_counter() > deadline:
+      complete = False
+      break
+
+    if query is not None:
+      query.expand(v, path_distance + weight, len(stack), len(ordered[v]))
+
+    on_path.add(v)
+    current_path.append(v)
+    remaining -= max_in[v]
+    stack.append([v, 0, path_distance + weight])
+
+  if longest_path is None:
+    return None, float("-inf"), complete
+
+  return longest_path, longest_distance, complete
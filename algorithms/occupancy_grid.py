@@ -0,0 +1,287 @@
+"""
+Occupancy Grid & Jump Point Search
+
+Description: Implicit 8-connected grid graph over a bitmap of blocked cells,
+             one bit per cell, instead of a Vertex & neighbour dict per cell.
+             Straight steps cost 1 & diagonal steps sqrt(2). A diagonal step
+             needs both cells it passes between to be free (no corner
+             cutting). Cells are addressed as (x, y).
+
+             The bitmap is padded with a border of blocked cells, so a cell's
+             neighbours are at fixed index offsets with no bounds checks.
+
+Jump Point Search (Harabor & Grastien), no corner cutting variant: instead
+             of queueing every neighbour, A* scans straight & diagonal runs
+             and only queues the "jump points" where a run meets a forced
+             neighbour (a cell an obstacle makes unreachable any other
+             equally short way) or the goal. Every path between jump points
+             is a straight or diagonal run, so paths cost the same as A* over
+             the explicit graph while open areas expand only a few points.
+"""
+
+from algorithms.pathfinding import IndexedPriorityQueue
+
+SQRT2 = 2 ** 0.5
+
+
+class OccupancyGrid:
+  """
+  Occupancy Grid Class:
+  width, height:  Grid size in cells
+  stride:         Row length of the padded bitmap (width + 2)
+  bits:           Padded bitmap, bit i set when padded cell i is blocked
+  """
+  def __init__(self, width, height):
+    self.width = width
+    self.height = height
+    self.stride = width + 2
+    self.bits = bytearray((self.stride * (height + 2) + 7) >> 3)
+
+    # Block the border: top & bottom padding rows, then both padding columns
+    for x in range(-1, width + 1):
+      self.block(x, -1)
+      self.block(x, height)
+    for y in range(height):
+      self.block(-1, y)
+      self.block(width, y)
+
+  @classmethod
+  def from_strings(cls, rows, blocked="#"):
+    """Grid from equal length strings, one per row: blocked characters are walls"""
+    grid = cls(len(rows[0]) if rows else 0, len(rows))
+    for y, row in enumerate(rows):
+      for x, cell in enumerate(row):
+        if cell in blocked:
+          grid.block(x, y)
+    return grid
+
+  @classmethod
+  def from_graph(cls, graph):
+    """
+    Grid of a DirectedWeightedGraph laid out on cells: each vertex marks
+    cell (x, y) free, every other cell is blocked. Coordinates must be
+    non-negative integers; edges are implied by the grid, not read.
+    """
+    cells = []
+    for vertex in graph.vertex_map.values():
+      if vertex.x != int(vertex.x) or vertex.y != int(vertex.y) or vertex.x < 0 or vertex.y < 0:
+        raise ValueError(f"Vertex {vertex.name!r} is not on a grid cell: ({vertex.x}, {vertex.y})")
+      cells.append((int(vertex.x), int(vertex.y)))
+
+    width = max((x for x, _ in cells), default=-1) + 1
+    height = max((y for _, y in cells), default=-1) + 1
+    grid = cls(width, height)
+    grid.bits[:] = b"\xff" * len(grid.bits)
+    for x, y in cells:
+      grid.unblock(x, y)
+    return grid
+
+  def _index(self, x, y):
+    """Padded bitmap index of cell (x, y)"""
+    return (y + 1) * self.stride + x + 1
+
+  def _cell(self, index):
+    """Cell (x, y) of a padded bitmap index"""
+    y, x = divmod(index, self.stride)
+    return x - 1, y - 1
+
+  def block(self, x, y):
+    """Mark cell (x, y) as a wall"""
+    index = self._index(x, y)
+    self.bits[index >> 3] |= 1 << (index & 7)
+
+  def unblock(self, x, y):
+    """Mark cell (x, y) as free"""
+    index = self._index(x, y)
+    self.bits[index >> 3] &= ~(1 << (index & 7)) & 0xff
+
+  def is_free(self, x, y):
+    """Check cell (x, y) is inside the grid & not blocked"""
+    if not (0 <= x < self.width and 0 <= y < self.height):
+      return False
+    index = self._index(x, y)
+    return not self.bits[index >> 3] >> (index & 7) & 1
+
+  def neighbours(self, x, y):
+    """Yield ((x, y), cost) for each legal move out of a free cell"""
+    for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+      if self.is_free(x + dx, y + dy):
+        yield (x + dx, y + dy), 1.0
+    for dx, dy in ((1, 1), (1, -1), (-1, 1), (-1, -1)):
+      if self.is_free(x + dx, y + dy) and self.is_free(x + dx, y) and self.is_free(x, y + dy):
+        yield (x + dx, y + dy), SQRT2
+
+  def to_graph(self):
+    """Explicit DirectedWeightedGraph of the grid: vertex y * width + x at (x, y)"""
+    from algorithms.pathfinding import DirectedWeightedGraph
+    graph = DirectedWeightedGraph()
+    for y in range(self.height):
+      for x in range(self.width):
+        if self.is_free(x, y):
+          graph.add_vertex(y * self.width + x, x, y)
+    for y in range(self.height):
+      for x in range(self.width):
+        if self.is_free(x, y):
+          for (nx, ny), cost in self.neighbours(x, y):
+            graph.add_edge(y * self.width + x, ny * self.width + nx, cost)
+    return graph
+
+  def memory_usage(self):
+    """Bytes held by the bitmap"""
+    return len(self.bits)
+
+  # ================== Jump Point Search ================== #
+  def jump_point_search(self, start_cell, goal_cell):
+    """
+    Shortest path between cells: returns (path, distance, expanded_nodes)
+    like DirectedWeightedGraph.astar_algorithm, with path a list of every
+    (x, y) cell on the route. expanded_nodes counts jump points expanded.
+    """
+    # Check start & goal cells are free
+    if not self.is_free(*start_cell) or not self.is_free(*goal_cell):
+      return None, float("inf"), 0
+
+    bits = self.bits
+    stride = self.stride
+    start = self._index(*start_cell)
+    goal = self._index(*goal_cell)
+    goal_y, goal_x = divmod(goal, stride)
+
+    def blocked(index):
+      return bits[index >> 3] >> (index & 7) & 1
+
+    def jump_straight(index, step, side):
+      """Scan a straight run: first jump point, or None at a wall"""
+      # Hot loop: bit tests inlined rather than calling blocked()
+      while True:
+        index += step
+        if bits[index >> 3] >> (index & 7) & 1:
+          return None
+        if index == goal:
+          return index
+        # Forced: a side cell the cell behind cannot reach diagonally
+        a, b = index + side, index - step + side
+        if not bits[a >> 3] >> (a & 7) & 1 and bits[b >> 3] >> (b & 7) & 1:
+          return index
+        a, b = index - side, index - step - side
+        if not bits[a >> 3] >> (a & 7) & 1 and bits[b >> 3] >> (b & 7) & 1:
+          return index
+
+    def jump_diagonal(index, dx, dy):
+      """Scan a diagonal run: stop where either straight run finds a jump point"""
+      step = dx + dy
+      while True:
+        index += step
+        if blocked(index):
+          return None
+        if index == goal:
+          return index
+        if jump_straight(index, dx, stride) is not None \
+        or jump_straight(index, dy, 1) is not None:
+          return index
+        # No corner cutting: both cells beside the next step must be free
+        if blocked(index + dx) or blocked(index + dy):
+          return None
+
+    def successors(index, dx, dy):
+      """(dx, dy) steps worth scanning from a jump point reached moving (dx, dy)"""
+      if dx == 0 and dy == 0:
+        # Start: every legal move
+        moves = [(step, 0) for step in (1, -1) if not blocked(index + step)]
+        moves += [(0, step) for step in (stride, -stride) if not blocked(index + step)]
+        for h in (1, -1):
+          for v in (stride, -stride):
+            if not blocked(index + h) and not blocked(index + v):
+              moves.append((h, v))
+        return moves
+
+      if dx != 0 and dy != 0:
+        # Diagonal: keep going, or turn onto either straight run
+        moves = []
+        if not blocked(index + dx):
+          moves.append((dx, 0))
+        if not blocked(index + dy):
+          moves.append((0, dy))
+        if len(moves) == 2:
+          moves.append((dx, dy))
+        return moves
+
+      # Straight: keep going, plus forced turns past an obstacle corner
+      step, side = (dx, stride) if dx != 0 else (dy, 1)
+      moves = []
+      ahead = not blocked(index + step)
+      if ahead:
+        moves.append((dx, dy))
+      for turn in (side, -side):
+        if not blocked(index + turn) and blocked(index - step + turn):
+          moves.append((0, turn) if dx != 0 else (turn, 0))
+          if ahead:
+            moves.append((dx, turn) if dx != 0 else (turn, dy))
+      return moves
+
+    def octile(index):
+      y, x = divmod(index, stride)
+      dx = abs(x - goal_x)
+      dy = abs(y - goal_y)
+      return abs(dx - dy) + SQRT2 * min(dx, dy)
+
+    # Initialise parent, direction & distance tracking
+    distance = {start: 0.0}
+    parent = {start: None}
+    direction = {start: (0, 0)}
+    closed = set()
+    priority_queue = IndexedPriorityQueue()
+    priority_queue.enqueue(start, octile(start))
+    expanded_nodes = 0
+
+    # Begin Main Loop: Expand the jump point with the lowest f(n)
+    while not priority_queue.is_empty():
+      _, u = priority_queue.dequeue()
+      closed.add(u)
+      expanded_nodes += 1
+      if u == goal:
+        break
+
+      for h, v in successors(u, *direction[u]):
+        if h != 0 and v != 0:
+          jump = jump_diagonal(u, h, v)
+        elif h != 0:
+          jump = jump_straight(u, h, stride)
+        else:
+          jump = jump_straight(u, v, 1)
+        if jump is None or jump in closed:
+          continue
+
+        # Runs are straight or diagonal, so their cost is the octile length
+        u_y, u_x = divmod(u, stride)
+        j_y, j_x = divmod(jump, stride)
+        run_x = abs(j_x - u_x)
+        run_y = abs(j_y - u_y)
+        gn = distance[u] + abs(run_x - run_y) + SQRT2 * min(run_x, run_y)
+
+        if jump not in distance or gn < distance[jump]:
+          distance[jump] = gn
+          parent[jump] = u
+          direction[jump] = (h, v)
+          priority_queue.enqueue(jump, gn + octile(jump))
+
+    if goal not in closed:
+      return None, float("inf"), expanded_nodes
+
+    # Rebuild the jump points, then fill in the cells of each run
+    jump_points = []
+    current = goal
+    while current is not None:
+      jump_points.append(current)
+      current = parent[current]
+    jump_points.reverse()
+
+    path = [self._cell(start)]
+    for u, v in zip(jump_points, jump_points[1:]):
+      (u_x, u_y), (v_x, v_y) = self._cell(u), self._cell(v)
+      step_x = (v_x > u_x) - (v_x < u_x)
+      step_y = (v_y > u_y) - (v_y < u_y)
+      for k in range(1, max(abs(v_x - u_x), abs(v_y - u_y)) + 1):
+        path.append((u_x + k * step_x, u_y + k * step_y))
+
+    return path, distance[goal], expanded_nodes
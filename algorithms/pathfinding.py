@@ -4,17 +4,29 @@
 3. Depth First Search
 """
 
+import gzip
+import time
+from collections import OrderedDict
+
+# Rows converted per bulk batch by read_graph
+READ_BATCH_ROWS = 1 << 16
+
 class Vertex:
   """
   Vertex Class:
   name:             Name of the Vertex
   neighbour_links:  Maps neighbours name to weight
+  reverse_links:    Maps name of vertices with an edge into this one to weight
   x:                x coordinate
   y:                y coordinate
   """
+  # Fixed attributes: no per-instance __dict__
+  __slots__ = ("name", "neighbour_links", "reverse_links", "x", "y")
+
   def __init__(self, name, x=0, y=0):
     self.name = name
     self.neighbour_links = {}
+    self.reverse_links = {}
     self.x = x
     self.y = y
 
@@ -63,43 +75,170 @@ class PriorityQueue:
 
   def siftUp(self, index):
     """Sift nodes up the heap"""
-    if index == 0:
-      return
+    # Hold the moving node & shift larger parents down until its slot is found
+    node = self.heap[index]
 
-    # Initialise parent node
-    parent = (index - 1) // 2
+    while index > 0:
+      # Initialise parent node
+      parent = (index - 1) // 2
 
-    # If current node is more than parent then return, otherwise swap
-    if self.heap[index] > self.heap[parent]:
-      return
-    else:
-      self.heap[index], self.heap[parent] = self.heap[parent], self.heap[index]
+      # If current node is more than parent then stop, otherwise shift parent down
+      if node > self.heap[parent]:
+        break
+      self.heap[index] = self.heap[parent]
+      index = parent
 
-      # Recursively sift up
-      self.siftUp(parent)
+    self.heap[index] = node
 
   def siftDown(self, index):
     """Sift nodes down the heap"""
+    # Hold the moving node & shift smaller children up until its slot is found
+    node = self.heap[index]
+
+    while True:
+      # Initialise smallest, left & right children
+      left_child = (index * 2) + 1
+      right_child = left_child + 1
+      smallest_node = index
+      smallest_value = node
+
+      # If left child exists and smaller than current node
+      if left_child < self.size and self.heap[left_child] < smallest_value:
+        # Assign smallest node to left child
+        smallest_node = left_child
+        smallest_value = self.heap[left_child]
+
+      # If right child exists and smaller than current node & left child
+      if right_child < self.size and self.heap[right_child] < smallest_value:
+        # Assign smallest node to right child
+        smallest_node = right_child
+        smallest_value = self.heap[right_child]
+
+      # If index remains smallest node, the slot has been found
+      if smallest_node == index:
+        break
+      self.heap[index] = smallest_value
+      index = smallest_node
+
+    self.heap[index] = node
+
+
+class IndexedPriorityQueue:
+  """
+  Indexed Priority Queue: Addressable Min Heap
+
+  Holds (priority, item) entries with at most one entry per item. A
+  position map from item to heap index makes contains O(1) and lets
+  decrease_key move an existing entry in O(log n), so searches never
+  queue duplicate or stale entries and the heap stays at O(V).
+  """
+  def __init__(self):
+    # Initialise heap & item -> heap index map
+    self.heap = []
+    self.position = {}
+    self.size = 0
+
+  def is_empty(self):
+    """Check if heap is empty"""
+    return self.size == 0
+
+  def contains(self, item):
+    """Check if item is queued"""
+    return item in self.position
+
+  def peek(self):
+    """Return (priority, item) with lowest priority without removing it"""
+    if self.is_empty():
+      return None
+    return self.heap[0]
+
+  def enqueue(self, item, priority):
+    """Add item to heap, or lower its priority if already queued"""
+    if item in self.position:
+      self.decrease_key(item, priority)
+      return
+
+    self.heap.append((priority, item))
+    self.position[item] = self.size
+    self.size += 1
+    self.siftUp(self.size - 1)
+
+  def dequeue(self):
+    """Remove & return (priority, item) with lowest priority"""
+    # Check for empty heap
+    if self.is_empty():
+      return None
+
+    # Remove root, move last entry to the root & sift it down
+    root = self.heap[0]
+    last = self.heap.pop()
+    self.size -= 1
+    del self.position[root[1]]
+
+    if self.size > 0:
+      self.heap[0] = last
+      self.position[last[1]] = 0
+      self.siftDown(0)
+
+    return root
+
+  def decrease_key(self, item, priority):
+    """Lower the priority of a queued item, ignoring non-improvements"""
+    index = self.position[item]
+    if priority >= self.heap[index][0]:
+      return
+
+    self.heap[index] = (priority, item)
+    self.siftUp(index)
 
-    # Initialise smallest, left & right children
-    left_child = (index * 2) + 1
-    right_child = (index * 2) + 2
-    smallest_node = index
+  def siftUp(self, index):
+    """Sift entry up the heap, keeping the position map in sync"""
+    heap = self.heap
+    position = self.position
+    entry = heap[index]
+    priority = entry[0]
+
+    while index > 0:
+      parent = (index - 1) // 2
+      parent_entry = heap[parent]
+
+      # Only compare priorities so items never need to be orderable
+      if priority >= parent_entry[0]:
+        break
+      heap[index] = parent_entry
+      position[parent_entry[1]] = index
+      index = parent
+
+    heap[index] = entry
+    position[entry[1]] = index
 
-    # If left child exists and smaller than current node
-    if left_child < self.size and self.heap[left_child] < self.heap[smallest_node]:
-      # Assign smallest node to left child
-      smallest_node = left_child
+  def siftDown(self, index):
+    """Sift entry down the heap, keeping the position map in sync"""
+    heap = self.heap
+    position = self.position
+    size = self.size
+    entry = heap[index]
+    priority = entry[0]
+
+    while True:
+      child = (index * 2) + 1
+      if child >= size:
+        break
 
-    # If right child exists and smaller than current node & left child
-    if right_child < self.size and self.heap[right_child] < self.heap[smallest_node]:
-      # Assign smallest node to right child
-      smallest_node = right_child
+      # Pick the smaller of the two children
+      right_child = child + 1
+      if right_child < size and heap[right_child][0] < heap[child][0]:
+        child = right_child
 
-    # If index remains smallest node
-    if smallest_node!= index:
-      self.heap[index], self.heap[smallest_node] = self.heap[smallest_node], self.heap[index]
-      self.siftDown(smallest_node)
+      child_entry = heap[child]
+      if child_entry[0] >= priority:
+        break
+      heap[index] = child_entry
+      position[child_entry[1]] = index
+      index = child
+
+    heap[index] = entry
+    position[entry[1]] = index
 
 
 class DirectedWeightedGraph:
@@ -108,6 +247,21 @@ class DirectedWeightedGraph:
     # Initialise vertex map
     self.vertex_map = {}
 
+    # Shortest path tree cache: disabled until enable_path_cache()
+    self.path_cache = None
+    self.path_cache_capacity = 0
+    self.cache_hits = 0
+    self.cache_misses = 0
+
+    # Dynamic shortest path trees of registered sources, repaired by add_edge
+    self.dynamic_trees = None
+
+    # Throughput of the read_graph call that built this graph
+    self.load_stats = None
+
+    # k-d tree over vertex coordinates: built on first nearest_vertex call
+    self.spatial_index = None
+
   def add_vertex(self, v_name, x, y):
     """Add Vertices to Graph"""
 
@@ -120,8 +274,13 @@ class DirectedWeightedGraph:
       vertex = Vertex(v_name, x, y)
 
       # Add vertex object to vertex map
+      # Cached trees stay valid: a vertex without edges changes no distances,
+      # and queries to it miss the cached distance map, meaning "no path"
       self.vertex_map[v_name] = vertex
 
+      if self.spatial_index is not None:
+        self.spatial_index.insert(v_name, x, y)
+
   def add_edge(self, u_name, v_name, weight):
     """Add Edges to Graph"""
 
@@ -131,116 +290,383 @@ class DirectedWeightedGraph:
       return
 
     else:
-      # Create u objects in vertex map
+      # Create u & v objects in vertex map
       u_object = self.vertex_map[u_name]
+      v_object = self.vertex_map[v_name]
+
+      # Drop cached trees the new or re-weighted edge could change
+      if self.path_cache:
+        self._invalidate_path_cache(u_name, v_name, weight)
 
-      # Create directed edge (from u to v)
+      # Create directed edge (from u to v) & its reverse index entry
+      old_weight = u_object.neighbour_links.get(v_name)
       u_object.neighbour_links[v_name] = weight # Directed Graph
+      v_object.reverse_links[u_name] = weight
+
+      # Repair registered trees around the changed edge
+      if self.dynamic_trees:
+        for tree in self.dynamic_trees.values():
+          tree.edge_updated(u_name, v_name, old_weight, weight)
+
+  def add_edges_from(self, edges, create_vertices=False):
+    """
+    Add many (u, v, weight) edges in one pass: returns a summary dict
+
+    edges:            Iterable of (u, v, weight) rows, or an (E, 3) NumPy array
+    create_vertices:  Create unknown endpoints at (0, 0) instead of dropping
+
+    The summary counts rows read, edges added, duplicates (an existing edge
+    re-weighted: the last weight wins, as with add_edge), rows dropped for
+    an unknown endpoint & vertices created, with the first dropped rows.
+    """
+    if hasattr(edges, "dtype"):
+      # Split the columns: endpoints of a float (E, 3) array stay integer names
+      u, v, weight = edges[:, 0], edges[:, 1], edges[:, 2]
+      if edges.dtype.kind == "f":
+        u, v = u.astype("int64"), v.astype("int64")
+      edges = zip(u.tolist(), v.tolist(), weight.tolist())
+
+    # Bulk changes: drop cached trees wholesale, rebuild registered ones after
+    if self.path_cache:
+      self.path_cache.clear()
+
+    vertex_map = self.vertex_map
+    get = vertex_map.get
+    vertices_before = len(vertex_map)
+    rows = duplicates = dropped = 0
+    dropped_sample = []
+
+    for rows, (u_name, v_name, weight) in enumerate(edges, 1):
+      u_object = get(u_name)
+      v_object = get(v_name)
+
+      if u_object is None or v_object is None:
+        if not create_vertices:
+          dropped += 1
+          if len(dropped_sample) < 10:
+            dropped_sample.append((u_name, v_name, weight))
+          continue
+        if u_object is None:
+          u_object = vertex_map[u_name] = Vertex(u_name)
+        v_object = get(v_name)
+        if v_object is None:
+          v_object = vertex_map[v_name] = Vertex(v_name)
+
+      # Same as add_edge, keyed by the vertices' own name objects
+      u_links = u_object.neighbour_links
+      if v_object.name in u_links:
+        duplicates += 1
+      u_links[v_object.name] = weight
+      v_object.reverse_links[u_object.name] = weight
+
+    if self.dynamic_trees:
+      for tree in self.dynamic_trees.values():
+        tree.rebuild()
+    if self.spatial_index is not None and len(vertex_map) > vertices_before:
+      self.build_spatial_index()
+
+    return {
+      "rows": rows,
+      "added": rows - dropped - duplicates,
+      "duplicates": duplicates,
+      "dropped": dropped,
+      "vertices_created": len(vertex_map) - vertices_before,
+      "dropped_sample": dropped_sample,
+    }
+
+  @classmethod
+  def from_arrays(cls, u, v, weight):
+    """
+    Build a graph from parallel u, v, weight sequences or NumPy arrays,
+    creating vertices at (0, 0) as they appear: returns (graph, summary)
+    """
+    # NumPy columns become Python scalars, so names are plain ints & strs
+    columns = [column.tolist() if hasattr(column, "dtype") else column
+               for column in (u, v, weight)]
+    graph = cls()
+    summary = graph.add_edges_from(zip(*columns), create_vertices=True)
+    return graph, summary
+
+  # ============ Nearest Vertex Snapping ============ #
+  def build_spatial_index(self):
+    """(Re)build the k-d tree over vertex x/y, kept up to date by add_vertex"""
+    from algorithms.spatial_index import SpatialIndex
+    self.spatial_index = SpatialIndex.from_graph(self)
+    return self.spatial_index
+
+  def nearest_vertex(self, x, y):
+    """Closest vertex to (x, y): returns (name, distance), or (None, inf) if empty"""
+    if self.spatial_index is None:
+      self.build_spatial_index()
+    return self.spatial_index.nearest(x, y)
+
+  # ============ Shortest Path Tree Cache ============ #
+  def enable_path_cache(self, max_sources=128):
+    """
+    Cache full Dijkstra (distance, parent) maps keyed by start vertex
+
+    Repeated dijkstras_algorithm queries from a cached start are answered
+    by path reconstruction alone. At most max_sources trees are kept; the
+    least recently used tree is evicted first, so memory is bounded by
+    roughly max_sources x V map entries.
+    """
+    self.path_cache = OrderedDict()
+    self.path_cache_capacity = max_sources
+    self.cache_hits = 0
+    self.cache_misses = 0
+
+  def disable_path_cache(self):
+    """Drop all cached trees & stop caching"""
+    self.path_cache = None
+    self.path_cache_capacity = 0
+
+  def cache_info(self):
+    """Hit & miss counters plus current & maximum cached trees"""
+    return {
+      "hits": self.cache_hits,
+      "misses": self.cache_misses,
+      "size": len(self.path_cache) if self.path_cache is not None else 0,
+      "capacity": self.path_cache_capacity,
+    }
+
+  def _cached_tree(self, start_vertex):
+    """Return (distance, parent) for start_vertex, computing it on a miss"""
+    tree = self.path_cache.get(start_vertex)
+    if tree is not None:
+      self.cache_hits += 1
+      self.path_cache.move_to_end(start_vertex)
+      return tree, True
+
+    self.cache_misses += 1
+    tree = self.shortest_path_tree(start_vertex)
+    self.path_cache[start_vertex] = tree
+
+    # Evict least recently used trees beyond capacity
+    while len(self.path_cache) > self.path_cache_capacity:
+      self.path_cache.popitem(last=False)
+
+    return tree, False
+
+  def _invalidate_path_cache(self, u_name, v_name, weight):
+    """
+    Edge u -> v is being added or re-weighted: a cached tree is stale if
+    the edge shortens the route to v, or the tree already routes through
+    it (its old weight is part of every distance below v)
+    """
+    stale = []
+    for start_vertex, (distance, parent) in self.path_cache.items():
+      if u_name not in distance:
+        continue
+      if distance[u_name] + weight < distance.get(v_name, float("inf")) \
+      or parent.get(v_name) == u_name:
+        stale.append(start_vertex)
+
+    for start_vertex in stale:
+      del self.path_cache[start_vertex]
+
+  # ============ Dynamic Shortest Path Trees ============ #
+  def register_source(self, start_vertex):
+    """
+    Maintain start_vertex's shortest path tree incrementally
+
+    Later add_edge calls repair only the part of the tree the edge
+    affects, and dijkstras_algorithm answers from the tree. Returns the
+    DynamicShortestPathTree, or None if the vertex does not exist.
+    """
+    from algorithms.dynamic_sssp import DynamicShortestPathTree
+
+    if start_vertex not in self.vertex_map:
+      return None
+    if self.dynamic_trees is None:
+      self.dynamic_trees = {}
+    if start_vertex not in self.dynamic_trees:
+      self.dynamic_trees[start_vertex] = DynamicShortestPathTree(self, start_vertex)
+    return self.dynamic_trees[start_vertex]
+
+  def unregister_source(self, start_vertex):
+    """Stop maintaining start_vertex's tree"""
+    if self.dynamic_trees:
+      self.dynamic_trees.pop(start_vertex, None)
 
   # ============ Depth First Search Algorithm (DFS) ============ #
-  def depth_first_search(self, start_vertex, goal_vertex=None):
+  def depth_first_search(self, start_vertex, goal_vertex=None, node_budget=None, time_budget=None,
+                         stats=None):
+    """
+    Longest simple path from start to goal: returns (path, distance)
+
+    Linear time on DAGs, iterative branch & bound otherwise; see
+    longest_path() for the budgets & whether the answer is exact.
+    """
+    path, distance, _ = self.longest_path(start_vertex, goal_vertex, node_budget, time_budget,
+                                          stats)
+    return path, distance
+
+  def longest_path(self, start_vertex, goal_vertex, node_budget=None, time_budget=None,
+                   stats=None):
+    """
+    Longest simple path: returns (path, distance, complete)
+
+    node_budget & time_budget (seconds) bound the search on cyclic graphs;
+    complete is False when a budget stopped it before the answer was proven.
+    stats: Optional SearchStats recording this query
+    """
+    from algorithms.longest_path import longest_path
+
     # Check start & goal vertices exist
     if start_vertex not in self.vertex_map or goal_vertex not in self.vertex_map:
-      return None, float("-inf")
+      return None, float("-inf"), True
 
-    # Initialise longest path
-    longest_path = []
-    longest_distance = float("-inf")
+    def successors(u_name):
+      return self.vertex_map[u_name].neighbour_links.items()
 
-    # Initialise visited set & current path
-    current_path = []
-    visited_set = set()
+    if stats is None:
+      return longest_path(successors, start_vertex, goal_vertex, node_budget, time_budget)
 
-    def depth_helper(u_name, path_distance):
-      """DFS Recursive Helper Function"""
-      # Initialise variables as enclosed within helper
-      nonlocal longest_path, longest_distance
+    query = stats.begin("longest_path", start_vertex, goal_vertex)
+    result = longest_path(successors, start_vertex, goal_vertex, node_budget, time_budget, query)
+    summary = _result_summary(result)
+    summary["complete"] = result[2]
+    stats.finish(query, summary)
+    return result
 
-      # Add current vertex to visited set & add to current path
-      visited_set.add(u_name)
-      current_path.append(u_name)
+  # ================== Dijkstra's Algorithm ================== #
+  def shortest_path_tree(self, start_vertex, reverse=False):
+    """
+    Full single-source Dijkstra: returns (distance, parent) maps covering
+    every vertex reachable from start_vertex. With reverse=True edges are
+    followed backwards, giving distances from every vertex to start_vertex.
+    """
+    # Check start vertex exists
+    if start_vertex not in self.vertex_map:
+      return {}, {}
 
-      # Check if current vertex is the goal
-      if u_name == goal_vertex:
-        # If longer, update longest path
-        if path_distance > longest_distance:
-          longest_distance = path_distance
-          longest_path = current_path.copy()
+    distance = {start_vertex: 0}
+    parent = {start_vertex: None}
+    settled_set = set()
 
-      # Recursively loop through & search neighbours: Even if goal is found
-      else:
-        u_object = self.vertex_map[u_name]
+    priority_queue = IndexedPriorityQueue()
+    priority_queue.enqueue(start_vertex, 0)
 
-        for v_name, weight in u_object.neighbour_links.items():
-          if v_name not in visited_set:
-            depth_helper(v_name, path_distance + weight)
+    while not priority_queue.is_empty():
+      u_distance, u_name = priority_queue.dequeue()
+      settled_set.add(u_name)
 
-      visited_set.remove(u_name)
-      current_path.pop()
+      u_object = self.vertex_map[u_name]
+      links = u_object.reverse_links if reverse else u_object.neighbour_links
 
-    depth_helper(start_vertex, 0)
+      for v_name, weight in links.items():
+        if v_name in settled_set:
+          continue
 
-    if longest_distance == float("-inf"):
-      return None, float("-inf")
+        new_distance = u_distance + weight
+        if v_name not in distance or new_distance < distance[v_name]:
+          distance[v_name] = new_distance
+          parent[v_name] = u_name
+          priority_queue.enqueue(v_name, new_distance)
 
-    return longest_path, longest_distance
+    return distance, parent
 
+  def dijkstras_algorithm(self, start_vertex, goal_vertex, stats=None):
+    """stats: Optional SearchStats recording this query (see search_stats.py)"""
+    if stats is None:
+      return self._dijkstra_search(start_vertex, goal_vertex, None)
 
-  # ================== Dijkstra's Algorithm ================== #
-  def dijkstras_algorithm(self, start_vertex, goal_vertex):
+    query = stats.begin("dijkstra", start_vertex, goal_vertex)
+    result = self._dijkstra_search(start_vertex, goal_vertex, query)
+    stats.finish(query, _result_summary(result))
+    return result
+
+  def _dijkstra_search(self, start_vertex, goal_vertex, query):
     # Check start & goal vertices exist
     if start_vertex not in self.vertex_map or goal_vertex not in self.vertex_map:
       return None, float("inf"), 0
 
-    # Initialise parent tracking & distances
-    distance = {}
-    parent = {}
-    candidate_set = set()
-    expanded_nodes = 0
+    # Registered sources keep an up to date tree: no search needed
+    if self.dynamic_trees and start_vertex in self.dynamic_trees:
+      if query is not None:
+        query.phase("dynamic_tree")
+      path, distance = self.dynamic_trees[start_vertex].shortest_path(goal_vertex)
+      return path, distance, 0
 
-    # Initialise distances to infinity
-    for vertex in self.vertex_map:
-      distance[vertex] = float("inf")
-      parent[vertex] = None
-      candidate_set.add(vertex)
+    # With the cache enabled, answer from the start vertex's full tree
+    if self.path_cache is not None:
+      if query is not None:
+        query.phase("cache")
+      return self._dijkstra_from_cache(start_vertex, goal_vertex)
 
-    # Set start vertex distance = 0
+    # Initialise parent tracking & distances: unseen vertices are at infinity
+    distance = {}
+    parent = {}
     distance[start_vertex] = 0
+    parent[start_vertex] = None
 
-    # Begin Main Loop
-    while candidate_set:
-      # Find vertex in candidate set with minimum distance
-      shortest_vertex = None
-      shortest_distance = float("inf")
+    # Initialise indexed priority queue with start vertex
+    priority_queue = IndexedPriorityQueue()
+    priority_queue.enqueue(start_vertex, 0)
 
-      for candidate in candidate_set:
-        if distance[candidate] < shortest_distance:
-          shortest_distance = distance[candidate]
-          shortest_vertex = candidate
+    # Initialise settled set & expanded nodes counter
+    settled_set = set()
+    expanded_nodes = 0
 
-      # If shortest vertex found, break
-      if shortest_vertex is None or shortest_vertex == float("inf"):
-        break
+    # Begin Main Loop: Always expand the closest unsettled vertex
+    while not priority_queue.is_empty():
+      shortest_distance, shortest_vertex = priority_queue.dequeue()
 
-      # Remove from candidate set
-      candidate_set.remove(shortest_vertex)
+      # Settle vertex & increment expanded nodes
+      settled_set.add(shortest_vertex)
       expanded_nodes += 1
 
       # Store vertex object
       u_object = self.vertex_map[shortest_vertex]
 
+      if query is not None:
+        edges = 0 if shortest_vertex == goal_vertex else len(u_object.neighbour_links)
+        query.expand(shortest_vertex, shortest_distance, priority_queue.size + 1, edges)
+
+      # Goal distance is final once settled, stop early
+      if shortest_vertex == goal_vertex:
+        break
+
       # Iterate through & process all neighbours
       for v_name, weight in u_object.neighbour_links.items():
-        if v_name in candidate_set:
-          new_distance = distance[shortest_vertex] + weight
+        if v_name in settled_set:
+          continue
 
-          # If distance is shorter, update
-          if new_distance < distance[v_name]:
-            distance[v_name] = new_distance
-            parent[v_name] = shortest_vertex
+        new_distance = shortest_distance + weight
+
+        # If distance is shorter, update & queue or decrease its key
+        if v_name not in distance or new_distance < distance[v_name]:
+          if query is not None:
+            query.improve(shortest_vertex, v_name, new_distance, v_name in distance)
+          distance[v_name] = new_distance
+          parent[v_name] = shortest_vertex
+          priority_queue.enqueue(v_name, new_distance)
 
     # If goal not found, return
-    if distance[goal_vertex] == float("inf"):
+    if goal_vertex not in settled_set:
+      return None, float("inf"), expanded_nodes
+
+    if query is not None:
+      query.phase("path")
+
+    path = []
+    current = goal_vertex
+
+    # Rebuild path to start
+    while current is not None:
+      path.append(current)
+      current = parent[current]
+    path.reverse()
+
+    return path, distance[goal_vertex], expanded_nodes
+
+  def _dijkstra_from_cache(self, start_vertex, goal_vertex):
+    """Dijkstra answer rebuilt from a cached tree: hits expand no nodes"""
+    (distance, parent), hit = self._cached_tree(start_vertex)
+    expanded_nodes = 0 if hit else len(distance)
+
+    # If goal not reached, return
+    if goal_vertex not in distance:
       return None, float("inf"), expanded_nodes
 
     path = []
@@ -255,9 +681,24 @@ class DirectedWeightedGraph:
     return path, distance[goal_vertex], expanded_nodes
 
   # ==================== A* Algorithm ==================== #
-  def astar_algorithm(self, start_vertex, goal_vertex):
-    # Check if start vertex exists
-    if start_vertex not in self.vertex_map:
+  def astar_algorithm(self, start_vertex, goal_vertex, heuristic=None, stats=None):
+    """
+    heuristic: Optional callable h(v_name, goal_vertex) estimating the
+               remaining cost, e.g. LandmarkIndex.heuristic. Must never
+               overestimate. Defaults to Euclidean distance on x/y.
+    stats:     Optional SearchStats recording this query
+    """
+    if stats is None:
+      return self._astar_search(start_vertex, goal_vertex, heuristic, None)
+
+    query = stats.begin("astar", start_vertex, goal_vertex)
+    result = self._astar_search(start_vertex, goal_vertex, heuristic, query)
+    stats.finish(query, _result_summary(result))
+    return result
+
+  def _astar_search(self, start_vertex, goal_vertex, heuristic, query):
+    # Check start & goal vertices exist
+    if start_vertex not in self.vertex_map or goal_vertex not in self.vertex_map:
       return None, float("inf"), 0
 
     # Initialise parent tracking
@@ -266,35 +707,22 @@ class DirectedWeightedGraph:
     distance[start_vertex] = 0
     parent[start_vertex] = None
 
-    # Initialise start & goal objects
-    start_object = self.vertex_map[start_vertex]
+    # Goal object for the default Euclidean heuristic
     goal_object = self.vertex_map[goal_vertex]
 
-    # Initialise priority queue
-    priority_queue = PriorityQueue()
-    priority_queue.enqueue((0, start_vertex)) # Start f(n) = 0
+    # Initialise indexed priority queue: one entry per vertex, keyed on f(n)
+    priority_queue = IndexedPriorityQueue()
+    priority_queue.enqueue(start_vertex, 0) # Start f(n) = 0
 
     # Initialise visited set & expanded nodes counter
     visited_set = set()
     expanded_nodes = 0
 
-    # Initialise u_name
-    u_name = start_vertex
-
     # Begin Main Loop: Run if queue is not empty
     while not priority_queue.is_empty():
 
       # Retreive current f(n) and vertex name
-      result = priority_queue.dequeue()
-      if result is None:
-        continue
-
-      # Get f(n) & vertex name
-      fn, u_name = result
-
-      # Ensure vertex name not already in visited set
-      if u_name in visited_set:
-        continue
+      fn, u_name = priority_queue.dequeue()
 
       # Add to visited set & increment expanded nodes
       visited_set.add(u_name)
@@ -303,6 +731,10 @@ class DirectedWeightedGraph:
       # Create u_object
       u_object = self.vertex_map[u_name]
 
+      if query is not None:
+        edges = 0 if u_name == goal_vertex else len(u_object.neighbour_links)
+        query.expand(u_name, fn, priority_queue.size + 1, edges)
+
       if u_name == goal_vertex:
         break
 
@@ -313,28 +745,39 @@ class DirectedWeightedGraph:
         if v_name in visited_set:
           continue
 
-        # Initialise vertex object
-        v_object = self.vertex_map[v_name]
-
         # 1) Calculate g(n)
         gn = distance[u_name] + weight
 
-        if v_name not in distance or gn < distance[v_name]:
-          distance[v_name] = gn
-          parent[v_name] = u_name
+        # Only improved g(n) values change the queue
+        if v_name in distance and gn >= distance[v_name]:
+          continue
+
+        distance[v_name] = gn
+        parent[v_name] = u_name
+
+        # Initialise vertex object
+        v_object = self.vertex_map[v_name]
 
         # 2) Calculate h(n)
-        hn = ((goal_object.x - v_object.x) ** 2 + (goal_object.y - v_object.y) ** 2) ** 0.5
+        if heuristic is None:
+          hn = ((goal_object.x - v_object.x) ** 2 + (goal_object.y - v_object.y) ** 2) ** 0.5
+        else:
+          hn = heuristic(v_name, goal_vertex)
 
         # 3) Calculate f(n)
         fn = gn + hn
 
-        # Enqueue f(n) score and vertex name
-        priority_queue.enqueue((fn, v_name))
+        # Enqueue vertex, or decrease its key to the better f(n) score
+        if query is not None:
+          query.improve(u_name, v_name, fn, priority_queue.contains(v_name))
+        priority_queue.enqueue(v_name, fn)
 
-    if goal_vertex not in distance:
+    if goal_vertex not in visited_set:
       return None, float("inf"), 0
 
+    if query is not None:
+      query.phase("path")
+
     path = []
     current = goal_vertex
 
@@ -346,55 +789,283 @@ class DirectedWeightedGraph:
 
     return path, distance[goal_vertex], expanded_nodes
 
-  @staticmethod
-  def read_graph(filename):
-    """Load and read graph from file"""
-    graph = DirectedWeightedGraph()
+  # ============ Bidirectional Search Algorithms ============ #
+  def bidirectional_dijkstra(self, start_vertex, goal_vertex):
+    """Dijkstra from start over neighbour_links & from goal over reverse_links"""
+    return self._bidirectional_search(start_vertex, goal_vertex)
 
-    # Open file & read all lines
-    with open(filename) as file:
-      lines = file.readlines()
+  def bidirectional_astar(self, start_vertex, goal_vertex):
+    """Bidirectional A* with the average of the two Euclidean potentials"""
+    if start_vertex not in self.vertex_map or goal_vertex not in self.vertex_map:
+      return None, float("inf"), 0
+
+    start_object = self.vertex_map[start_vertex]
+    goal_object = self.vertex_map[goal_vertex]
+
+    def potential(v_name):
+      """p(v) = (h_goal(v) - h_start(v)) / 2: consistent in both directions"""
+      v_object = self.vertex_map[v_name]
+      to_goal = ((goal_object.x - v_object.x) ** 2 + (goal_object.y - v_object.y) ** 2) ** 0.5
+      to_start = ((start_object.x - v_object.x) ** 2 + (start_object.y - v_object.y) ** 2) ** 0.5
+      return (to_goal - to_start) / 2
+
+    return self._bidirectional_search(start_vertex, goal_vertex, potential)
+
+  def _bidirectional_search(self, start_vertex, goal_vertex, potential=None):
+    """
+    Shared bidirectional search:
+    The forward search keys vertices on d_f(v) + p(v) and the backward
+    search on d_b(v) - p(v), which is Dijkstra on reduced edge weights
+    when p is consistent (p = 0 gives plain bidirectional Dijkstra).
+    Every scanned edge touching the other search's labels proposes a
+    candidate path; the search stops once the two queue minimums sum to
+    at least the best candidate length mu.
+    """
+    # Check start & goal vertices exist
+    if start_vertex not in self.vertex_map or goal_vertex not in self.vertex_map:
+      return None, float("inf"), 0
+
+    # Forward [0] follows neighbour_links, backward [1] follows reverse_links
+    distance = ({start_vertex: 0}, {goal_vertex: 0})
+    parent = ({start_vertex: None}, {goal_vertex: None})
+    settled = (set(), set())
+    queues = (IndexedPriorityQueue(), IndexedPriorityQueue())
+    signs = (1, -1)
+
+    start_key = potential(start_vertex) if potential else 0
+    goal_key = -potential(goal_vertex) if potential else 0
+    queues[0].enqueue(start_vertex, start_key)
+    queues[1].enqueue(goal_vertex, goal_key)
+
+    # Initialise best path length & its meeting edge as (forward end, backward start)
+    best_distance = float("inf")
+    meeting_edge = None
+    if start_vertex == goal_vertex:
+      best_distance = 0
+      meeting_edge = (start_vertex, None)
+    expanded_nodes = 0
+
+    # Begin Main Loop: Run while both directions have vertices left
+    while not queues[0].is_empty() and not queues[1].is_empty():
+      forward_key = queues[0].peek()[0]
+      backward_key = queues[1].peek()[0]
 
-    # Clean all lines
-    lines = [line.strip() for line in lines]
+      # Meeting criterion: no unsettled vertex can improve mu
+      if forward_key + backward_key >= best_distance:
+        break
 
-    # Split first line
-    start_line = lines[0].split()
-    # Store number of vertices & edges
-    number_vertices = int(start_line[0])
-    number_edges = int(start_line[1])
+      # Expand the side with the smaller frontier
+      side = 0 if queues[0].size <= queues[1].size else 1
+      other = 1 - side
+      _, u_name = queues[side].dequeue()
+      settled[side].add(u_name)
+      expanded_nodes += 1
 
-    # Split last line
-    last_line = lines[-1].split()
-    # Store start & goal vertices
-    start_vertex = int(last_line[0])
-    goal_vertex = int(last_line[1])
+      u_object = self.vertex_map[u_name]
+      links = u_object.neighbour_links if side == 0 else u_object.reverse_links
+      u_distance = distance[side][u_name]
 
-    # Initialise vertex coordinates
-    vertex_coordinates = {}
+      for v_name, weight in links.items():
+        new_distance = u_distance + weight
 
-    # Parse all vertex names & lines
-    for i in range(1, number_vertices + 1):
-      sections = lines[i].split()
-      k = int(sections[0]) # Vertex name
-      x = float(sections[1]) # X coordinate
-      y = float(sections[2]) # Y coordinate
+        # Candidate path through edge (u, v) joins the two searches
+        if v_name in distance[other]:
+          candidate = new_distance + distance[other][v_name]
+          if candidate < best_distance:
+            best_distance = candidate
+            meeting_edge = (u_name, v_name) if side == 0 else (v_name, u_name)
 
-      # Add vertex to graph
-      graph.add_vertex(k, x, y)
+        if v_name in settled[side]:
+          continue
 
-      # Set vertex coordinates
-      vertex_coordinates[k] = (x, y)
+        # If distance is shorter, update & queue or decrease its key
+        if v_name not in distance[side] or new_distance < distance[side][v_name]:
+          distance[side][v_name] = new_distance
+          parent[side][v_name] = u_name
+          key = new_distance + (signs[side] * potential(v_name) if potential else 0)
+          queues[side].enqueue(v_name, key)
 
-    # Parse all edge lines
-    for i in range(number_vertices + 1, number_vertices + number_edges + 1):
-      sections = lines[i].split()
-      u_edge = int(sections[0]) # From edge
-      v_edge = int(sections[1]) # To edge
-      weight = float(sections[2]) # Edge weight
+    # If the searches never met, return
+    if meeting_edge is None:
+      return None, float("inf"), expanded_nodes
 
-      # Add edges to graph
-      graph.add_edge(u_edge, v_edge, weight)
+    # Rebuild start -> meeting edge half, then meeting edge -> goal half
+    forward_end, backward_start = meeting_edge
+    path = []
+    current = forward_end
+    while current is not None:
+      path.append(current)
+      current = parent[0][current]
+    path.reverse()
+
+    current = backward_start
+    while current is not None:
+      path.append(current)
+      current = parent[1][current]
+
+    return path, best_distance, expanded_nodes
+
+  def distance_matrix(self, sources, targets, workers=None):
+    """
+    Sources x targets shortest distances as a dense DistanceMatrix
+
+    Freezes the graph & delegates to CSRGraph.distance_matrix, whose
+    compact arrays are cheap to ship to worker processes. Freeze once
+    & call the CSRGraph directly when running many matrices.
+    """
+    return self.to_csr().distance_matrix(sources, targets, workers)
+
+  def to_csr(self):
+    """Compact graph into a read-only CSRGraph with dense integer ids"""
+    from algorithms.csr_graph import CSRGraph
+    return CSRGraph.from_graph(self)
+
+  def to_grid(self):
+    """Bitmap OccupancyGrid of a graph laid out on integer cells, for jump point search"""
+    from algorithms.occupancy_grid import OccupancyGrid
+    return OccupancyGrid.from_graph(self)
+
+  def freeze(self):
+    """Freeze graph for querying: alias of to_csr()"""
+    return self.to_csr()
+
+  def save_binary(self, filename):
+    """Write graph as a binary CSR snapshot (see CSRGraph.save_binary)"""
+    self.to_csr().save_binary(filename)
+
+  @staticmethod
+  def load_binary(filename):
+    """Memory-map a binary snapshot as a read-only CSRGraph"""
+    from algorithms.csr_graph import CSRGraph
+    return CSRGraph.load_binary(filename)
+
+  @staticmethod
+  def read_graph(filename, chunk_size=1 << 22):
+    """
+    Load and read graph from file
+
+    Streams the file in chunk_size byte blocks instead of holding every
+    line in memory: the header, vertex block, edge block & start/goal
+    line are consumed as one whitespace separated token stream, and each
+    block is converted in bulk batches of rows. Gzip files are detected by
+    their magic bytes. Load throughput is recorded in graph.load_stats.
+    """
+    graph = DirectedWeightedGraph()
+    vertex_map = graph.vertex_map
+    began = time.perf_counter()
+
+    with _open_graph_file(filename) as file:
+      tokens = _TokenReader(file, chunk_size)
+
+      # Header: number of vertices & edges
+      number_vertices, number_edges = map(int, tokens.take(2))
+
+      # Parse vertex rows "name x y" in bulk batches
+      for batch_start in range(0, number_vertices, READ_BATCH_ROWS):
+        rows = tokens.take(3 * min(READ_BATCH_ROWS, number_vertices - batch_start))
+        names = map(int, rows[0::3]) # Vertex names
+        xs = map(float, rows[1::3]) # X coordinates
+        ys = map(float, rows[2::3]) # Y coordinates
+
+        for k, x, y in zip(names, xs, ys):
+          # Same as add_vertex: the first definition of a name wins
+          if k not in vertex_map:
+            vertex_map[k] = Vertex(k, x, y)
+
+      # Parse edge rows "u v weight" in bulk batches
+      for batch_start in range(0, number_edges, READ_BATCH_ROWS):
+        rows = tokens.take(3 * min(READ_BATCH_ROWS, number_edges - batch_start))
+        u_edges = map(int, rows[0::3]) # From edge
+        v_edges = map(int, rows[1::3]) # To edge
+        weights = map(float, rows[2::3]) # Edge weight
+
+        for u_edge, v_edge, weight in zip(u_edges, v_edges, weights):
+          # Same as add_edge: skip edges with unknown endpoints
+          u_object = vertex_map.get(u_edge)
+          v_object = vertex_map.get(v_edge)
+          if u_object is None or v_object is None:
+            continue
+
+          # Key links by the vertices' own name objects, not the per-row ints
+          u_object.neighbour_links[v_object.name] = weight
+          v_object.reverse_links[u_object.name] = weight
+
+      # Last line: start & goal vertices
+      start_vertex, goal_vertex = map(int, tokens.take(2))
+
+    # Record achieved load throughput
+    seconds = max(time.perf_counter() - began, 1e-9)
+    graph.load_stats = {
+      "bytes": tokens.bytes_read,
+      "seconds": seconds,
+      "megabytes_per_second": tokens.bytes_read / seconds / 1e6,
+      "edges_per_second": number_edges / seconds,
+    }
 
     return graph, start_vertex, goal_vertex, number_vertices, number_edges
-  main()
+
+
+def _result_summary(result):
+  """Distance & path length of a (path, distance, ...) search result for SearchStats"""
+  path, distance = result[0], result[1]
+  return {"distance": distance, "path_length": len(path) if path else 0}
+
+
+def _open_graph_file(filename):
+  """Open a graph file for binary reading, transparently gunzipping"""
+  with open(filename, "rb") as file:
+    magic = file.read(2)
+
+  if magic == b"\x1f\x8b":
+    return gzip.open(filename, "rb")
+  return open(filename, "rb")
+
+
+class _TokenReader:
+  """Whitespace separated tokens read from a binary file in large chunks"""
+  def __init__(self, file, chunk_size):
+    self.file = file
+    self.chunk_size = chunk_size
+    self.tokens = []
+    self.position = 0
+    self.partial = b""
+    self.bytes_read = 0
+
+  def _fill(self):
+    """Split the next chunk into tokens, holding back a cut-off last token"""
+    data = self.file.read(self.chunk_size)
+    if not data:
+      # End of file: release the held back token, then report exhaustion
+      if not self.partial:
+        return None
+      tokens = [self.partial]
+      self.partial = b""
+      return tokens
+
+    self.bytes_read += len(data)
+    data = self.partial + data
+    tokens = data.split()
+
+    # A chunk ending mid-token continues in the next chunk
+    if tokens and not data[-1:].isspace():
+      self.partial = tokens.pop()
+    else:
+      self.partial = b""
+    return tokens
+
+  def take(self, count):
+    """Return the next count tokens (fewer at end of file)"""
+    taken = self.tokens[self.position:self.position + count]
+    self.position += len(taken)
+
+    while len(taken) < count:
+      tokens = self._fill()
+      if tokens is None:
+        break
+
+      needed = count - len(taken)
+      taken.extend(tokens[:needed])
+      self.tokens = tokens
+      self.position = min(needed, len(tokens))
+
+    return taken
@@ -0,0 +1,550 @@
+"""
+Asyncio Route Query Service
+
+Description: Serves route, distance & matrix queries for one graph over a
+             localhost TCP (or Unix) socket. The graph is loaded once &
+             frozen to CSR arrays; worker processes receive the arrays once
+             at start up & run every search, so the event loop only parses,
+             batches & answers requests.
+
+Protocol:    One JSON object per line each way. Responses echo the id.
+
+             - {"id": 1, "op": "route", "source": s, "target": t}
+               -> {"id": 1, "ok": true, "path": [...], "distance": d}
+             - {"op": "distance", "source": s, "target": t} -> "distance"
+             - {"op": "matrix", "sources": [...], "targets": [...]}
+               -> "distances": one row per source
+             - {"op": "stats"} -> service counters
+
+             Unreachable targets give a null path & distance. Any request
+             may carry "deadline_ms"; errors come back as {"ok": false,
+             "error": ...}.
+
+             1. Coalescing: requests for the same source share one
+                multi-target Dijkstra that stops once every requested target
+                is settled. A source's batch opens for batch_window seconds,
+                then waits for a free worker, still accepting requests, so
+                batches grow with load instead of queueing in the pool.
+             2. Backpressure: each connection stops reading once it has
+                max_in_flight requests outstanding, so TCP pushes back on
+                the client; beyond max_pending requests service-wide new
+                requests are rejected with "overloaded".
+             3. Deadlines: a request past its deadline is answered "deadline
+                exceeded"; batches whose every waiter has expired are
+                dropped before reaching a worker.
+
+Usage: python -m algorithms.route_service <graph.txt> [port] [workers]
+"""
+
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from algorithms.pathfinding import DirectedWeightedGraph, IndexedPriorityQueue
+
+# CSR arrays installed once per worker process
+_worker_state = None
+
+# Longest accepted request line in bytes
+MAX_LINE_BYTES = 1 << 20
+
+
+def _init_route_worker(offsets, targets, weights):
+  """Process pool initializer: receive the CSR arrays once per worker"""
+  global _worker_state
+  _worker_state = (offsets, targets, weights)
+
+
+def _routes_from(offsets, targets, weights, source, target_ids):
+  """
+  Dijkstra from source that stops once every target is settled:
+  returns [(distance, path ids), ...] per target, (None, None) if unreachable
+  """
+  vertex_count = len(offsets) - 1
+  distance = array("d", [float("inf")]) * vertex_count
+  parent = array("i", [-1]) * vertex_count
+  settled = bytearray(vertex_count)
+  distance[source] = 0
+  remaining = set(target_ids)
+
+  priority_queue = IndexedPriorityQueue()
+  priority_queue.enqueue(source, 0)
+
+  while remaining and not priority_queue.is_empty():
+    u_distance, u = priority_queue.dequeue()
+    settled[u] = 1
+    remaining.discard(u)
+
+    for edge in range(offsets[u], offsets[u + 1]):
+      v = targets[edge]
+      if settled[v]:
+        continue
+      new_distance = u_distance + weights[edge]
+      if new_distance < distance[v]:
+        distance[v] = new_distance
+        parent[v] = u
+        priority_queue.enqueue(v, new_distance)
+
+  routes = []
+  for target in target_ids:
+    if not settled[target]:
+      routes.append((None, None))
+      continue
+    path = []
+    current = target
+    while current != -1:
+      path.append(current)
+      current = parent[current]
+    path.reverse()
+    routes.append((distance[target], path))
+  return routes
+
+
+def _worker_routes(source, target_ids):
+  """Process pool task: routes from one source to a batch of targets"""
+  return _routes_from(*_worker_state, source, target_ids)
+
+
+class RequestError(Exception):
+  """A request the service answers with an error instead of a result"""
+
+
+class RouteService:
+  """
+  Route Service Class:
+  graph:          DirectedWeightedGraph or CSRGraph served
+  workers:        Search processes (default: CPU count)
+  batch_window:   Seconds requests for one source wait to share a search
+  max_pending:    Service-wide outstanding requests before rejecting
+  max_in_flight:  Outstanding requests per connection before it stops reading
+  deadline:       Default per-request deadline in seconds
+  stats:          Counters: requests, searches, coalesced, rejected, expired
+  """
+  def __init__(self, graph, workers=None, batch_window=0.002, max_pending=10000,
+               max_in_flight=256, deadline=10.0):
+    self.csr = graph if hasattr(graph, "offsets") else graph.to_csr()
+    self.workers = workers or os.cpu_count() or 1
+    self.batch_window = batch_window
+    self.max_pending = max_pending
+    self.max_in_flight = max_in_flight
+    self.deadline = deadline
+    self.stats = {"requests": 0, "searches": 0, "coalesced": 0, "rejected": 0, "expired": 0}
+
+    self.pending = 0
+    self.address = None
+    self._batches = {} # Source id -> [target id set, [(future, deadline, target ids)], timer]
+    self._ready = deque() # Sources whose batch window has closed, oldest first
+    self._running = 0 # Searches handed to workers & not yet finished
+    self._pool = None
+    self._closed = False
+    self._server = None
+    self._connections = {} # Handler task -> its stream writer
+
+  @classmethod
+  def from_file(cls, filename, **options):
+    """Load a read_graph text file once & serve it"""
+    graph = DirectedWeightedGraph.read_graph(filename)[0]
+    return cls(graph, **options)
+
+  # ================== Lifecycle ================== #
+  async def start(self, host="127.0.0.1", port=0, path=None):
+    """Start workers & listen on host:port (0 picks a free port) or a Unix socket path"""
+    csr = self.csr
+    self._pool = ProcessPoolExecutor(self.workers, initializer=_init_route_worker,
+                                     initargs=(array("q", csr.offsets), array("i", csr.targets),
+                                               array("d", csr.weights)))
+    if path is not None:
+      self._server = await asyncio.start_unix_server(self._handle, path, limit=MAX_LINE_BYTES)
+      self.address = path
+    else:
+      self._server = await asyncio.start_server(self._handle, host, port, limit=MAX_LINE_BYTES)
+      self.address = self._server.sockets[0].getsockname()[:2]
+    return self.address
+
+  async def close(self):
+    """Stop listening, fail requests still batching & shut the worker processes down"""
+    if self._server is not None:
+      self._server.close()
+
+      # Closing each connection ends its handler's read loop cleanly
+      for writer in self._connections.values():
+        writer.close()
+      await asyncio.gather(*self._connections, return_exceptions=True)
+      await self._server.wait_closed()
+
+    # No batch may reach the pool once it is shut down
+    self._closed = True
+    for _, waiters, timer in self._batches.values():
+      timer.cancel()
+      for future, _, _ in waiters:
+        if not future.done():
+          future.set_exception(RequestError("service shutting down"))
+    self._batches.clear()
+    self._ready.clear()
+    if self._pool is not None:
+      self._pool.shutdown(cancel_futures=True)
+
+  async def __aenter__(self):
+    if self._server is None:
+      await self.start()
+    return self
+
+  async def __aexit__(self, *exc_info):
+    await self.close()
+
+  # ================== Batching ================== #
+  def _submit(self, source, target_ids, deadline):
+    """Future for routes from source to target_ids, sharing the source's next search"""
+    if self._closed:
+      raise RequestError("service shutting down")
+    loop = asyncio.get_running_loop()
+    batch = self._batches.get(source)
+    if batch is None:
+      timer = loop.call_later(self.batch_window, self._batch_ready, source)
+      batch = self._batches[source] = [set(), [], timer]
+    else:
+      self.stats["coalesced"] += 1
+
+    future = loop.create_future()
+    batch[0].update(target_ids)
+    batch[1].append((future, deadline, target_ids))
+    return future
+
+  def _batch_ready(self, source):
+    """A batch window closed: queue the source for the next free worker"""
+    self._ready.append(source)
+    self._dispatch()
+
+  def _dispatch(self):
+    """Hand ready batches to free workers, skipping batches every waiter gave up on"""
+    while self._ready and self._running < self.workers:
+      source = self._ready.popleft()
+      target_set, waiters, _ = self._batches.pop(source)
+      now = time.monotonic()
+      waiters = [waiter for waiter in waiters if not waiter[0].done() and waiter[1] > now]
+      if waiters:
+        self._run(source, sorted(target_set), waiters)
+
+  def _run(self, source, target_ids, waiters):
+    """Search on a worker, then resolve every waiter from its routes"""
+    self.stats["searches"] += 1
+    self._running += 1
+    job = asyncio.get_running_loop().run_in_executor(self._pool, _worker_routes, source, target_ids)
+
+    def deliver(job):
+      self._running -= 1
+      self._dispatch()
+      if job.cancelled():
+        error = RequestError("service shutting down")
+      else:
+        error = job.exception()
+      routes = dict(zip(target_ids, job.result())) if error is None else None
+      for future, _, wanted in waiters:
+        if future.done():
+          continue
+        if error is not None:
+          future.set_exception(error)
+        else:
+          future.set_result([routes[target] for target in wanted])
+    job.add_done_callback(deliver)
+
+  # ================== Requests ================== #
+  def _vertex_id(self, name):
+    """Dense id of a vertex name from a request"""
+    if not isinstance(name, (str, int, float)) or isinstance(name, bool):
+      raise RequestError(f"vertex must be a string or number, not {name!r}")
+    vertex_id = self.csr.ids.get(name)
+    if vertex_id is None:
+      raise RequestError(f"unknown vertex {name!r}")
+    return vertex_id
+
+  def _vertex_ids(self, request, field):
+    """Dense ids of a request's list of vertex names"""
+    names = request[field]
+    if not isinstance(names, list):
+      raise RequestError(f"{field!r} must be a list")
+    return [self._vertex_id(name) for name in names]
+
+  async def _routes(self, source_id, target_ids, deadline):
+    """Routes from one resolved source to resolved targets, within the deadline"""
+    future = self._submit(source_id, target_ids, deadline)
+    try:
+      return await asyncio.wait_for(future, max(0.0, deadline - time.monotonic()))
+    except asyncio.TimeoutError:
+      raise RequestError("deadline exceeded") from None
+
+  async def execute(self, request):
+    """Answer one decoded request: returns the response dict"""
+    response = {"id": request.get("id")}
+    self.stats["requests"] += 1
+
+    op = request.get("op")
+    if op == "stats":
+      response.update(ok=True, stats=dict(self.stats, pending=self.pending))
+      return response
+
+    if self.pending >= self.max_pending:
+      self.stats["rejected"] += 1
+      response.update(ok=False, error="overloaded")
+      return response
+
+    self.pending += 1
+    try:
+      deadline_ms = request.get("deadline_ms")
+      if deadline_ms is None:
+        deadline = time.monotonic() + self.deadline
+      elif isinstance(deadline_ms, (int, float)) and not isinstance(deadline_ms, bool):
+        deadline = time.monotonic() + deadline_ms / 1000
+      else:
+        raise RequestError(f"deadline_ms must be a number, not {deadline_ms!r}")
+
+      # Resolve every id before submitting, so a bad name submits no work
+      names = self.csr.names
+      if op in ("route", "distance"):
+        source_id = self._vertex_id(request["source"])
+        target_id = self._vertex_id(request["target"])
+        (distance, path), = await self._routes(source_id, [target_id], deadline)
+        response.update(ok=True, distance=distance)
+        if op == "route":
+          response["path"] = [names[v] for v in path] if path is not None else None
+
+      elif op == "matrix":
+        source_ids = self._vertex_ids(request, "sources")
+        target_ids = self._vertex_ids(request, "targets")
+        rows = await asyncio.gather(*(self._routes(source_id, target_ids, deadline)
+                                      for source_id in source_ids), return_exceptions=True)
+        for row in rows:
+          if isinstance(row, Exception):
+            raise row
+        response.update(ok=True, distances=[[distance for distance, _ in row] for row in rows])
+
+      else:
+        raise RequestError(f"unknown op {op!r}")
+
+    except RequestError as error:
+      if str(error) == "deadline exceeded":
+        self.stats["expired"] += 1
+      response.update(ok=False, error=str(error))
+    except KeyError as error:
+      response.update(ok=False, error=f"missing field {error.args[0]!r}")
+    except Exception as error:
+      # Every request gets exactly one response, whatever went wrong
+      response.update(ok=False, error=f"internal error: {error!r}")
+    finally:
+      self.pending -= 1
+
+    return response
+
+  async def _handle(self, reader, writer):
+    """One connection: read request lines, answer each as it completes"""
+    in_flight = asyncio.Semaphore(self.max_in_flight)
+    tasks = set()
+    handler = asyncio.current_task()
+    self._connections[handler] = writer
+
+    async def respond(request):
+      try:
+        response = await self.execute(request)
+        writer.write(json.dumps(response).encode() + b"\n")
+        await writer.drain()
+      except ConnectionError:
+        pass
+      finally:
+        in_flight.release()
+
+    try:
+      while True:
+        # Backpressure: stop reading while this connection has too much in flight
+        await in_flight.acquire()
+        try:
+          line = await reader.readline()
+        except ConnectionError:
+          in_flight.release()
+          break
+        except ValueError:
+          # Longer than MAX_LINE_BYTES: the stream cannot resync, so answer & close
+          in_flight.release()
+          error = RequestError("request too long")
+          writer.write(json.dumps({"id": None, "ok": False, "error": str(error)}).encode() + b"\n")
+          break
+        if not line:
+          in_flight.release()
+          break
+
+        try:
+          request = json.loads(line)
+          if not isinstance(request, dict):
+            raise ValueError("request must be a JSON object")
+        except ValueError as error:
+          writer.write(json.dumps({"id": None, "ok": False, "error": f"bad request: {error}"}).encode()
+                       + b"\n")
+          in_flight.release()
+          continue
+
+        task = asyncio.ensure_future(respond(request))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+
+      if tasks:
+        await asyncio.gather(*tasks, return_exceptions=True)
+    finally:
+      del self._connections[handler]
+      writer.close()
+
+
+class RouteClient:
+  """
+  Route Client Class: pipelined requests over one connection, matched to
+  responses by id
+  """
+  def __init__(self, reader, writer):
+    self.reader = reader
+    self.writer = writer
+    self._next_id = 0
+    self._waiting = {}
+    self._listener = asyncio.ensure_future(self._listen())
+
+  @classmethod
+  async def connect(cls, host="127.0.0.1", port=None, path=None):
+    """Open a connection to a RouteService"""
+    if path is not None:
+      reader, writer = await asyncio.open_unix_connection(path, limit=MAX_LINE_BYTES)
+    else:
+      reader, writer = await asyncio.open_connection(host, port, limit=MAX_LINE_BYTES)
+    return cls(reader, writer)
+
+  async def _listen(self):
+    """Resolve each waiting request as its response line arrives"""
+    try:
+      while True:
+        line = await self.reader.readline()
+        if not line:
+          break
+        response = json.loads(line)
+        future = self._waiting.pop(response.get("id"), None)
+        if future is not None and not future.done():
+          future.set_result(response)
+    finally:
+      for future in self._waiting.values():
+        if not future.done():
+          future.set_exception(ConnectionError("route service closed the connection"))
+
+  async def request(self, op, **fields):
+    """Send one request & await its response dict"""
+    self._next_id += 1
+    request_id = self._next_id
+    future = asyncio.get_running_loop().create_future()
+    self._waiting[request_id] = future
+    self.writer.write(json.dumps(dict(fields, id=request_id, op=op)).encode() + b"\n")
+    await self.writer.drain()
+    return await future
+
+  async def route(self, source, target, **fields):
+    return await self.request("route", source=source, target=target, **fields)
+
+  async def distance(self, source, target, **fields):
+    return await self.request("distance", source=source, target=target, **fields)
+
+  async def matrix(self, sources, targets, **fields):
+    return await self.request("matrix", sources=sources, targets=targets, **fields)
+
+  async def close(self):
+    self.writer.close()
+    self._listener.cancel()
+
+
+async def generate_load(address, vertices, requests=1000, connections=4, concurrency=64,
+                        hot_sources=8, matrix_every=0, deadline_ms=None, seed=0):
+  """
+  Load generator: send seeded route requests to a running service over
+  pipelined connections, returning throughput & latency figures
+
+  vertices:      Vertex names to draw sources & targets from
+  concurrency:   Requests kept outstanding: each finished request is
+                 replaced by a new one (closed loop)
+  hot_sources:   Sources are drawn from this many vertices, so concurrent
+                 requests share sources as popular origins do (0: any vertex)
+  matrix_every:  Send every n-th request as a small matrix request (0: never)
+  """
+  rng = random.Random(seed)
+  vertices = list(vertices)
+  sources = rng.sample(vertices, min(hot_sources, len(vertices))) if hot_sources else vertices
+  extra = {"deadline_ms": deadline_ms} if deadline_ms is not None else {}
+
+  if isinstance(address, str):
+    clients = [await RouteClient.connect(path=address) for _ in range(connections)]
+  else:
+    clients = [await RouteClient.connect(*address) for _ in range(connections)]
+
+  latencies = []
+  outcomes = {}
+  sent = 0
+
+  async def sender(client):
+    nonlocal sent
+    while sent < requests:
+      k = sent
+      sent += 1
+      began = time.perf_counter()
+      if matrix_every and k % matrix_every == 0:
+        response = await client.matrix(rng.sample(sources, min(2, len(sources))),
+                                       rng.sample(vertices, min(4, len(vertices))), **extra)
+      else:
+        response = await client.route(rng.choice(sources), rng.choice(vertices), **extra)
+      latencies.append(time.perf_counter() - began)
+      outcome = "ok" if response["ok"] else response["error"]
+      outcomes[outcome] = outcomes.get(outcome, 0) + 1
+
+  began = time.perf_counter()
+  try:
+    await asyncio.gather(*(sender(clients[k % connections]) for k in range(concurrency)))
+  finally:
+    for client in clients:
+      await client.close()
+  seconds = time.perf_counter() - began
+
+  latencies.sort()
+  def percentile(fraction):
+    return latencies[min(len(latencies) - 1, int(fraction * len(latencies)))] if latencies else None
+
+  return {
+    "requests": requests,
+    "seconds": seconds,
+    "requests_per_second": requests / seconds if seconds else None,
+    "p50": percentile(0.5),
+    "p95": percentile(0.95),
+    "p99": percentile(0.99),
+    "outcomes": outcomes,
+  }
+
+
+async def _serve(filename, port, workers):
+  service = RouteService.from_file(filename, workers=workers)
+  host, port = await service.start(port=port)
+  print(f"Serving {filename} on {host}:{port} with {service.workers} workers")
+  try:
+    await asyncio.Event().wait()
+  finally:
+    await service.close()
+
+
+def main():
+  if len(sys.argv) < 2:
+    print(__doc__.strip().splitlines()[-1])
+    sys.exit(1)
+  port = int(sys.argv[2]) if len(sys.argv) > 2 else 8765
+  workers = int(sys.argv[3]) if len(sys.argv) > 3 else None
+  try:
+    asyncio.run(_serve(sys.argv[1], port, workers))
+  except KeyboardInterrupt:
+    pass
+
+
+if __name__ == "__main__":
+  main()
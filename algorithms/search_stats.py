@@ -0,0 +1,176 @@
+"""
+Search Instrumentation
+
+Description: Opt-in counters, hooks & traces for the search methods. Pass a
+             SearchStats object as stats= to a search; without one, the
+             search skips all bookkeeping behind a single None check per
+             expansion.
+
+             - Counters:    Heap pushes, decrease-keys, pops, edge
+                            relaxations, improvements & peak frontier size.
+             - Phases:      Wall time of each named phase of a query.
+             - Histograms:  Per-query metrics aggregated into power of two
+                            buckets across every query.
+             - Traces:      A seeded sample of queries also record their
+                            expansion order & are kept for JSON export.
+             - Hooks:       Optional on_expand(query, vertex, priority) &
+                            on_improve(query, u, v, priority) callables.
+"""
+
+import json
+import random
+import time
+from collections import deque
+
+# Per-query counters summed into SearchStats.totals
+COUNTERS = ("expanded", "pushes", "decrease_keys", "pops", "relaxations", "improvements",
+            "wall_us")
+
+# Per-query metrics aggregated into histograms
+HISTOGRAM_METRICS = ("expanded", "pushes", "pops", "relaxations", "peak_frontier", "wall_us")
+
+
+class QueryStats:
+  """
+  Query Stats Class: counters of one search, handed out by SearchStats.begin
+  events:  [(vertex, priority), ...] expansion order when sampled, else None
+  """
+  __slots__ = ("method", "start", "goal", "expanded", "pushes", "decrease_keys", "pops",
+               "relaxations", "improvements", "peak_frontier", "phases", "events", "result",
+               "_phase", "_phase_began", "_stats")
+
+  def __init__(self, stats, method, start, goal, sampled):
+    self.method = method
+    self.start = start
+    self.goal = goal
+    self.expanded = 0
+    self.pushes = 0
+    self.decrease_keys = 0
+    self.pops = 0
+    self.relaxations = 0
+    self.improvements = 0
+    self.peak_frontier = 0
+    self.phases = {}
+    self.events = [] if sampled else None
+    self.result = None
+    self._phase = None
+    self._phase_began = 0.0
+    self._stats = stats
+
+  def phase(self, name):
+    """Start timing phase name, closing the current phase"""
+    now = time.perf_counter()
+    if self._phase is not None:
+      self.phases[self._phase] = self.phases.get(self._phase, 0.0) + now - self._phase_began
+    self._phase = name
+    self._phase_began = now
+
+  def expand(self, vertex, priority, frontier, edges):
+    """A vertex left the frontier & its edges are about to be relaxed"""
+    self.expanded += 1
+    self.pops += 1
+    self.relaxations += edges
+    if frontier > self.peak_frontier:
+      self.peak_frontier = frontier
+    if self.events is not None:
+      self.events.append((vertex, priority))
+    on_expand = self._stats.on_expand
+    if on_expand is not None:
+      on_expand(self, vertex, priority)
+
+  def improve(self, u, v, priority, queued):
+    """Edge u -> v improved v: a decrease-key if v was queued, else a push"""
+    self.improvements += 1
+    if queued:
+      self.decrease_keys += 1
+    else:
+      self.pushes += 1
+    on_improve = self._stats.on_improve
+    if on_improve is not None:
+      on_improve(self, u, v, priority)
+
+  def as_dict(self):
+    """Counters, phases & sampled events as JSON friendly values"""
+    return {
+      "method": self.method,
+      "start": self.start,
+      "goal": self.goal,
+      "expanded": self.expanded,
+      "pushes": self.pushes,
+      "decrease_keys": self.decrease_keys,
+      "pops": self.pops,
+      "relaxations": self.relaxations,
+      "improvements": self.improvements,
+      "peak_frontier": self.peak_frontier,
+      "phases": dict(self.phases),
+      "wall_us": int(sum(self.phases.values()) * 1e6),
+      "result": self.result,
+      "events": self.events,
+    }
+
+
+class SearchStats:
+  """
+  Search Stats Class:
+  sample_rate:  Fraction of queries whose full trace is kept (seeded)
+  max_traces:   Most recent sampled traces kept for export
+  queries:      Number of finished queries
+  totals:       Summed counters, phase seconds & the largest peak frontier
+  histograms:   Maps metric to {bucket lower bound: queries}
+  """
+  def __init__(self, sample_rate=0.0, max_traces=1000, seed=0, on_expand=None, on_improve=None):
+    self.sample_rate = sample_rate
+    self.on_expand = on_expand
+    self.on_improve = on_improve
+    self.queries = 0
+    self.totals = {}
+    self.histograms = {metric: {} for metric in HISTOGRAM_METRICS}
+    self.traces = deque(maxlen=max_traces)
+    self._random = random.Random(seed)
+
+  def begin(self, method, start=None, goal=None):
+    """Start recording one query: returns its QueryStats"""
+    sampled = self.sample_rate > 0 and self._random.random() < self.sample_rate
+    query = QueryStats(self, method, start, goal, sampled)
+    query.phase("search")
+    return query
+
+  def finish(self, query, result=None):
+    """Close the query's last phase & fold it into totals & histograms"""
+    query.phase(None)
+    query.result = result
+    record = query.as_dict()
+    self.queries += 1
+
+    for key in COUNTERS:
+      self.totals[key] = self.totals.get(key, 0) + record[key]
+    self.totals["peak_frontier"] = max(self.totals.get("peak_frontier", 0), record["peak_frontier"])
+    for name, seconds in record["phases"].items():
+      key = f"phase_{name}_seconds"
+      self.totals[key] = self.totals.get(key, 0.0) + seconds
+
+    for metric in HISTOGRAM_METRICS:
+      bucket = 1 << (record[metric].bit_length() - 1) if record[metric] > 0 else 0
+      histogram = self.histograms[metric]
+      histogram[bucket] = histogram.get(bucket, 0) + 1
+
+    if query.events is not None:
+      self.traces.append(record)
+
+  def histogram(self, metric):
+    """Sorted (bucket lower bound, queries) pairs for one metric"""
+    return sorted(self.histograms[metric].items())
+
+  def to_json(self):
+    """Aggregated totals & histograms as a JSON string"""
+    return json.dumps({
+      "queries": self.queries,
+      "totals": self.totals,
+      "histograms": {metric: self.histogram(metric) for metric in HISTOGRAM_METRICS},
+    }, default=str)
+
+  def dump_traces(self, filename):
+    """Write sampled traces as JSON lines, one query per line"""
+    with open(filename, "w") as file:
+      for record in self.traces:
+        file.write(json.dumps(record, default=str) + "\n")
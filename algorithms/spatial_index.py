@@ -0,0 +1,255 @@
+"""
+Spatial Index over Vertex Coordinates
+
+Description: k-d tree for snapping raw (x, y) points to graph vertices
+             without scanning every vertex. Points are stored in flat
+             arrays in tree order: the subtree over positions lo .. hi - 1
+             has its splitting point at the middle position, splitting on
+             whichever axis spreads widest, with the lower half to its left.
+             Ranges of LEAF_SIZE points or fewer are scanned directly.
+
+             - Nearest & k-nearest: descend the near side first, visiting
+               the far side only if the splitting line is closer than the
+               current best (expected O(log n)).
+             - Radius: visit every subtree the circle overlaps.
+             - Inserts (logarithmic method): new points wait in a pending
+               list of at most LEAF_SIZE points. A full list is built into a
+               static tree, merging in every smaller-or-equal tree first, so
+               the index holds O(log n) trees of doubling sizes, much as a
+               binary counter carries. Queries search each tree, so stay
+               O(log^2 n) however many points were inserted, and each point
+               is rebuilt O(log n) times, keeping inserts cheap amortised.
+"""
+
+import heapq
+from array import array
+from operator import itemgetter
+
+# Ranges this small are scanned instead of split; also the pending list's cap
+LEAF_SIZE = 8
+
+
+class _KDTree:
+  """
+  Static k-d tree:
+  names:    Point names in tree order
+  xs, ys:   Coordinates in tree order
+  axes:     Split axis (0 = x, 1 = y) at each internal node's middle position
+  """
+  def __init__(self, points):
+    points = [(x, y, name) for name, x, y in points]
+    self.axes = bytearray(len(points))
+
+    stack = [(0, len(points))]
+    while stack:
+      lo, hi = stack.pop()
+      if hi - lo <= LEAF_SIZE:
+        continue
+
+      # Split on the wider axis at the median
+      xs = [point[0] for point in points[lo:hi]]
+      ys = [point[1] for point in points[lo:hi]]
+      axis = 0 if max(xs) - min(xs) >= max(ys) - min(ys) else 1
+      points[lo:hi] = sorted(points[lo:hi], key=itemgetter(axis))
+      mid = (lo + hi) // 2
+      self.axes[mid] = axis
+      stack.append((lo, mid))
+      stack.append((mid + 1, hi))
+
+    self.xs = array("d", (point[0] for point in points))
+    self.ys = array("d", (point[1] for point in points))
+    self.names = [point[2] for point in points]
+
+  def __len__(self):
+    return len(self.names)
+
+  def points(self):
+    """Every (name, x, y) in the tree"""
+    return list(zip(self.names, self.xs, self.ys))
+
+  def nearest(self, x, y, best_name, best):
+    """Nearest point as (name, squared distance), if closer than the best so far"""
+    xs, ys, axes, names = self.xs, self.ys, self.axes, self.names
+    stack = [(0, len(names), 0.0)]
+    while stack:
+      lo, hi, bound = stack.pop()
+      if bound >= best:
+        continue
+
+      # Leaf: scan every point
+      if hi - lo <= LEAF_SIZE:
+        for i in range(lo, hi):
+          distance = (xs[i] - x) ** 2 + (ys[i] - y) ** 2
+          if distance < best:
+            best, best_name = distance, names[i]
+        continue
+
+      mid = (lo + hi) // 2
+      distance = (xs[mid] - x) ** 2 + (ys[mid] - y) ** 2
+      if distance < best:
+        best, best_name = distance, names[mid]
+
+      # Far side first on the stack, so the near side is searched first
+      offset = (x - xs[mid]) if axes[mid] == 0 else (y - ys[mid])
+      if offset < 0:
+        stack.append((mid + 1, hi, offset * offset))
+        stack.append((lo, mid, 0.0))
+      else:
+        stack.append((lo, mid, offset * offset))
+        stack.append((mid + 1, hi, 0.0))
+
+    return best_name, best
+
+  def k_nearest(self, x, y, k, heap, consider):
+    """Offer the tree's candidates to consider, pruning on the heap's kth best"""
+    xs, ys, axes, names = self.xs, self.ys, self.axes, self.names
+    stack = [(0, len(names), 0.0)]
+    while stack:
+      lo, hi, bound = stack.pop()
+      if len(heap) == k and bound >= -heap[0][0]:
+        continue
+
+      if hi - lo <= LEAF_SIZE:
+        for i in range(lo, hi):
+          consider(names[i], (xs[i] - x) ** 2 + (ys[i] - y) ** 2)
+        continue
+
+      mid = (lo + hi) // 2
+      consider(names[mid], (xs[mid] - x) ** 2 + (ys[mid] - y) ** 2)
+      offset = (x - xs[mid]) if axes[mid] == 0 else (y - ys[mid])
+      if offset < 0:
+        stack.append((mid + 1, hi, offset * offset))
+        stack.append((lo, mid, 0.0))
+      else:
+        stack.append((lo, mid, offset * offset))
+        stack.append((mid + 1, hi, 0.0))
+
+  def within(self, x, y, radius, found):
+    """Append (squared distance, name) for every point within radius"""
+    limit = radius * radius
+    xs, ys, axes, names = self.xs, self.ys, self.axes, self.names
+    stack = [(0, len(names))]
+    while stack:
+      lo, hi = stack.pop()
+      if hi - lo <= LEAF_SIZE:
+        for i in range(lo, hi):
+          distance = (xs[i] - x) ** 2 + (ys[i] - y) ** 2
+          if distance <= limit:
+            found.append((distance, names[i]))
+        continue
+
+      mid = (lo + hi) // 2
+      distance = (xs[mid] - x) ** 2 + (ys[mid] - y) ** 2
+      if distance <= limit:
+        found.append((distance, names[mid]))
+
+      # Visit each side the circle reaches
+      offset = (x - xs[mid]) if axes[mid] == 0 else (y - ys[mid])
+      if offset <= radius:
+        stack.append((lo, mid))
+      if offset >= -radius:
+        stack.append((mid + 1, hi))
+
+
+class SpatialIndex:
+  """
+  Spatial Index Class:
+  trees:    Static k-d trees, largest first, each at most half the one before
+  pending:  (name, x, y) inserted since the last build, at most LEAF_SIZE
+  """
+  def __init__(self, points=()):
+    points = list(points)
+    self.trees = [_KDTree(points)] if points else []
+    self.pending = []
+
+  @classmethod
+  def from_graph(cls, graph):
+    """Index every vertex of a DirectedWeightedGraph by its x & y"""
+    return cls((vertex.name, vertex.x, vertex.y) for vertex in graph.vertex_map.values())
+
+  def __len__(self):
+    return sum(len(tree) for tree in self.trees) + len(self.pending)
+
+  def insert(self, name, x, y):
+    """Add a point, building the pending list into a tree once it is full"""
+    self.pending.append((name, x, y))
+    if len(self.pending) < LEAF_SIZE:
+      return
+
+    # Carry: merge every tree no bigger than the points gathered so far
+    points = self.pending
+    while self.trees and len(self.trees[-1]) <= len(points):
+      points += self.trees.pop().points()
+    self.trees.append(_KDTree(points))
+    self.pending = []
+
+  # ================== Queries ================== #
+  def _nearest(self, x, y):
+    """Nearest point as (name, squared distance)"""
+    best_name, best = None, float("inf")
+    for name, px, py in self.pending:
+      distance = (px - x) ** 2 + (py - y) ** 2
+      if distance < best:
+        best, best_name = distance, name
+    for tree in self.trees:
+      best_name, best = tree.nearest(x, y, best_name, best)
+    return best_name, best
+
+  def nearest(self, x, y):
+    """Closest point to (x, y): returns (name, distance), or (None, inf) if empty"""
+    name, distance = self._nearest(x, y)
+    return name, distance ** 0.5
+
+  def k_nearest(self, x, y, k):
+    """Up to k closest points as [(name, distance), ...], closest first"""
+    if k <= 0:
+      return []
+
+    # Max-heap of the k best by negated squared distance; order breaks ties
+    heap = []
+    order = 0
+
+    def consider(name, distance):
+      nonlocal order
+      order += 1
+      if len(heap) < k:
+        heapq.heappush(heap, (-distance, -order, name))
+      elif distance < -heap[0][0]:
+        heapq.heapreplace(heap, (-distance, -order, name))
+
+    for name, px, py in self.pending:
+      consider(name, (px - x) ** 2 + (py - y) ** 2)
+    for tree in self.trees:
+      tree.k_nearest(x, y, k, heap, consider)
+
+    result = sorted((-distance, -order, name) for distance, order, name in heap)
+    return [(name, distance ** 0.5) for distance, _, name in result]
+
+  def within(self, x, y, radius):
+    """Every point within radius of (x, y) as [(name, distance), ...], closest first"""
+    limit = radius * radius
+    found = [(distance, name) for name, px, py in self.pending
+             if (distance := (px - x) ** 2 + (py - y) ** 2) <= limit]
+    for tree in self.trees:
+      tree.within(x, y, radius, found)
+
+    found.sort(key=lambda item: item[0])
+    return [(name, distance ** 0.5) for distance, name in found]
+
+  # ================== Batch Queries ================== #
+  def nearest_many(self, points):
+    """Nearest point to each (x, y) as [(name, distance), ...] in input order"""
+    nearest = self._nearest
+    result = []
+    for x, y in points:
+      name, distance = nearest(x, y)
+      result.append((name, distance ** 0.5))
+    return result
+
+  def k_nearest_many(self, points, k):
+    """k nearest points to each (x, y), as lists in input order"""
+    return [self.k_nearest(x, y, k) for x, y in points]
+
+  def within_many(self, points, radius):
+    """Points within radius of each (x, y), as lists in input order"""
+    return [self.within(x, y, radius) for x, y in points]
@@ -0,0 +1,179 @@
+"""
+Vectorized Frontier Shortest Paths
+
+Description: NumPy engine for bulk single-source shortest paths on a frozen
+             CSR graph. Rather than relaxing one edge at a time, all outgoing
+             edges of a whole frontier are relaxed together:
+
+             1. Gather:   Expand the frontier's CSR ranges into one array of
+                          edge indices, then gather tails, heads & weights.
+             2. Relax:    Reduce candidate distances into the distance array
+                          with np.minimum.at, which keeps the smallest
+                          candidate when a head appears more than once.
+             3. Advance:  Vertices whose distance dropped become active.
+
+             Frontiers are taken in buckets of width delta (bucketed
+             Dijkstra): only active vertices below the current bucket's
+             upper bound are relaxed. delta=inf relaxes every active vertex
+             each round, giving Bellman-Ford/SPFA style rounds.
+
+             Distances equal those of the heap based searches exactly: both
+             reach the same fixed point d[v] = min(d[u] + w) over in-edges.
+             Requires NumPy.
+"""
+
+try:
+  import numpy as np
+except ImportError:
+  np = None
+
+
+def _require_numpy():
+  """Raise a clear error when the optional NumPy dependency is missing"""
+  if np is None:
+    raise ImportError("algorithms.vectorized_sssp requires NumPy: pip install numpy")
+
+
+def _csr_arrays(csr):
+  """Zero copy NumPy views of the CSR offsets, targets & weights"""
+  return (np.asarray(csr.offsets, dtype=np.int64),
+          np.asarray(csr.targets, dtype=np.int32),
+          np.asarray(csr.weights, dtype=np.float64))
+
+
+def _frontier_search(csr, source, delta, goal=-1):
+  """
+  Label correcting search over dense ids: (distance, parent, expanded_nodes)
+
+  With a goal the search stops once no active vertex could still improve
+  the goal's distance.
+  """
+  offsets, targets, weights = _csr_arrays(csr)
+  vertex_count = csr.vertex_count
+
+  distance = np.full(vertex_count, np.inf)
+  parent = np.full(vertex_count, -1, dtype=np.int64)
+  active = np.zeros(vertex_count, dtype=bool)
+  distance[source] = 0.0
+  active[source] = True
+  expanded_nodes = 0
+
+  # Begin Main Loop: Relax the active vertices of the lowest bucket
+  while True:
+    active_ids = np.flatnonzero(active)
+    if active_ids.size == 0:
+      break
+
+    active_distance = distance[active_ids]
+    lowest = active_distance.min()
+
+    # Edges are non-negative, so the goal is final once nothing active is closer
+    if goal != -1 and distance[goal] <= lowest:
+      break
+
+    # Bucket upper bound, never below the closest active vertex
+    boundary = max((np.floor(lowest / delta) + 1) * delta, np.nextafter(lowest, np.inf))
+    frontier = active_ids[active_distance < boundary]
+    active[frontier] = False
+    expanded_nodes += frontier.size
+
+    # Gather: edge index ranges [offsets[u], offsets[u + 1]) for every u
+    starts = offsets[frontier]
+    counts = offsets[frontier + 1] - starts
+    total = int(counts.sum())
+    if total == 0:
+      continue
+
+    range_starts = np.cumsum(counts) - counts
+    edges = np.repeat(starts - range_starts, counts) + np.arange(total)
+    heads = targets[edges]
+    tails = np.repeat(frontier, counts)
+    candidates = distance[tails] + weights[edges]
+
+    # Only candidates that beat the current distance can matter
+    improving = candidates < distance[heads]
+    if not improving.any():
+      continue
+    heads = heads[improving]
+    tails = tails[improving]
+    candidates = candidates[improving]
+
+    # Relax: smallest candidate per head, then record a tail achieving it
+    np.minimum.at(distance, heads, candidates)
+    winners = candidates == distance[heads]
+    parent[heads[winners]] = tails[winners]
+    active[heads] = True
+
+  return distance, parent, expanded_nodes
+
+
+def _prepare(graph, delta):
+  """Frozen CSR graph & bucket width for a DirectedWeightedGraph or CSRGraph"""
+  _require_numpy()
+  csr = graph if hasattr(graph, "offsets") else graph.to_csr()
+  if delta is None:
+    edge_count = csr.edge_count
+    delta = float(np.asarray(csr.weights, dtype=np.float64).mean()) if edge_count else 1.0
+  return csr, max(delta, 1e-12)
+
+
+def frontier_shortest_path_tree(graph, source_vertex, delta=None):
+  """
+  Full single-source shortest paths: returns (distance, parent) maps like
+  DirectedWeightedGraph.shortest_path_tree
+
+  delta:  Bucket width, defaults to the mean edge weight. float("inf")
+          gives Bellman-Ford rounds over the whole active set.
+
+  Between equally short routes the parent chosen may differ from Dijkstra's.
+  """
+  csr, delta = _prepare(graph, delta)
+  if source_vertex not in csr.ids:
+    return {}, {}
+
+  distance, parent, _ = _frontier_search(csr, csr.ids[source_vertex], delta)
+
+  # Translate dense ids back to vertex names
+  names = csr.names
+  reached = np.flatnonzero(np.isfinite(distance))
+  result_distance = {}
+  result_parent = {}
+  for v, v_distance, u in zip(reached.tolist(), distance[reached].tolist(),
+                              parent[reached].tolist()):
+    result_distance[names[v]] = v_distance
+    result_parent[names[v]] = names[u] if u != -1 else None
+
+  return result_distance, result_parent
+
+
+def frontier_shortest_path(graph, start_vertex, goal_vertex, delta=None):
+  """
+  Shortest path: returns (path, distance, expanded_nodes) like
+  DirectedWeightedGraph.dijkstras_algorithm
+
+  expanded_nodes counts vertex relaxations, so a vertex improved after it
+  was relaxed is counted again.
+  """
+  csr, delta = _prepare(graph, delta)
+
+  # Check start & goal vertices exist
+  if start_vertex not in csr.ids or goal_vertex not in csr.ids:
+    return None, float("inf"), 0
+
+  goal = csr.ids[goal_vertex]
+  distance, parent, expanded_nodes = _frontier_search(csr, csr.ids[start_vertex], delta, goal)
+
+  # If goal not reached, return
+  if distance[goal] == np.inf:
+    return None, float("inf"), expanded_nodes
+
+  path = []
+  current = goal
+
+  # Rebuild path to start
+  while current != -1:
+    path.append(csr.names[current])
+    current = int(parent[current])
+  path.reverse()
+
+  return path, float(distance[goal]), expanded_nodes
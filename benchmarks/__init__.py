@@ -0,0 +1,4 @@
+"""
+Benchmarks: standalone comparison scripts (bench_*.py) & the regression
+suite (python -m benchmarks.suite) over seeded synthetic workloads
+"""
@@ -0,0 +1,103 @@
+"""
+Benchmark: Heap-driven Dijkstra vs the original linear-scan Dijkstra
+
+Builds a seeded 4-connected grid graph and times a batch of random
+start/goal queries with both implementations.
+
+Usage: python benchmarks/bench_dijkstra.py [grid_side] [queries]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from algorithms.pathfinding import DirectedWeightedGraph
+
+
+def build_grid_graph(side, seed=0):
+  """Grid graph with random weights no shorter than the Euclidean step"""
+  rng = random.Random(seed)
+  graph = DirectedWeightedGraph()
+
+  for row in range(side):
+    for col in range(side):
+      graph.add_vertex(row * side + col, col, row)
+
+  for row in range(side):
+    for col in range(side):
+      u_name = row * side + col
+      for d_row, d_col in ((0, 1), (1, 0), (0, -1), (-1, 0)):
+        n_row, n_col = row + d_row, col + d_col
+        if 0 <= n_row < side and 0 <= n_col < side:
+          graph.add_edge(u_name, n_row * side + n_col, 1.0 + rng.random())
+
+  return graph
+
+
+def linear_scan_dijkstra(graph, start_vertex, goal_vertex):
+  """Original O(V^2) Dijkstra: linear scan of the candidate set, no early exit"""
+  distance = {vertex: float("inf") for vertex in graph.vertex_map}
+  parent = {vertex: None for vertex in graph.vertex_map}
+  candidate_set = set(graph.vertex_map)
+  distance[start_vertex] = 0
+  expanded_nodes = 0
+
+  while candidate_set:
+    shortest_vertex = None
+    shortest_distance = float("inf")
+    for candidate in candidate_set:
+      if distance[candidate] < shortest_distance:
+        shortest_distance = distance[candidate]
+        shortest_vertex = candidate
+
+    if shortest_vertex is None:
+      break
+
+    candidate_set.remove(shortest_vertex)
+    expanded_nodes += 1
+
+    for v_name, weight in graph.vertex_map[shortest_vertex].neighbour_links.items():
+      if v_name in candidate_set:
+        new_distance = distance[shortest_vertex] + weight
+        if new_distance < distance[v_name]:
+          distance[v_name] = new_distance
+          parent[v_name] = shortest_vertex
+
+  return distance[goal_vertex], expanded_nodes
+
+
+def main():
+  side = int(sys.argv[1]) if len(sys.argv) > 1 else 60
+  queries = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+  graph = build_grid_graph(side)
+  rng = random.Random(1)
+  pairs = [(rng.randrange(side * side), rng.randrange(side * side)) for _ in range(queries)]
+
+  print(f"Grid {side}x{side}: {side * side} vertices, {queries} queries")
+
+  begin = time.perf_counter()
+  baseline = [linear_scan_dijkstra(graph, s, g) for s, g in pairs]
+  linear_time = time.perf_counter() - begin
+
+  begin = time.perf_counter()
+  results = [graph.dijkstras_algorithm(s, g) for s, g in pairs]
+  heap_time = time.perf_counter() - begin
+
+  # Both implementations must agree on every distance
+  for (old_distance, _), (_, new_distance, _) in zip(baseline, results):
+    assert abs(old_distance - new_distance) < 1e-9
+
+  old_expanded = sum(expanded for _, expanded in baseline)
+  new_expanded = sum(expanded for _, _, expanded in results)
+
+  print(f"Linear scan: {linear_time:.3f}s ({old_expanded} expanded)")
+  print(f"Binary heap: {heap_time:.3f}s ({new_expanded} expanded)")
+  print(f"Speedup:     {linear_time / heap_time:.1f}x")
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,88 @@
+"""
+Benchmark: Direction-optimizing BFS vs top-down BFS on power-law graphs
+
+Builds a seeded Barabasi-Albert preferential attachment graph, whose few
+high degree hubs give the huge middle frontiers of social networks, then
+times Breadth_First_Search (output discarded), the lazy bfs generator and
+direction_optimizing_bfs, checking all agree on the depth of every vertex.
+
+Usage: python benchmarks/bench_direction_optimizing_bfs.py [vertices] [edges_per_vertex]
+"""
+
+import contextlib
+import io
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from graphs.adjacency_list import Graph
+
+
+def build_power_law_graph(vertices, edges_per_vertex, seed=0):
+  """Barabasi-Albert graph: each new vertex links to degree-weighted targets"""
+  rng = random.Random(seed)
+  graph = Graph()
+  for name in range(vertices):
+    graph.add_vertex(name)
+
+  # Every edge endpoint appears once, so choice() picks by degree
+  endpoints = list(range(edges_per_vertex + 1))
+  for u_name in range(edges_per_vertex + 1):
+    for v_name in range(u_name):
+      graph.add_edge(u_name, v_name, 1)
+      endpoints += (u_name, v_name)
+
+  for u_name in range(edges_per_vertex + 1, vertices):
+    targets = set()
+    while len(targets) < edges_per_vertex:
+      targets.add(rng.choice(endpoints))
+    for v_name in targets:
+      graph.add_edge(u_name, v_name, 1)
+      endpoints += (u_name, v_name)
+
+  return graph
+
+
+def timed(function):
+  begin = time.perf_counter()
+  result = function()
+  return result, time.perf_counter() - begin
+
+
+def main():
+  vertices = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+  edges_per_vertex = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+
+  graph = build_power_law_graph(vertices, edges_per_vertex)
+  edge_count = sum(len(v.neighbour_links) for v in graph.vertex_map.values()) // 2
+  print(f"Power-law graph: {vertices} vertices, {edge_count} undirected edges")
+
+  # Dense adjacency is built once per graph, time it separately
+  _, build_time = timed(graph._dense_adjacency)
+  print(f"Dense adjacency build:          {build_time:.3f}s (once per graph)")
+
+  def printing_bfs():
+    with contextlib.redirect_stdout(io.StringIO()):
+      graph.Breadth_First_Search(0)
+
+  _, printing_time = timed(printing_bfs)
+  print(f"Breadth_First_Search:           {printing_time:.3f}s")
+
+  expected, generator_time = timed(lambda: {v: d for v, d, _ in graph.bfs(0)})
+  print(f"bfs generator (top-down):       {generator_time:.3f}s")
+
+  (depth, _), optimizing_time = timed(lambda: graph.direction_optimizing_bfs(0))
+  assert depth == expected
+  stats = graph.bfs_stats
+  print(f"direction_optimizing_bfs:       {optimizing_time:.3f}s "
+        f"({generator_time / optimizing_time:.2f}x generator, "
+        f"{printing_time / optimizing_time:.2f}x Breadth_First_Search)")
+  print(f"Levels: {' '.join(stats['directions'])}")
+  print(f"Edges checked: {stats['edges_checked']} of {2 * edge_count}")
+
+
+if __name__ == "__main__":
+  main()
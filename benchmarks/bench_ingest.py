@@ -0,0 +1,79 @@
+"""
+Benchmark: Bulk edge ingestion vs one add_edge call per edge
+
+Generates seeded random (u, v, weight) rows and loads them into both graph
+types three ways: add_edge per row (vertices added first), add_edges_from
+with vertex creation, and from_arrays over parallel columns.
+
+Usage: python benchmarks/bench_ingest.py [vertices] [edges]
+"""
+
+import os
+import random
+import sys
+import time
+from array import array
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from algorithms.pathfinding import DirectedWeightedGraph
+from graphs.adjacency_list import Graph
+
+
+def random_edges(vertices, edges, seed=0):
+  """Parallel u, v & weight columns"""
+  rng = random.Random(seed)
+  u = array("q", (rng.randrange(vertices) for _ in range(edges)))
+  v = array("q", (rng.randrange(vertices) for _ in range(edges)))
+  weight = array("d", (rng.uniform(1, 10) for _ in range(edges)))
+  return u, v, weight
+
+
+def per_call(graph, u, v, weight, directed):
+  for name in range(max(max(u), max(v)) + 1):
+    if directed:
+      graph.add_vertex(name, 0, 0)
+    else:
+      graph.add_vertex(name)
+  for row in zip(u, v, weight):
+    graph.add_edge(*row)
+  return graph
+
+
+def report(label, edges, seconds, baseline=None):
+  speedup = f" ({baseline / seconds:.2f}x per-call)" if baseline else ""
+  print(f"  {label:<16} {seconds:7.3f}s  {edges / seconds / 1e6:6.2f}M edges/s{speedup}")
+
+
+def main():
+  vertices = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+  edges = int(sys.argv[2]) if len(sys.argv) > 2 else 1000000
+  u, v, weight = random_edges(vertices, edges)
+  rows = list(zip(u, v, weight))
+  print(f"{edges} random edges over {vertices} vertices")
+
+  for label, cls, directed in (("DirectedWeightedGraph", DirectedWeightedGraph, True),
+                               ("Graph", Graph, False)):
+    print(label)
+    begin = time.perf_counter()
+    expected = per_call(cls(), u, v, weight, directed)
+    baseline = time.perf_counter() - begin
+    report("add_edge", edges, baseline)
+
+    begin = time.perf_counter()
+    graph = cls()
+    summary = graph.add_edges_from(rows, create_vertices=True)
+    report("add_edges_from", edges, time.perf_counter() - begin, baseline)
+
+    begin = time.perf_counter()
+    graph, summary = cls.from_arrays(u, v, weight)
+    report("from_arrays", edges, time.perf_counter() - begin, baseline)
+
+    # Every endpoint was created & every row kept
+    assert summary["rows"] == edges and summary["dropped"] == 0
+    assert summary["vertices_created"] <= len(expected.vertex_map)
+    print(f"  summary: {summary['added']} added, {summary['duplicates']} duplicates")
+
+
+if __name__ == "__main__":
+  main()
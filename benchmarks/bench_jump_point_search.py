@@ -0,0 +1,72 @@
+"""
+Benchmark: Jump Point Search vs A* on an open occupancy grid
+
+Builds a seeded grid with scattered rectangular obstacles, then runs the
+same random start/goal queries with astar_algorithm on the explicit graph
+& jump_point_search on the bitmap grid, checking both find equal costs.
+
+Usage: python benchmarks/bench_jump_point_search.py [side] [queries]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from algorithms.occupancy_grid import OccupancyGrid
+
+
+def build_open_grid(side, seed=0):
+  """Square grid with a few dozen wall rectangles covering ~10% of cells"""
+  rng = random.Random(seed)
+  grid = OccupancyGrid(side, side)
+  for _ in range(side // 8):
+    width, height = rng.randint(1, side // 10), rng.randint(1, side // 10)
+    left, top = rng.randrange(side - width), rng.randrange(side - height)
+    for y in range(top, top + height):
+      for x in range(left, left + width):
+        grid.block(x, y)
+  return grid
+
+
+def main():
+  side = int(sys.argv[1]) if len(sys.argv) > 1 else 512
+  queries = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+  rng = random.Random(1)
+
+  grid = build_open_grid(side)
+  graph = grid.to_graph()
+  print(f"{side}x{side} grid: bitmap {grid.memory_usage()} bytes, "
+        f"explicit graph {len(graph.vertex_map)} vertices")
+
+  pairs = []
+  while len(pairs) < queries:
+    start = (rng.randrange(side), rng.randrange(side))
+    goal = (rng.randrange(side), rng.randrange(side))
+    if grid.is_free(*start) and grid.is_free(*goal):
+      pairs.append((start, goal))
+
+  totals = {"astar": [0.0, 0], "jps": [0.0, 0]}
+  for (sx, sy), (gx, gy) in pairs:
+    begin = time.perf_counter()
+    _, astar_distance, expanded = graph.astar_algorithm(sy * side + sx, gy * side + gx)
+    totals["astar"][0] += time.perf_counter() - begin
+    totals["astar"][1] += expanded
+
+    begin = time.perf_counter()
+    _, jps_distance, expanded = grid.jump_point_search((sx, sy), (gx, gy))
+    totals["jps"][0] += time.perf_counter() - begin
+    totals["jps"][1] += expanded
+
+    assert abs(astar_distance - jps_distance) <= 1e-9 * max(1.0, astar_distance)
+
+  for label, (seconds, expanded) in totals.items():
+    print(f"  {label:<6} {seconds / queries * 1e3:9.2f} ms/query  {expanded / queries:10.1f} expanded/query")
+  print(f"  JPS expands {totals['astar'][1] / max(totals['jps'][1], 1):.0f}x fewer nodes, "
+        f"{totals['astar'][0] / totals['jps'][0]:.1f}x faster")
+
+
+if __name__ == "__main__":
+  main()
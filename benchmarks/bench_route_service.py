@@ -0,0 +1,62 @@
+"""
+Benchmark: Route service throughput against one search per request
+
+Starts a RouteService on localhost over a seeded grid graph, then drives
+it with the bundled load generator: requests drawn from a few popular
+sources, 64 kept outstanding over 4 connections. For comparison, a sample
+of the same requests is answered inline with dijkstras_algorithm, one
+search each, as an on-loop server would.
+
+Usage: python benchmarks/bench_route_service.py [edges] [requests] [workers]
+"""
+
+import asyncio
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from algorithms.pathfinding import DirectedWeightedGraph
+from algorithms.route_service import RouteService, generate_load
+from benchmarks.workloads import grid
+
+
+async def run(graph, requests, workers, batch_window):
+  async with RouteService(graph, workers=workers, batch_window=batch_window) as service:
+    result = await generate_load(service.address, graph.vertex_map, requests)
+    return result, service.stats
+
+
+def main():
+  edges = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+  requests = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+  workers = int(sys.argv[3]) if len(sys.argv) > 3 else None
+
+  coordinates, rows = grid(edges)
+  graph = DirectedWeightedGraph()
+  for v, (x, y) in enumerate(coordinates):
+    graph.add_vertex(v, x, y)
+  graph.add_edges_from(rows)
+  print(f"Grid graph: {len(coordinates)} vertices, {len(rows)} edges, {requests} route requests")
+
+  result, stats = asyncio.run(run(graph, requests, workers, batch_window=0.002))
+  print(f"  service       {result['requests_per_second']:8.1f} req/s  "
+        f"p50 {result['p50'] * 1e3:7.1f}ms  p99 {result['p99'] * 1e3:7.1f}ms  "
+        f"{stats['searches']} searches, outcomes {result['outcomes']}")
+
+  # Same request mix, one full search per request (sampled)
+  rng = random.Random(0)
+  sources = rng.sample(list(graph.vertex_map), 8)
+  sample = [(rng.choice(sources), rng.randrange(len(coordinates))) for _ in range(min(requests, 100))]
+  began = time.perf_counter()
+  for source, target in sample:
+    graph.dijkstras_algorithm(source, target)
+  per_request = (time.perf_counter() - began) / len(sample)
+  print(f"  per request   {1 / per_request:8.1f} req/s  (inline dijkstras_algorithm, "
+        f"{result['requests_per_second'] * per_request:.1f}x slower than the service)")
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,65 @@
+"""
+Benchmark: k-d tree nearest vertex snapping vs a linear scan of vertex_map
+
+Adds seeded random vertices to a DirectedWeightedGraph, then snaps random
+query points with a linear scan & with the spatial index, checking both
+find equally close vertices. Also times add_vertex with the index live.
+
+Usage: python benchmarks/bench_spatial_index.py [vertices] [queries]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from algorithms.pathfinding import DirectedWeightedGraph
+
+
+def linear_nearest(graph, x, y):
+  """Closest vertex by scanning every vertex"""
+  best = min(graph.vertex_map.values(), key=lambda v: (v.x - x) ** 2 + (v.y - y) ** 2)
+  return best.name, ((best.x - x) ** 2 + (best.y - y) ** 2) ** 0.5
+
+
+def main():
+  vertices = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+  queries = int(sys.argv[2]) if len(sys.argv) > 2 else 20000
+  rng = random.Random(0)
+  side = vertices ** 0.5 * 10
+
+  graph = DirectedWeightedGraph()
+  for name in range(vertices):
+    graph.add_vertex(name, rng.uniform(0, side), rng.uniform(0, side))
+  points = [(rng.uniform(0, side), rng.uniform(0, side)) for _ in range(queries)]
+
+  begin = time.perf_counter()
+  graph.build_spatial_index()
+  print(f"{vertices} vertices: index built in {time.perf_counter() - begin:.2f}s")
+
+  # The linear scan is slow: time it on a sample of the queries
+  sample = points[:max(1, queries // 200)]
+  begin = time.perf_counter()
+  expected = [linear_nearest(graph, x, y) for x, y in sample]
+  linear = (time.perf_counter() - begin) / len(sample)
+
+  begin = time.perf_counter()
+  snapped = graph.spatial_index.nearest_many(points)
+  indexed = (time.perf_counter() - begin) / queries
+
+  for (_, distance), (_, expected_distance) in zip(snapped, expected):
+    assert distance == expected_distance
+  print(f"  linear scan  {linear * 1e6:10.1f} us/query")
+  print(f"  k-d tree     {indexed * 1e6:10.1f} us/query ({linear / indexed:.0f}x)")
+
+  # Inserts through add_vertex keep the index current
+  begin = time.perf_counter()
+  for name in range(vertices, vertices + queries):
+    graph.add_vertex(name, rng.uniform(0, side), rng.uniform(0, side))
+  print(f"  add_vertex   {(time.perf_counter() - begin) / queries * 1e6:10.1f} us/vertex with the index live")
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,315 @@
+"""
+Benchmark Suite: every search entry point over seeded synthetic workloads
+
+Builds each workload (see workloads.py) at each target edge count, times
+every entry point below over a fixed set of seeded start/goal queries & the
+read_graph loader over a written graph file, then writes JSON results with
+a scaling exponent per workload & entry point (slope of log time against
+log edges: ~1 is linear).
+
+Results hold per-call seconds, best of --repeats batches. A calibration
+loop is timed alongside, so a stored baseline from another machine is
+compared after scaling by the two calibration times. The run fails (exit
+status 1) when any entry point slowed by more than --threshold.
+
+Usage:
+  python -m benchmarks.suite --sizes 1000,10000 --output results.json
+  python -m benchmarks.suite --baseline results.json --threshold 0.25
+  python -m benchmarks.suite --full   (1K to 10M edges: hours & many GB)
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from algorithms.contraction_hierarchy import ContractionHierarchy
+from algorithms.delta_stepping import delta_stepping
+from algorithms.landmarks import LandmarkIndex
+from algorithms.pathfinding import DirectedWeightedGraph
+from algorithms.vectorized_sssp import frontier_shortest_path, np
+from benchmarks.workloads import WORKLOADS, generate, query_pairs, write_graph_file
+from graphs.adjacency_list import Graph
+
+DEFAULT_SIZES = (1000, 10000, 100000)
+FULL_SIZES = (1000, 10000, 100000, 1000000, 10000000)
+
+# Timings below this many seconds per batch are too noisy to flag
+MIN_COMPARED_SECONDS = 1e-3
+
+
+# ============ Workload Setup (untimed) ============ #
+def _cached(context, key, build):
+  """Build a shared fixture once per workload & size"""
+  if key not in context:
+    context[key] = build(context)
+  return context[key]
+
+
+def _directed(context):
+  def build(context):
+    graph = DirectedWeightedGraph()
+    for v, (x, y) in enumerate(context["coordinates"]):
+      graph.add_vertex(v, x, y)
+    graph.add_edges_from(context["edges"])
+    return graph
+  return _cached(context, "directed", build)
+
+
+def _undirected(context):
+  def build(context):
+    graph = Graph()
+    graph.add_edges_from(context["edges"], create_vertices=True)
+    return graph
+  return _cached(context, "undirected", build)
+
+
+def _csr(context):
+  return _cached(context, "csr", lambda context: _directed(context).to_csr())
+
+
+def _graph_file(context):
+  def build(context):
+    filename = os.path.join(context["directory"], "graph.txt")
+    write_graph_file(filename, context["coordinates"], context["edges"])
+    return filename
+  return _cached(context, "graph_file", build)
+
+
+def _landmarks(context):
+  return _cached(context, "landmarks", lambda context: LandmarkIndex.build(_directed(context)))
+
+
+def _hierarchy(context):
+  return _cached(context, "hierarchy", lambda context: ContractionHierarchy.build(_directed(context)))
+
+
+def _landmark_search(context):
+  graph = _directed(context)
+  heuristic = _landmarks(context).heuristic
+  return lambda start, goal: graph.astar_algorithm(start, goal, heuristic)
+
+
+# ============ Entry Points ============ #
+def _requires_numpy():
+  return np is not None
+
+
+# (name, queries per batch, largest edge count, setup(context) -> target,
+#  call(target, start, goal), available()); queries=1 times one call
+ENTRY_POINTS = (
+  ("read_graph", 1, None, _graph_file,
+   lambda filename, start, goal: DirectedWeightedGraph.read_graph(filename), None),
+  ("dijkstra", 20, None, _directed,
+   lambda graph, start, goal: graph.dijkstras_algorithm(start, goal), None),
+  ("astar", 20, None, _directed,
+   lambda graph, start, goal: graph.astar_algorithm(start, goal), None),
+  ("bidirectional_dijkstra", 20, None, _directed,
+   lambda graph, start, goal: graph.bidirectional_dijkstra(start, goal), None),
+  ("bidirectional_astar", 20, None, _directed,
+   lambda graph, start, goal: graph.bidirectional_astar(start, goal), None),
+  ("longest_path", 5, None, _directed,
+   lambda graph, start, goal: graph.longest_path(start, goal, node_budget=10000), None),
+  ("shortest_path_tree", 2, None, _directed,
+   lambda graph, start, goal: graph.shortest_path_tree(start), None),
+  ("to_csr", 1, None, _directed,
+   lambda graph, start, goal: graph.to_csr(), None),
+  ("csr_dijkstra", 20, None, _csr,
+   lambda csr, start, goal: csr.dijkstras_algorithm(start, goal), None),
+  ("csr_astar", 20, None, _csr,
+   lambda csr, start, goal: csr.astar_algorithm(start, goal), None),
+  ("delta_stepping", 2, None, _csr,
+   lambda csr, start, goal: delta_stepping(csr, start, workers=1), None),
+  ("frontier_shortest_path", 5, None, _csr,
+   lambda csr, start, goal: frontier_shortest_path(csr, start, goal), _requires_numpy),
+  ("landmarks_build", 1, 1000000, _directed,
+   lambda graph, start, goal: LandmarkIndex.build(graph), None),
+  ("landmark_astar", 20, 1000000, _landmark_search,
+   lambda search, start, goal: search(start, goal), None),
+  ("contraction_build", 1, 1000, _directed,
+   lambda graph, start, goal: ContractionHierarchy.build(graph), None),
+  ("contraction_query", 20, 1000, _hierarchy,
+   lambda hierarchy, start, goal: hierarchy.query(start, goal), None),
+  ("bfs", 20, None, _undirected,
+   lambda graph, start, goal: sum(1 for _ in graph.bfs(start, target=goal)), None),
+  ("dfs", 2, None, _undirected,
+   lambda graph, start, goal: sum(1 for _ in graph.dfs(start)), None),
+  ("direction_optimizing_bfs", 2, None, _undirected,
+   lambda graph, start, goal: graph.direction_optimizing_bfs(start), None),
+)
+
+ENTRY_NAMES = tuple(entry[0] for entry in ENTRY_POINTS)
+
+
+# ============ Measurement ============ #
+def calibrate(repeats=5):
+  """Best time of a fixed pure Python dict & arithmetic loop: machine speed"""
+  best = float("inf")
+  for _ in range(repeats):
+    began = time.perf_counter()
+    table = {}
+    for i in range(200000):
+      table[i & 1023] = table.get(i & 1023, 0) + i * 0.5
+    best = min(best, time.perf_counter() - began)
+  return best
+
+
+def time_entry(call, target, pairs, repeats):
+  """Best per-call seconds over repeats batches of pairs"""
+  best = float("inf")
+  for _ in range(repeats):
+    began = time.perf_counter()
+    for start, goal in pairs:
+      call(target, start, goal)
+    best = min(best, time.perf_counter() - began)
+  return best / len(pairs)
+
+
+def scaling_exponent(points):
+  """Least squares slope of log(seconds) against log(edges)"""
+  points = [(math.log(edges), math.log(seconds)) for edges, seconds in points if seconds > 0]
+  if len(points) < 2:
+    return None
+  mean_x = sum(x for x, _ in points) / len(points)
+  mean_y = sum(y for _, y in points) / len(points)
+  spread = sum((x - mean_x) ** 2 for x, _ in points)
+  if spread == 0:
+    return None
+  return sum((x - mean_x) * (y - mean_y) for x, y in points) / spread
+
+
+def run_suite(sizes=DEFAULT_SIZES, workloads=WORKLOADS, entries=ENTRY_NAMES, queries=20,
+              repeats=3, seed=0, log=None):
+  """Time the chosen entry points on every workload & size: returns the results dict"""
+  results = []
+  for workload in workloads:
+    for size in sizes:
+      coordinates, edges = generate(workload, size, seed)
+      pairs = query_pairs(len(coordinates), queries, seed)
+
+      with tempfile.TemporaryDirectory() as directory:
+        context = {"coordinates": coordinates, "edges": edges, "directory": directory}
+        for name, entry_queries, max_edges, setup, call, available in ENTRY_POINTS:
+          if name not in entries or (max_edges is not None and size > max_edges) \
+          or (available is not None and not available()):
+            continue
+
+          target = setup(context)
+          seconds = time_entry(call, target, pairs[:min(entry_queries, queries)], repeats)
+          results.append({
+            "workload": workload,
+            "size": size,
+            "vertices": len(coordinates),
+            "edges": len(edges),
+            "entry": name,
+            "seconds": seconds,
+            "calls": min(entry_queries, queries),
+          })
+          if log is not None:
+            log(f"{workload:<10} {size:>9} {name:<24} {seconds * 1e3:10.3f} ms/call")
+
+  # Scaling curves: per-call seconds against actual edge counts
+  scaling = []
+  for workload in workloads:
+    for name in entries:
+      points = [(result["edges"], result["seconds"]) for result in results
+                if result["workload"] == workload and result["entry"] == name]
+      if points:
+        scaling.append({"workload": workload, "entry": name, "points": points,
+                        "exponent": scaling_exponent(points)})
+
+  return {
+    "python": platform.python_version(),
+    "machine": platform.machine(),
+    "seed": seed,
+    "queries": queries,
+    "repeats": repeats,
+    "calibration_seconds": calibrate(),
+    "results": results,
+    "scaling": scaling,
+  }
+
+
+def compare(current, baseline, threshold=0.25):
+  """
+  Entry points slower than baseline by more than threshold: a list of dicts
+
+  Times are first scaled by the ratio of the two calibration times, and
+  batches faster than MIN_COMPARED_SECONDS in both runs are skipped.
+  """
+  speed = baseline["calibration_seconds"] / current["calibration_seconds"]
+  previous = {(result["workload"], result["size"], result["entry"]): result
+              for result in baseline["results"]}
+
+  regressions = []
+  for result in current["results"]:
+    old = previous.get((result["workload"], result["size"], result["entry"]))
+    if old is None:
+      continue
+    if max(result["seconds"] * result["calls"], old["seconds"] * old["calls"]) < MIN_COMPARED_SECONDS:
+      continue
+
+    ratio = result["seconds"] * speed / old["seconds"] if old["seconds"] > 0 else float("inf")
+    if ratio > 1 + threshold:
+      regressions.append({"workload": result["workload"], "size": result["size"],
+                          "entry": result["entry"], "baseline_seconds": old["seconds"],
+                          "seconds": result["seconds"], "ratio": ratio})
+  return regressions
+
+
+def main(argv=None):
+  parser = argparse.ArgumentParser(description="Benchmark every search entry point")
+  parser.add_argument("--sizes", help="Comma separated target edge counts (default 1e3,1e4,1e5)")
+  parser.add_argument("--full", action="store_true", help="Sizes from 1K up to 10M edges")
+  parser.add_argument("--workloads", default=",".join(WORKLOADS))
+  parser.add_argument("--entries", default=",".join(ENTRY_NAMES))
+  parser.add_argument("--queries", type=int, default=20)
+  parser.add_argument("--repeats", type=int, default=3)
+  parser.add_argument("--seed", type=int, default=0)
+  parser.add_argument("--output", help="Write JSON results to this file")
+  parser.add_argument("--baseline", help="Fail on regressions against these stored results")
+  parser.add_argument("--threshold", type=float, default=0.25,
+                      help="Allowed slowdown fraction before failing (default 0.25)")
+  args = parser.parse_args(argv)
+
+  if args.sizes:
+    sizes = [int(float(size)) for size in args.sizes.split(",")]
+  else:
+    sizes = FULL_SIZES if args.full else DEFAULT_SIZES
+  workloads = args.workloads.split(",")
+  entries = args.entries.split(",")
+  for name in entries:
+    if name not in ENTRY_NAMES:
+      parser.error(f"unknown entry point {name!r}")
+
+  results = run_suite(sizes, workloads, entries, args.queries, args.repeats, args.seed, log=print)
+  for curve in results["scaling"]:
+    if curve["exponent"] is not None:
+      print(f"scaling {curve['workload']:<10} {curve['entry']:<24} time ~ edges^{curve['exponent']:.2f}")
+
+  if args.output:
+    with open(args.output, "w") as file:
+      json.dump(results, file, indent=1)
+
+  if args.baseline:
+    with open(args.baseline) as file:
+      baseline = json.load(file)
+    regressions = compare(results, baseline, args.threshold)
+    for regression in regressions:
+      print(f"REGRESSION {regression['workload']} {regression['size']} {regression['entry']}: "
+            f"{regression['ratio']:.2f}x baseline")
+    if regressions:
+      return 1
+    print(f"No regressions beyond {args.threshold:.0%} against {args.baseline}")
+
+  return 0
+
+
+if __name__ == "__main__":
+  sys.exit(main())
@@ -0,0 +1,140 @@
+"""
+Seeded Synthetic Workloads
+
+Description: Reproducible graphs sized by a target number of directed edges.
+             Every generator returns (coordinates, edges): coordinates[v] is
+             vertex v's (x, y) & edges a list of (u, v, weight) rows. Every
+             weight is at least the Euclidean distance between its ends, so
+             A*'s straight line heuristic stays admissible.
+
+             - grid:       4-connected 2D grid, both directions per step
+             - geometric:  Random points joined to neighbours within a radius
+                           (road-like: local, planar-ish, average degree ~6)
+             - power_law:  Barabasi-Albert preferential attachment (hubs)
+             - dag:        Deep layered DAG, edges only to the next layers
+"""
+
+import random
+
+WORKLOADS = ("grid", "geometric", "power_law", "dag")
+
+
+def grid(edges, seed=0):
+  """Square grid with about edges directed edges, weights in [1, 2)"""
+  rng = random.Random(seed)
+  side = max(2, round((edges / 4) ** 0.5))
+  coordinates = [(col, row) for row in range(side) for col in range(side)]
+  rows = []
+  for row in range(side):
+    for col in range(side):
+      u = row * side + col
+      if col + 1 < side:
+        rows.append((u, u + 1, 1.0 + rng.random()))
+        rows.append((u + 1, u, 1.0 + rng.random()))
+      if row + 1 < side:
+        rows.append((u, u + side, 1.0 + rng.random()))
+        rows.append((u + side, u, 1.0 + rng.random()))
+  return coordinates, rows
+
+
+def geometric(edges, seed=0, degree=6):
+  """Random geometric graph: points within radius r joined both ways"""
+  rng = random.Random(seed)
+  vertices = max(2, edges // degree)
+  side = vertices ** 0.5 # Unit density: radius below gives ~degree neighbours
+  radius = (degree / 3.141592653589793) ** 0.5
+  coordinates = [(rng.uniform(0, side), rng.uniform(0, side)) for _ in range(vertices)]
+
+  # Bin points into radius sized cells, then check the 3x3 cells around each
+  cells = {}
+  for v, (x, y) in enumerate(coordinates):
+    cells.setdefault((int(x // radius), int(y // radius)), []).append(v)
+
+  rows = []
+  for (cx, cy), members in cells.items():
+    for u in members:
+      ux, uy = coordinates[u]
+      for dx in (-1, 0, 1):
+        for dy in (-1, 0, 1):
+          for v in cells.get((cx + dx, cy + dy), ()):
+            if v <= u:
+              continue
+            vx, vy = coordinates[v]
+            length = ((ux - vx) ** 2 + (uy - vy) ** 2) ** 0.5
+            if length <= radius:
+              # Detour factor keeps weights above straight line distance
+              rows.append((u, v, length * (1.0 + 0.3 * rng.random()) + 1e-6))
+              rows.append((v, u, length * (1.0 + 0.3 * rng.random()) + 1e-6))
+  return coordinates, rows
+
+
+def power_law(edges, seed=0, edges_per_vertex=4):
+  """Barabasi-Albert graph, both directions per link, weights in [1, 10)"""
+  rng = random.Random(seed)
+  vertices = max(edges_per_vertex + 2, edges // (2 * edges_per_vertex))
+  # Coordinates span less than 1, the lightest weight, for an admissible A*
+  coordinates = [(rng.uniform(0, 0.7), rng.uniform(0, 0.7)) for _ in range(vertices)]
+  rows = []
+
+  def link(u, v):
+    rows.append((u, v, rng.uniform(1, 10)))
+    rows.append((v, u, rng.uniform(1, 10)))
+
+  # Every edge endpoint appears once, so choice() picks by degree
+  endpoints = []
+  for u in range(edges_per_vertex + 1):
+    for v in range(u):
+      link(u, v)
+      endpoints += (u, v)
+
+  for u in range(edges_per_vertex + 1, vertices):
+    targets = set()
+    while len(targets) < edges_per_vertex:
+      targets.add(rng.choice(endpoints))
+    for v in targets:
+      link(u, v)
+      endpoints += (u, v)
+  return coordinates, rows
+
+
+def dag(edges, seed=0, width=4, fan_out=3):
+  """Layered DAG: each vertex links to fan_out vertices in the next 2 layers"""
+  rng = random.Random(seed)
+  layers = max(2, edges // (width * fan_out))
+  coordinates = [(layer, slot) for layer in range(layers) for slot in range(width)]
+  rows = []
+  for layer in range(layers - 1):
+    for slot in range(width):
+      u = layer * width + slot
+      targets = set()
+      while len(targets) < fan_out:
+        step = 1 if layer + 2 >= layers else rng.choice((1, 1, 2))
+        targets.add((layer + step) * width + rng.randrange(width))
+      for v in sorted(targets):
+        vx, vy = coordinates[v]
+        length = ((vx - layer) ** 2 + (vy - slot) ** 2) ** 0.5
+        rows.append((u, v, length * (1.0 + rng.random())))
+  return coordinates, rows
+
+
+def generate(workload, edges, seed=0):
+  """(coordinates, edges) of a named workload"""
+  if workload not in WORKLOADS:
+    raise ValueError(f"Unknown workload {workload!r}: expected one of {WORKLOADS}")
+  return globals()[workload](edges, seed)
+
+
+def query_pairs(vertices, count, seed=0):
+  """Seeded random (start, goal) vertex pairs"""
+  rng = random.Random(seed)
+  return [(rng.randrange(vertices), rng.randrange(vertices)) for _ in range(count)]
+
+
+def write_graph_file(filename, coordinates, edges, start=0, goal=None):
+  """Write a workload in the text format read by DirectedWeightedGraph.read_graph"""
+  goal = len(coordinates) - 1 if goal is None else goal
+  with open(filename, "w") as file:
+    file.write(f"{len(coordinates)} {len(edges)}\n")
+    file.writelines(f"{v} {x} {y}\n" for v, (x, y) in enumerate(coordinates))
+    file.writelines(f"{u} {v} {weight!r}\n" for u, v, weight in edges)
+    file.write(f"{start} {goal}\n")
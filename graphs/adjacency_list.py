@@ -8,14 +8,36 @@ Description: Based on the idea of storing a list of neighbours for every vertex.
                reachable from vertex "i"
 """
 
+from collections import deque
+
+from graphs.dfs import dfs_events
+
+
+def _recorded(stats, method, start, goal, search):
+  """
+  Yield from search(query) under one SearchStats query, finishing it even
+  when the caller stops the generator early
+  """
+  query = stats.begin(method, start, goal)
+  yielded = 0
+  try:
+    for item in search(query):
+      yielded += 1
+      yield item
+  finally:
+    stats.finish(query, {"yielded": yielded})
+
 # =========== STEP 1: Core Components =========== #
 
 # -------- A: Vertex Class -------- #
 class Vertex:
+  # Fixed attributes: no per-instance __dict__
+  __slots__ = ("name", "neighbour_links")
+
   def __init__(self, name):
     self.name = name
     # Container storing weighted connections leaving this vertex
-    self.neighbour_links = {} # Keys = Neighbour Name, Value = Edge Weight
+    self.neighbour_links = {} # Keys = Neighbour Name (id in compact mode), Value = Edge Weight
 
 
 # -------- B: Queue & Stack Classes -------- #
@@ -24,8 +46,8 @@ class Queue:
   """Queue for BFS (FIFO)"""
   def __init__(self):
 
-    # Initialise Queue
-    self.bfs_queue = []
+    # Initialise Queue: deque gives O(1) removal from the front
+    self.bfs_queue = deque()
 
   # Method to check if queue is empty
   def is_empty(self):
@@ -50,7 +72,7 @@ class Queue:
 
     # If queue contains items: FIFO Removal
     else:
-      return self.bfs_queue.pop(0)
+      return self.bfs_queue.popleft()
 
 # Step 2. Create Stack Class for Depth First Search
 class Stack:
@@ -91,19 +113,96 @@ class Stack:
       return item_value
 
 
-# -------- C: CREATE MAIN GRAPH CLASS -------- #
-class Graph:
-  def __init__(self):
+# -------- C: Disjoint Set Class -------- #
+class DisjointSet:
+  """
+  Disjoint Set (Union-Find) for connected components:
+  parent:  Maps key to its parent key, roots map to themselves
+  rank:    Upper bound on each root's tree height
+
+  With dense=True keys must be added as 0, 1, 2, ... & both maps are lists.
+  Path compression plus union by rank make find & union O(a(n)).
+  """
+  def __init__(self, dense=False):
+    self.parent = [] if dense else {}
+    self.rank = [] if dense else {}
+    self.dense = dense
+    self.count = 0 # Number of components
+
+  def add(self, key):
+    """Add key as a singleton component"""
+    if self.dense:
+      self.parent.append(key)
+      self.rank.append(0)
+    else:
+      self.parent[key] = key
+      self.rank[key] = 0
+    self.count += 1
+
+  def find(self, key):
+    """Root of key's component, pointing the path straight at it"""
+    parent = self.parent
+    root = key
+    while parent[root] != root:
+      root = parent[root]
+
+    # Path compression
+    while parent[key] != root:
+      parent[key], key = root, parent[key]
+    return root
+
+  def union(self, a, b):
+    """Merge the components of a & b: returns False if already joined"""
+    root_a = self.find(a)
+    root_b = self.find(b)
+    if root_a == root_b:
+      return False
+
+    # Union by rank: hang the shallower tree under the deeper one
+    if self.rank[root_a] < self.rank[root_b]:
+      root_a, root_b = root_b, root_a
+    self.parent[root_b] = root_a
+    if self.rank[root_a] == self.rank[root_b]:
+      self.rank[root_a] += 1
+    self.count -= 1
+    return True
+
 
+# -------- D: CREATE MAIN GRAPH CLASS -------- #
+class Graph:
+  def __init__(self, compact=False):
+    """
+    compact:  Intern every name once into a dense integer id. vertex_map
+              becomes a list indexed by id, ids maps name to id & neighbour
+              maps are keyed by id. Methods still take & return names.
+    """
     # Vertex Name (string/int) to actual vertex object
-    self.vertex_map = {}
+    self.vertex_map = [] if compact else {}
+
+    # Compact mode name -> id table (ids -> name via vertex_map[id].name)
+    self.ids = {} if compact else None
+
+    # Connected components, merged as edges are added
+    self.components = DisjointSet(dense=compact)
+
+    # Dense id adjacency for direction optimizing BFS, rebuilt after changes
+    self._dense = None
+
+    # Per level directions & edges checked by the last direction optimizing BFS
+    self.bfs_stats = None
+
+  def _key(self, v_name):
+    """vertex_map key of a name (its id in compact mode), None if missing"""
+    if self.ids is not None:
+      return self.ids.get(v_name)
+    return v_name if v_name in self.vertex_map else None
 
   # Method to add Vertices
   def add_vertex(self, v_name):
     """Add Vertex to Graph"""
 
     # Ensure if v_name already exists, return
-    if v_name in self.vertex_map:
+    if self._key(v_name) is not None:
       return
 
     # Otherwise
@@ -112,105 +211,432 @@ class Graph:
       # Create Vertex Object
       vertex = Vertex(v_name)
 
-      # Add Vertex Object's to vertex_map
-      self.vertex_map[v_name] = vertex
+      # Add Vertex Object's to vertex_map, interning its id in compact mode
+      if self.ids is not None:
+        self.ids[v_name] = len(self.vertex_map)
+        self.vertex_map.append(vertex)
+      else:
+        self.vertex_map[v_name] = vertex
+      self.components.add(self._key(v_name))
+      self._dense = None
 
   def add_edge(self, u_name, v_name, weight):
     """Add Edge to Graph"""
 
-    if u_name not in self.vertex_map or v_name not in self.vertex_map:
+    u_key = self._key(u_name)
+    v_key = self._key(v_name)
+    if u_key is None or v_key is None:
       return
 
     else:
-      u_obj = self.vertex_map[u_name]
-      v_obj = self.vertex_map[v_name]
+      u_obj = self.vertex_map[u_key]
+      v_obj = self.vertex_map[v_key]
 
-      u_obj.neighbour_links[v_name] = weight
-      v_obj.neighbour_links[u_name] = weight
+      u_obj.neighbour_links[v_key] = weight
+      v_obj.neighbour_links[u_key] = weight
+      self.components.union(u_key, v_key)
+      self._dense = None
 
+  def add_edges_from(self, edges, create_vertices=False):
+    """
+    Add many (u, v, weight) edges in one pass: returns a summary dict
 
-  # ================= SEARCH METHODS ================= #
+    edges:            Iterable of (u, v, weight) rows, or an (E, 3) NumPy array
+    create_vertices:  Create unknown endpoints instead of dropping the row
 
-  # 1. Breadth First Search
-  def Breadth_First_Search(self, start_vertex_name):
+    The summary counts rows read, edges added, duplicates (an existing edge,
+    either direction, re-weighted: the last weight wins, as with add_edge),
+    rows dropped for an unknown endpoint & vertices created, with the first
+    dropped rows.
     """
-    Breadth First Search Method:
-    Search are wide as possible on every level
+    if hasattr(edges, "dtype"):
+      # Split the columns: endpoints of a float (E, 3) array stay integer names
+      u, v, weight = edges[:, 0], edges[:, 1], edges[:, 2]
+      if edges.dtype.kind == "f":
+        u, v = u.astype("int64"), v.astype("int64")
+      edges = zip(u.tolist(), v.tolist(), weight.tolist())
+
+    vertex_map = self.vertex_map
+    ids = self.ids
+    union = self.components.union
+    vertices_before = len(vertex_map)
+    rows = duplicates = dropped = 0
+    dropped_sample = []
+
+    for rows, (u_name, v_name, weight) in enumerate(edges, 1):
+      # Same as _key, inlined
+      if ids is not None:
+        u_key = ids.get(u_name)
+        v_key = ids.get(v_name)
+      else:
+        u_key = u_name if u_name in vertex_map else None
+        v_key = v_name if v_name in vertex_map else None
+
+      if u_key is None or v_key is None:
+        if not create_vertices:
+          dropped += 1
+          if len(dropped_sample) < 10:
+            dropped_sample.append((u_name, v_name, weight))
+          continue
+        self.add_vertex(u_name)
+        self.add_vertex(v_name)
+        u_key = self._key(u_name)
+        v_key = self._key(v_name)
+
+      # Same as add_edge
+      u_links = vertex_map[u_key].neighbour_links
+      if v_key in u_links:
+        duplicates += 1
+      u_links[v_key] = weight
+      vertex_map[v_key].neighbour_links[u_key] = weight
+      union(u_key, v_key)
+
+    self._dense = None
+    return {
+      "rows": rows,
+      "added": rows - dropped - duplicates,
+      "duplicates": duplicates,
+      "dropped": dropped,
+      "vertices_created": len(vertex_map) - vertices_before,
+      "dropped_sample": dropped_sample,
+    }
+
+  @classmethod
+  def from_arrays(cls, u, v, weight, compact=False):
     """
+    Build a graph from parallel u, v, weight sequences or NumPy arrays,
+    creating vertices as they appear: returns (graph, summary)
+    """
+    # NumPy columns become Python scalars, so names are plain ints & strs
+    columns = [column.tolist() if hasattr(column, "dtype") else column
+               for column in (u, v, weight)]
+    graph = cls(compact=compact)
+    summary = graph.add_edges_from(zip(*columns), create_vertices=True)
+    return graph, summary
+
+  # ================= COMPONENT METHODS ================= #
+  def connected(self, u_name, v_name):
+    """Check if a path joins u & v: O(a(n)), no traversal"""
+    u_key = self._key(u_name)
+    v_key = self._key(v_name)
+    if u_key is None or v_key is None:
+      return False
+    return self.components.find(u_key) == self.components.find(v_key)
 
-    # Check vertex exists in vertex map
-    if start_vertex_name not in self.vertex_map:
-      return
-
-    # Initialisation
-    else:
-      # Initialise Queue with starting vertex
-      q = Queue()
-      q.enqueue(start_vertex_name)
-
-      # Initialise visitied vertices
-      visited_set = []
-      visited_set.append(start_vertex_name)
+  def component_of(self, v_name):
+    """Representative vertex name of v's component (None if missing)"""
+    v_key = self._key(v_name)
+    if v_key is None:
+      return None
+    return self.vertex_map[self.components.find(v_key)].name
 
-      # STEP A: Begin Main Traversal Loop
-      while not q.is_empty():
+  def component_sizes(self):
+    """Maps each component's representative vertex name to its size"""
+    sizes = {}
+    find = self.components.find
+    keys = range(len(self.vertex_map)) if self.ids is not None else self.vertex_map
+    for key in keys:
+      root = find(key)
+      sizes[root] = sizes.get(root, 0) + 1
+    return {self.vertex_map[root].name: size for root, size in sizes.items()}
 
-        # Get name of the vertex to process next
-        u_name = q.dequeue()
-        # Retrieve actual object for neighbour access
-        u_obj = self.vertex_map[u_name]
 
-        # Print the vertex to show the BFS order
-        print(f"Visited: {u_name}")
+  # ================= SEARCH METHODS ================= #
 
-        for v_name in u_obj.neighbour_links:
+  # 1. Breadth First Search
+  def Breadth_First_Search(self, start_vertex_name, stats=None):
+    """
+    Breadth First Search Method:
+    Search are wide as possible on every level
+    """
 
-          # Step B: Check Visited Set: Check if v_name is the neighbour's name
-          if v_name not in visited_set:
-            # Step C: Mark as Visited and Enqueue
-            # 1. Mark as Visited: Add v_name to the list
-            visited_set.append(v_name)
+    # Print the vertex to show the BFS order
+    for u_name, _, _ in self.bfs(start_vertex_name, stats=stats):
+      print(f"Visited: {u_name}")
 
-            # 2. Enqueue: Add v_name to the Queue for later processing (FIFO)
-            q.enqueue(v_name)
+  def bfs(self, *sources, target=None, max_depth=None, stats=None):
+    """
+    Lazy Breadth First Search: yields (vertex, depth, parent) in BFS order
 
-  def depth_first_search(self, start_vertex_name):
+    sources:    One or more start vertices, all at depth 0
+    target:     Stop once this vertex has been yielded
+    max_depth:  Do not expand vertices beyond this many hops
+    stats:      Optional SearchStats recording the traversal
 
-    print("Longest Path:")
+    Vertices are yielded as they are discovered, so stopping the generator
+    early skips the rest of the traversal. A target in another component
+    than every source yields nothing, without traversing.
+    """
+    if stats is None:
+      return self._bfs(sources, target, max_depth, None)
+
+    def search(query):
+      return self._bfs(sources, target, max_depth, query)
+    return _recorded(stats, "bfs", sources[0] if len(sources) == 1 else sources, target, search)
+
+  def _bfs(self, sources, target, max_depth, query):
+    vertex_map = self.vertex_map
+
+    # Unreachable target: the component index answers without a search
+    if target is not None:
+      target = self._key(target)
+      if target is None:
+        return
+      target_root = self.components.find(target)
+      if not any(self._key(source) is not None
+                 and self.components.find(self._key(source)) == target_root
+                 for source in sources):
+        return
+
+    # Initialise visited set (O(1) checks) & the depth 0 frontier
+    visited_set = set()
+    frontier = []
+    for source in sources:
+      source = self._key(source)
+      if source is not None and source not in visited_set:
+        visited_set.add(source)
+        frontier.append(source)
+        yield vertex_map[source].name, 0, None
+        if source == target:
+          return
+
+    # STEP A: Begin Main Traversal Loop, one level at a time
+    depth = 0
+    while frontier and (max_depth is None or depth < max_depth):
+      depth += 1
+      next_frontier = []
+
+      for index, u_key in enumerate(frontier):
+        u_obj = vertex_map[u_key]
+        if query is not None:
+          query.expand(u_obj.name, depth - 1, len(frontier) - index + len(next_frontier),
+                       len(u_obj.neighbour_links))
+
+        for v_key in u_obj.neighbour_links:
+
+          # Step B: Mark as visited, report & queue for the next level
+          if v_key not in visited_set:
+            visited_set.add(v_key)
+            if query is not None:
+              query.improve(u_obj.name, vertex_map[v_key].name, depth, False)
+            yield vertex_map[v_key].name, depth, u_obj.name
+            if v_key == target:
+              return
+            next_frontier.append(v_key)
+
+      frontier = next_frontier
+
+  def _dense_adjacency(self):
+    """(names, ids, neighbour id lists) over dense ids 0..V-1, cached"""
+    if self._dense is None:
+      # Compact mode ids are already dense
+      if self.ids is not None:
+        names = [vertex.name for vertex in self.vertex_map]
+        adjacency = [list(vertex.neighbour_links) for vertex in self.vertex_map]
+        self._dense = (names, self.ids, adjacency)
+      else:
+        names = list(self.vertex_map)
+        ids = {name: index for index, name in enumerate(names)}
+        adjacency = [[ids[v_name] for v_name in self.vertex_map[name].neighbour_links]
+                     for name in names]
+        self._dense = (names, ids, adjacency)
+    return self._dense
+
+  def direction_optimizing_bfs(self, start_vertex_name, alpha=14, beta=24, stats=None):
+    """
+    Level synchronous BFS switching between top-down & bottom-up steps
+    (Beamer's heuristic): returns (depth, parent) maps by vertex name
 
-    # Check if vertex exists in vertex map
-    if start_vertex_name not in self.vertex_map:
-      return
+    Top-down:   Every frontier vertex checks all its neighbours.
+    Bottom-up:  Every unvisited vertex looks for any neighbour in the
+                frontier bitmap, stopping at the first one found.
 
-    # Initialisation
-    else:
+    Switch to bottom-up once the frontier's edges exceed 1/alpha of the
+    unexplored edges, and back to top-down once the frontier shrinks
+    below 1/beta of the vertices. Edges are undirected, so a vertex's
+    neighbours are also the vertices that can reach it.
 
-      # Create stack and push the start vertex
-      stack = Stack()
-      stack.push(start_vertex_name)
+    stats: Optional SearchStats; each level is timed as a "top-down" or
+           "bottom-up" phase & edge checks count as relaxations
+    """
+    # Check vertex exists in vertex map
+    if self._key(start_vertex_name) is None:
+      return {}, {}
+
+    query = stats.begin("direction_optimizing_bfs", start_vertex_name) if stats is not None else None
+
+    names, ids, adjacency = self._dense_adjacency()
+    vertex_count = len(names)
+    source = ids[start_vertex_name]
+
+    # Parent doubles as the visited check: -1 means unvisited
+    parent = [-1] * vertex_count
+    depth = [-1] * vertex_count
+    parent[source] = source
+    depth[source] = 0
+
+    frontier = [source]
+    unvisited = [v for v in range(vertex_count) if v != source]
+    unexplored_edges = sum(len(neighbours) for neighbours in adjacency) - len(adjacency[source])
+    bottom_up = False
+    directions = []
+    edges_checked = 0
+    level = 0
+
+    # STEP A: Begin Main Loop, one level per iteration
+    while frontier:
+      level += 1
+      frontier_edges = sum(len(adjacency[u]) for u in frontier)
+
+      # Step B: Pick the direction for this level
+      if not bottom_up and frontier_edges > unexplored_edges / alpha:
+        bottom_up = True
+      elif bottom_up and len(frontier) < vertex_count / beta:
+        bottom_up = False
+
+      if query is not None:
+        query.phase("bottom-up" if bottom_up else "top-down")
+        query.expanded += len(frontier)
+        query.pops += len(frontier)
+        query.peak_frontier = max(query.peak_frontier, len(frontier))
+        checked_before = edges_checked
+
+      next_frontier = []
+      if bottom_up:
+        # Frontier bitmap: bit v of byte v >> 3
+        bitmap = bytearray((vertex_count + 7) >> 3)
+        for u in frontier:
+          bitmap[u >> 3] |= 1 << (u & 7)
+
+        # Vertices visited by earlier top-down levels drop out here
+        still_unvisited = []
+        for v in unvisited:
+          if parent[v] != -1:
+            continue
+          for u in adjacency[v]:
+            edges_checked += 1
+            if bitmap[u >> 3] >> (u & 7) & 1:
+              parent[v] = u
+              depth[v] = level
+              next_frontier.append(v)
+              break
+          else:
+            still_unvisited.append(v)
+        unvisited = still_unvisited
+
+      else:
+        edges_checked += frontier_edges
+        for u in frontier:
+          for v in adjacency[u]:
+            if parent[v] == -1:
+              parent[v] = u
+              depth[v] = level
+              next_frontier.append(v)
+
+      if query is not None:
+        query.relaxations += edges_checked - checked_before
+        query.improvements += len(next_frontier)
+        query.pushes += len(next_frontier)
+
+      directions.append("bottom-up" if bottom_up else "top-down")
+      unexplored_edges -= sum(len(adjacency[v]) for v in next_frontier)
+      frontier = next_frontier
+
+    self.bfs_stats = {"directions": directions, "edges_checked": edges_checked}
+    if query is not None:
+      stats.finish(query, {"levels": level, "directions": directions})
+
+    # Translate dense ids back to vertex names
+    depth_map = {}
+    parent_map = {}
+    for v in range(vertex_count):
+      if depth[v] != -1:
+        depth_map[names[v]] = depth[v]
+        parent_map[names[v]] = names[parent[v]] if v != source else None
+
+    return depth_map, parent_map
+
+  # 2. Depth First Search
+  def depth_first_search(self, start_vertex_name, stats=None):
+    """
+    Depth First Search Method:
+    Search as deep as possible before backtracking
+    """
 
-      # Initialise visited vertices
-      visited_set = set()
-      visited_set.add(start_vertex_name)
+    # Print the vertex to show DFS order
+    for event, u_name, _, _, _ in self.dfs(start_vertex_name, stats=stats):
+      if event == "enter":
+        print(f"Visited: {u_name}")
 
-      # Step A: Begin Main Traversal Loop
-      while not stack.is_empty():
-        # Retrieve name of vertex to process next
-        u_name = stack.pop()
-        # Retrieve actual data from the vertex
-        u_obj = self.vertex_map[u_name]
+  def dfs(self, *sources, max_depth=None, non_tree_edges=False, stats=None):
+    """
+    Lazy Depth First Search: yields (event, vertex, other, depth, time)
 
-        # Print the vertex to show DFS order
-        print(f"Visited: {u_name}")
+    "enter"/"exit" events carry the parent as other & the discovery/finish
+    time, "edge" events (non_tree_edges=True) carry the edge's far end.
+    Without sources every vertex is a root in turn. See graphs.dfs.
+    stats: Optional SearchStats, counting each entered vertex as expanded
+    """
+    if stats is None:
+      return self._dfs(sources, max_depth, non_tree_edges, None)
+
+    def search(query):
+      return self._dfs(sources, max_depth, non_tree_edges, query)
+    start = sources[0] if len(sources) == 1 else sources or None
+    return _recorded(stats, "dfs", start, None, search)
+
+  def _dfs(self, sources, max_depth, non_tree_edges, query):
+    vertex_map = self.vertex_map
+    if sources:
+      keys = [key for key in map(self._key, sources) if key is not None]
+    else:
+      keys = range(len(vertex_map)) if self.ids is not None else list(vertex_map)
+
+    def successors(key):
+      return vertex_map[key].neighbour_links
+
+    for event, u_key, other, depth, time in dfs_events(successors, keys, max_depth, non_tree_edges):
+      other_name = vertex_map[other].name if other is not None else None
+      if query is not None and event == "enter":
+        expand = max_depth is None or depth < max_depth
+        edges = len(vertex_map[u_key].neighbour_links) if expand else 0
+        query.expand(vertex_map[u_key].name, depth, depth + 1, edges)
+      yield event, vertex_map[u_key].name, other_name, depth, time
+
+  def has_cycle(self):
+    """Check for a cycle: a non-tree edge other than back to the parent"""
+    parent = {}
+    for event, u_name, other, _, _ in self.dfs(non_tree_edges=True):
+      if event == "enter":
+        parent[u_name] = other
+      elif event == "edge" and other != parent[u_name]:
+        return True
+    return False
+
+  def iterative_deepening_search(self, start_vertex_name, target_vertex_name, max_depth):
+    """
+    Fewest-hop path by depth-limited DFS with caps 0, 1, ... max_depth:
+    returns the path of names, or None
+    """
+    # Different components: no search needed
+    if not self.connected(start_vertex_name, target_vertex_name):
+      return None
 
-        # Iterate through all neighbors of u_obj
-        for v_name in u_obj.neighbour_links:
+    for cap in range(max_depth + 1):
+      path = []
+      cap_reached = False
 
-          # Check if the neighbour is ubvisited
-          if v_name not in visited_set:
+      for event, u_name, _, depth, _ in self.dfs(start_vertex_name, max_depth=cap):
+        if event == "enter":
+          path.append(u_name)
+          if u_name == target_vertex_name:
+            return path
+          cap_reached = cap_reached or depth == cap
+        else:
+          path.pop()
 
-            # Action 1: Mark as visited
-            visited_set.add(v_name) # Use add: O(1)
+      # Whole component explored within the cap: deeper caps find nothing new
+      if not cap_reached:
+        return None
 
-            # Action 2: Add to Stack
-            stack.push(v_name)
+    return None
@@ -0,0 +1,141 @@
+"""
+Iterative Depth First Search Events
+
+Description: Generator DFS for any graph exposed through a successors(u)
+             callable returning u's neighbours. An explicit stack holds one
+             neighbour iterator per open vertex, so there is no recursion
+             limit & each vertex resumes where it left off (true DFS order).
+
+             Events are tuples (event, vertex, other, depth, time):
+
+             - ("enter", v, parent, depth, discovery time)
+             - ("exit",  v, parent, depth, finish time)
+             - ("edge",  u, v, depth of u, current time)  non-tree edge u -> v
+               to an already discovered vertex, only with non_tree_edges=True
+
+             Discovery & finish times share one counter (CLRS timestamps).
+             Cycle detection, topological sort & strongly connected
+             components below each consume a single pass of events.
+"""
+
+
+def dfs_events(successors, sources, max_depth=None, non_tree_edges=False):
+  """
+  Depth first search events from each undiscovered source in turn
+
+  max_depth:  Vertices at this depth are entered but not expanded. A
+              vertex reached again by a shorter path is re-entered, so
+              every vertex within max_depth hops is found (depth-limited
+              search for iterative deepening).
+  """
+  discovered = {} # Vertex -> smallest depth it was entered at
+  time = 0
+
+  for source in sources:
+    if source in discovered:
+      continue
+
+    time += 1
+    discovered[source] = 0
+    yield "enter", source, None, 0, time
+    neighbours = iter(()) if max_depth == 0 else iter(successors(source))
+    stack = [(source, None, 0, neighbours)]
+
+    # Begin Main Loop: Advance the top vertex's neighbour iterator
+    while stack:
+      u, parent, depth, neighbours = stack[-1]
+
+      for v in neighbours:
+        if v not in discovered \
+        or (max_depth is not None and depth + 1 < discovered[v]):
+          # Tree edge: enter v & continue from it
+          time += 1
+          discovered[v] = depth + 1
+          yield "enter", v, u, depth + 1, time
+          expand = max_depth is None or depth + 1 < max_depth
+          stack.append((v, u, depth + 1, iter(successors(v)) if expand else iter(())))
+          break
+
+        if non_tree_edges:
+          yield "edge", u, v, depth, time
+
+      # Neighbours exhausted: finish u
+      else:
+        stack.pop()
+        time += 1
+        yield "exit", u, parent, depth, time
+
+
+def find_cycle(successors, vertices):
+  """Directed cycle as [v, ..., v], or None if the graph is acyclic"""
+  path = []
+  open_set = set()
+
+  for event, u, other, _, _ in dfs_events(successors, vertices, non_tree_edges=True):
+    if event == "enter":
+      path.append(u)
+      open_set.add(u)
+    elif event == "exit":
+      path.pop()
+      open_set.discard(u)
+
+    # Back edge to a vertex still on the path closes a cycle
+    elif other in open_set:
+      return path[path.index(other):] + [other]
+
+  return None
+
+
+def topological_sort(successors, vertices):
+  """Vertices ordered so every edge points forward: reverse finish order"""
+  order = []
+  open_set = set()
+
+  for event, u, other, _, _ in dfs_events(successors, vertices, non_tree_edges=True):
+    if event == "enter":
+      open_set.add(u)
+    elif event == "exit":
+      open_set.discard(u)
+      order.append(u)
+    elif other in open_set:
+      raise ValueError(f"Graph has a cycle through {other!r}: no topological order")
+
+  order.reverse()
+  return order
+
+
+def strongly_connected_components(successors, vertices):
+  """Tarjan's algorithm over DFS events: components in reverse topological order"""
+  index = {}
+  lowlink = {}
+  component_stack = []
+  on_stack = set()
+  components = []
+
+  for event, u, other, _, _ in dfs_events(successors, vertices, non_tree_edges=True):
+    if event == "enter":
+      index[u] = lowlink[u] = len(index)
+      component_stack.append(u)
+      on_stack.add(u)
+
+    elif event == "edge":
+      if other in on_stack and index[other] < lowlink[u]:
+        lowlink[u] = index[other]
+
+    else:
+      # u is a root: pop its component
+      if lowlink[u] == index[u]:
+        component = []
+        while True:
+          v = component_stack.pop()
+          on_stack.discard(v)
+          component.append(v)
+          if v == u:
+            break
+        components.append(component)
+
+      # Pass the lowlink up the tree edge
+      if other is not None and lowlink[u] < lowlink[other]:
+        lowlink[other] = lowlink[u]
+
+  return components
@@ -0,0 +1,49 @@
+"""Seeded random graphs shared by the test modules"""
+
+import random
+
+from algorithms.pathfinding import DirectedWeightedGraph
+
+
+def build_random_graph(vertices, edges, seed, weights=(0.1, 10.0), placed=False,
+                       admissible=False, acyclic=False, graph=None):
+  """
+  Seeded random directed graph over vertices 0 .. vertices - 1
+
+  weights:     (low, high) bounds of each edge weight; integer bounds draw integers
+  placed:      Vertices at random (x, y) in [0, 10) x [0, 10) instead of (0, 0)
+  admissible:  Add the Euclidean distance to each weight, so A* stays exact
+  acyclic:     Keep only edges u -> v with u < v
+  graph:       Empty graph to fill, vertices added by name alone (default: a
+               new DirectedWeightedGraph)
+  """
+  rng = random.Random(seed)
+  low, high = weights
+  draw = rng.randint if isinstance(low, int) and isinstance(high, int) else rng.uniform
+
+  if graph is None:
+    graph = DirectedWeightedGraph()
+    for name in range(vertices):
+      if placed:
+        graph.add_vertex(name, rng.uniform(0, 10), rng.uniform(0, 10))
+      else:
+        graph.add_vertex(name, 0, 0)
+  else:
+    for name in range(vertices):
+      graph.add_vertex(name)
+
+  for _ in range(edges):
+    u_name, v_name = rng.randrange(vertices), rng.randrange(vertices)
+    if acyclic and u_name >= v_name:
+      continue
+    weight = draw(low, high)
+    if admissible:
+      u_object, v_object = graph.vertex_map[u_name], graph.vertex_map[v_name]
+      weight += ((u_object.x - v_object.x) ** 2 + (u_object.y - v_object.y) ** 2) ** 0.5
+    graph.add_edge(u_name, v_name, weight)
+  return graph
+
+
+def build_admissible_graph(vertices, edges, seed):
+  """Placed random graph whose weights exceed Euclidean distance by up to 5"""
+  return build_random_graph(vertices, edges, seed, weights=(0.0, 5.0), placed=True, admissible=True)
@@ -1,3 +1,11 @@
+import random
+import tracemalloc
+
+import pytest
+
+from graphs.adjacency_list import DisjointSet, Graph, Queue, Vertex
+from graph_factories import build_random_graph
+
 
 # TEST EXECUTION BLOCK
 print()
@@ -44,6 +52,194 @@ def run_graph_test():
     g.depth_first_search('1')
     print("-" * 35)
 
+def build_sample_graph():
+    g = Graph()
+    for v in ['1', '2', '3', '4', '5', '6']:
+        g.add_vertex(v)
+    g.add_edge('1', '2', 1)
+    g.add_edge('1', '3', 1)
+    g.add_edge('2', '4', 1)
+    g.add_edge('3', '5', 1)
+    g.add_edge('4', '5', 1)
+    return g
+
+def test_bfs_yields_depth_and_parent():
+    g = build_sample_graph()
+    assert list(g.bfs('1')) == [
+        ('1', 0, None), ('2', 1, '1'), ('3', 1, '1'), ('4', 2, '2'), ('5', 2, '3'),
+    ]
+
+def test_bfs_multiple_sources_and_missing():
+    g = build_sample_graph()
+    assert list(g.bfs('4', '3', 'missing', max_depth=0)) == [('4', 0, None), ('3', 0, None)]
+    assert {v: d for v, d, _ in g.bfs('4', '3')} == {'4': 0, '3': 0, '2': 1, '5': 1, '1': 1}
+    assert list(g.bfs('missing')) == []
+
+def test_bfs_early_stop():
+    g = build_sample_graph()
+    assert list(g.bfs('1', target='3'))[-1] == ('3', 1, '1')
+    assert [v for v, _, _ in g.bfs('1', max_depth=1)] == ['1', '2', '3']
+
+    # Unreached vertices are never yielded
+    assert '6' not in {v for v, _, _ in g.bfs('1')}
+
+def test_breadth_first_search_prints_bfs_order(capsys):
+    build_sample_graph().Breadth_First_Search('1')
+    assert capsys.readouterr().out.split() == ['Visited:', '1', 'Visited:', '2', 'Visited:', '3',
+                                               'Visited:', '4', 'Visited:', '5']
+
+def test_queue_is_fifo():
+    q = Queue()
+    for item in range(3):
+        q.enqueue(item)
+    assert [q.dequeue() for _ in range(4)] == [0, 1, 2, None]
+
+def test_direction_optimizing_bfs_matches_bfs():
+    g = build_random_graph(2000, 12000, seed=1, weights=(1, 1), graph=Graph())
+    expected = {v: d for v, d, _ in g.bfs(0)}
+    depth, parent = g.direction_optimizing_bfs(0)
+    assert depth == expected
+    assert parent[0] is None
+    for v, u in parent.items():
+        if u is not None:
+            assert depth[u] == depth[v] - 1
+            assert u in g.vertex_map[v].neighbour_links
+
+    # Dense low diameter graph: the middle levels run bottom-up
+    assert "bottom-up" in g.bfs_stats["directions"]
+    assert g.bfs_stats["edges_checked"] < 24000
+
+def test_direction_optimizing_bfs_sees_graph_changes():
+    g = build_sample_graph()
+    assert '6' not in g.direction_optimizing_bfs('1')[0]
+    g.add_edge('5', '6', 1)
+    assert g.direction_optimizing_bfs('1')[0]['6'] == 3
+    assert g.direction_optimizing_bfs('missing') == ({}, {})
+
+def build_from_lines(lines, vertices, compact):
+    g = Graph(compact=compact)
+    for v in range(vertices):
+        g.add_vertex(f"user-{v}")
+    for line in lines:
+        u, v = line.split()
+        g.add_edge(u, v, 1)
+    return g
+
+def test_compact_mode_matches_default():
+    rng = random.Random(4)
+    lines = [f"user-{rng.randrange(300)} user-{rng.randrange(300)}" for _ in range(1200)]
+    default = build_from_lines(lines, 300, compact=False)
+    compact = build_from_lines(lines, 300, compact=True)
+
+    assert list(compact.bfs('user-0', max_depth=2)) == list(default.bfs('user-0', max_depth=2))
+    assert compact.direction_optimizing_bfs('user-7') == default.direction_optimizing_bfs('user-7')
+    assert compact.ids['user-5'] == 5
+    assert compact.vertex_map[5].name == 'user-5'
+    assert list(compact.bfs('missing')) == []
+
+def test_compact_mode_saves_memory():
+    assert not hasattr(Vertex('a'), '__dict__')
+
+    # Names parsed per edge line are fresh objects that default mode keeps as keys
+    rng = random.Random(5)
+    lines = [f"user-{rng.randrange(5000)} user-{rng.randrange(5000)}" for _ in range(20000)]
+    usage = {}
+    for compact in (False, True):
+        tracemalloc.start()
+        g = build_from_lines(lines, 5000, compact)
+        usage[compact] = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del g
+    assert usage[True] < 0.75 * usage[False]
+
+def test_disjoint_set():
+    for dense in (False, True):
+        components = DisjointSet(dense=dense)
+        for key in range(6):
+            components.add(key)
+        assert components.union(0, 1) and components.union(2, 3) and components.union(1, 3)
+        assert not components.union(0, 2)
+        assert components.find(0) == components.find(3) != components.find(4)
+        assert components.count == 3
+
+def test_component_index():
+    for compact in (False, True):
+        g = Graph(compact=compact)
+        for v in 'ABCDEF':
+            g.add_vertex(v)
+        g.add_edge('A', 'B', 1)
+        g.add_edge('C', 'D', 1)
+        assert g.connected('A', 'B') and not g.connected('A', 'C')
+        assert not g.connected('A', 'missing')
+
+        g.add_edge('B', 'C', 1)
+        assert g.connected('A', 'D')
+        assert g.component_of('A') == g.component_of('D') != g.component_of('E')
+        assert g.component_of('missing') is None
+        assert sorted(g.component_sizes().values()) == [1, 1, 4]
+        assert g.component_sizes()[g.component_of('F')] == 1
+
+def test_bfs_unreachable_target_returns_immediately():
+    g = build_sample_graph()
+    assert list(g.bfs('1', target='6')) == []
+    assert list(g.bfs('1', target='missing')) == []
+    assert list(g.bfs('6', '1', target='5'))[-1] == ('5', 2, '3')
+
+def test_dfs_events_and_printing(capsys):
+    for compact in (False, True):
+        g = Graph(compact=compact)
+        for v in 'ABCD':
+            g.add_vertex(v)
+        g.add_edge('A', 'B', 1)
+        g.add_edge('A', 'C', 1)
+        g.add_edge('B', 'D', 1)
+        events = [(event, v, other, time) for event, v, other, _, time in g.dfs('A')]
+        assert events == [
+            ('enter', 'A', None, 1), ('enter', 'B', 'A', 2), ('enter', 'D', 'B', 3),
+            ('exit', 'D', 'B', 4), ('exit', 'B', 'A', 5), ('enter', 'C', 'A', 6),
+            ('exit', 'C', 'A', 7), ('exit', 'A', None, 8),
+        ]
+        assert not g.has_cycle()
+
+        g.depth_first_search('A')
+        assert capsys.readouterr().out.split()[1::2] == ['A', 'B', 'D', 'C']
+
+        g.add_edge('C', 'D', 1)
+        assert g.has_cycle()
+
+def test_iterative_deepening_search():
+    g = build_sample_graph()
+    assert g.iterative_deepening_search('1', '5', 5) == ['1', '3', '5']
+    assert g.iterative_deepening_search('1', '5', 1) is None
+    assert g.iterative_deepening_search('1', '6', 5) is None
+
+def test_add_edges_from_and_from_arrays():
+    for compact in (False, True):
+        g = Graph(compact=compact)
+        for v in 'ABC':
+            g.add_vertex(v)
+        summary = g.add_edges_from([('A', 'B', 1), ('B', 'A', 2), ('B', 'C', 1), ('C', 'Z', 1)])
+        assert summary == {
+            'rows': 4, 'added': 2, 'duplicates': 1, 'dropped': 1,
+            'vertices_created': 0, 'dropped_sample': [('C', 'Z', 1)],
+        }
+        assert g.connected('A', 'C') and not g.connected('A', 'Z')
+
+        summary = g.add_edges_from([('C', 'Z', 1), ('Y', 'Y', 1)], create_vertices=True)
+        assert (summary['added'], summary['vertices_created']) == (2, 2)
+        assert g.connected('A', 'Z') and not g.connected('A', 'Y')
+
+    g, summary = Graph.from_arrays(['A', 'B', 'C'], ['B', 'C', 'A'], [1, 1, 1], compact=True)
+    assert summary['added'] == 3 and g.ids == {'A': 0, 'B': 1, 'C': 2}
+    assert g.has_cycle()
+
+def test_add_edges_from_float_array_keeps_integer_names():
+    np = pytest.importorskip('numpy')
+    g = Graph(compact=True)
+    summary = g.add_edges_from(np.array([[0, 1, 1.0], [1, 2, 1.0]]), create_vertices=True)
+    assert summary['added'] == 2 and g.ids == {0: 0, 1: 1, 2: 2}
+    assert all(type(name) is int for name in g.ids)
+
 if __name__ == "__main__":
     run_graph_test()
 
@@ -0,0 +1,61 @@
+import json
+
+import pytest
+
+from algorithms.pathfinding import DirectedWeightedGraph
+from benchmarks import suite
+from benchmarks.workloads import WORKLOADS, generate, write_graph_file
+from graphs.dfs import topological_sort
+
+
+@pytest.mark.parametrize("workload", WORKLOADS)
+def test_workloads_are_seeded_sized_and_admissible(workload):
+  coordinates, edges = generate(workload, 4000, seed=1)
+  assert (coordinates, edges) == generate(workload, 4000, seed=1)
+  assert generate(workload, 4000, seed=2)[1] != edges
+  assert 0.6 * 4000 <= len(edges) <= 1.4 * 4000
+
+  # Weights never undercut the straight line, so A* stays exact
+  for u, v, weight in edges:
+    (ux, uy), (vx, vy) = coordinates[u], coordinates[v]
+    assert weight >= ((ux - vx) ** 2 + (uy - vy) ** 2) ** 0.5
+
+
+def test_dag_workload_is_acyclic():
+  coordinates, edges = generate("dag", 2000)
+  successors = {v: [] for v in range(len(coordinates))}
+  for u, v, _ in edges:
+    successors[u].append(v)
+  assert len(topological_sort(successors.__getitem__, successors)) == len(coordinates)
+
+
+def test_graph_file_round_trip(tmp_path):
+  coordinates, edges = generate("grid", 400)
+  filename = tmp_path / "grid.txt"
+  write_graph_file(filename, coordinates, edges, start=0, goal=5)
+  graph, start, goal, vertices, edge_count = DirectedWeightedGraph.read_graph(filename)
+  assert (start, goal, vertices, edge_count) == (0, 5, len(coordinates), len(edges))
+  assert graph.vertex_map[7].neighbour_links == {v: w for u, v, w in edges if u == 7}
+
+
+def test_suite_results_and_regression_gate(tmp_path):
+  results = suite.run_suite(sizes=(500, 2000), workloads=("grid",),
+                            entries=("dijkstra", "read_graph"), queries=3, repeats=1)
+  assert {(r["size"], r["entry"]) for r in results["results"]} == \
+         {(500, "dijkstra"), (2000, "dijkstra"), (500, "read_graph"), (2000, "read_graph")}
+  assert all(curve["exponent"] is not None for curve in results["scaling"])
+  assert suite.compare(results, results) == []
+
+  # A baseline twice as fast flags every batch slow enough to compare
+  baseline = json.loads(json.dumps(results))
+  for result in baseline["results"]:
+    result["seconds"] /= 2
+  flagged = suite.compare(results, baseline, threshold=0.25)
+  assert flagged and all(regression["ratio"] == pytest.approx(2.0) for regression in flagged)
+
+  baseline_file = tmp_path / "baseline.json"
+  baseline["results"] = [dict(result, seconds=1.0, calls=1) for result in baseline["results"]]
+  baseline_file.write_text(json.dumps(baseline))
+  args = ["--sizes", "500", "--workloads", "grid", "--entries", "dijkstra",
+          "--queries", "2", "--repeats", "1", "--baseline", str(baseline_file)]
+  assert suite.main(args) == 0
@@ -0,0 +1,82 @@
+import random
+
+import pytest
+
+from algorithms.contraction_hierarchy import ContractionHierarchy
+from algorithms.pathfinding import DirectedWeightedGraph
+from graph_factories import build_random_graph
+
+
+def path_length(graph, path):
+  """Sum edge weights along a path of original edges"""
+  return sum(graph.vertex_map[u].neighbour_links[v] for u, v in zip(path, path[1:]))
+
+
+def test_query_matches_dijkstra():
+  graph = build_random_graph(120, 420, seed=3, weights=(1, 20), placed=True)
+  hierarchy = ContractionHierarchy.build(graph)
+  rng = random.Random(9)
+
+  for _ in range(150):
+    start, goal = rng.randrange(120), rng.randrange(120)
+    _, expected, _ = graph.dijkstras_algorithm(start, goal)
+    path, distance, _ = hierarchy.query(start, goal)
+
+    assert distance == expected
+    if path is not None:
+      # Shortcuts must unpack into a path of original edges
+      assert path[0] == start and path[-1] == goal
+      assert path_length(graph, path) == distance
+
+
+def test_shortcut_unpacking():
+  graph = DirectedWeightedGraph()
+  for name in "abcde":
+    graph.add_vertex(name, 0, 0)
+  for u_name, v_name in zip("abcde", "bcde"):
+    graph.add_edge(u_name, v_name, 1)
+  graph.add_edge("a", "e", 10)
+
+  hierarchy = ContractionHierarchy.build(graph)
+  path, distance, _ = hierarchy.query("a", "e")
+  assert (path, distance) == (["a", "b", "c", "d", "e"], 4)
+  assert hierarchy.query("e", "a")[0] is None
+  assert hierarchy.query("a", "z") == (None, float("inf"), 0)
+
+  # Nested shortcuts a -> e via c, a -> c via b & c -> e via d unpack in order
+  hierarchy.shortcut_via = {(0, 4): 2, (0, 2): 1, (2, 4): 3}
+  assert hierarchy._unpack([0, 4]) == [0, 1, 2, 3, 4]
+
+
+def test_save_and_load(tmp_path):
+  graph = build_random_graph(50, 200, seed=8, weights=(1, 20), placed=True)
+  hierarchy = ContractionHierarchy.build(graph)
+  filename = tmp_path / "graph.ch"
+  hierarchy.save(filename)
+
+  loaded = ContractionHierarchy.load(filename)
+  assert loaded.shortcut_count == hierarchy.shortcut_count
+  for start, goal in [(0, 49), (3, 17), (20, 5)]:
+    assert loaded.query(start, goal) == hierarchy.query(start, goal)
+
+
+def test_save_and_load_named_vertices(tmp_path):
+  graph = DirectedWeightedGraph()
+  for name in ("depot", "yard", 7, "dock"):
+    graph.add_vertex(name, 0, 0)
+  for u_name, v_name, weight in (("depot", "yard", 2), ("yard", 7, 3), (7, "dock", 1), ("depot", "dock", 9)):
+    graph.add_edge(u_name, v_name, weight)
+  hierarchy = ContractionHierarchy.build(graph)
+  filename = tmp_path / "named.ch"
+  hierarchy.save(filename)
+
+  loaded = ContractionHierarchy.load(filename)
+  assert loaded.names == hierarchy.names
+  assert loaded.shortcut_via == hierarchy.shortcut_via
+  path, distance, _ = loaded.query("depot", "dock")
+  assert (path, distance) == (["depot", "yard", 7, "dock"], 6)
+
+  # Anything that is not a hierarchy file is rejected before parsing
+  filename.write_bytes(b"\x80\x04not a hierarchy file" + bytes(64))
+  with pytest.raises(ValueError):
+    ContractionHierarchy.load(filename)
@@ -0,0 +1,138 @@
+import os
+import random
+import subprocess
+import sys
+import tracemalloc
+
+import pytest
+
+from algorithms.csr_graph import CSRGraph
+from algorithms.pathfinding import DirectedWeightedGraph
+from graph_factories import build_admissible_graph
+
+
+def test_csr_layout():
+  graph = DirectedWeightedGraph()
+  for name in "abc":
+    graph.add_vertex(name, 0, 0)
+  graph.add_edge("a", "b", 2.0)
+  graph.add_edge("a", "c", 3.0)
+  graph.add_edge("c", "a", 1.0)
+
+  csr = graph.freeze()
+  assert csr.names == ["a", "b", "c"]
+  assert list(csr.offsets) == [0, 2, 2, 3]
+  assert list(csr.targets) == [1, 2, 0]
+  assert list(csr.weights) == [2.0, 3.0, 1.0]
+  assert list(csr.neighbours("a")) == [("b", 2.0), ("c", 3.0)]
+  assert csr.vertex_count == 3 and csr.edge_count == 3
+
+
+def test_csr_searches_match_dict_graph():
+  graph = build_admissible_graph(60, 240, seed=7)
+  csr = graph.to_csr()
+  rng = random.Random(11)
+
+  for _ in range(40):
+    start, goal = rng.randrange(60), rng.randrange(60)
+    path, distance, _ = csr.dijkstras_algorithm(start, goal)
+    expected_path, expected_distance, _ = graph.dijkstras_algorithm(start, goal)
+    assert (path is None) == (expected_path is None)
+    assert distance == expected_distance
+
+    path, distance, _ = csr.astar_algorithm(start, goal)
+    assert abs(distance - expected_distance) < 1e-9 or distance == expected_distance
+
+
+def test_csr_depth_first_search_matches_dict_graph():
+  graph = build_admissible_graph(9, 20, seed=5)
+  csr = graph.freeze()
+  for goal in range(1, 9):
+    assert csr.depth_first_search(0, goal) == graph.depth_first_search(0, goal)
+
+
+def test_csr_memory_per_edge():
+  graph = build_admissible_graph(2000, 20000, seed=1)
+  tracemalloc.start()
+  before = tracemalloc.get_traced_memory()[0]
+  csr = CSRGraph.from_graph(graph)
+  csr_bytes = tracemalloc.get_traced_memory()[0] - before
+  tracemalloc.stop()
+
+  # 12 bytes per edge (int32 target, float64 weight) plus offsets & x, y per vertex
+  vertices, edges = csr.vertex_count, csr.edge_count
+  assert edges == sum(len(v.neighbour_links) for v in graph.vertex_map.values())
+  assert csr.memory_usage() == 12 * edges + 8 * (vertices + 1) + 16 * vertices
+
+  # Whole frozen graph, names list & array headers included: ~16 bytes per edge
+  assert csr_bytes < 20 * edges
+
+
+def test_distance_matrix_matches_dijkstra():
+  graph = build_admissible_graph(40, 160, seed=4)
+  sources = [0, 5, 17, "missing", 33]
+  targets = [2, 2, 9, 39, "missing", 0]
+  expected = [[graph.dijkstras_algorithm(s, t)[1] for t in targets] for s in sources]
+
+  serial = graph.distance_matrix(sources, targets, workers=1)
+  assert serial.shape == (5, 6) and len(serial.data) == 30
+  assert serial.tolist() == expected
+  assert serial[3, 0] == float("inf") and serial[1, 5] == expected[1][5]
+  assert list(serial.row(2)) == expected[2]
+
+  # Same rows when sources are spread over worker processes
+  pooled = graph.freeze().distance_matrix(sources, targets, workers=2)
+  assert pooled.tolist() == expected
+
+
+def test_distance_matrix_numpy_view():
+  np = pytest.importorskip("numpy")
+  graph = build_admissible_graph(30, 120, seed=5)
+  matrix = graph.distance_matrix([0, 1, 2], [3, 4], workers=1)
+  view = matrix.to_numpy()
+  assert view.shape == (3, 2) and view.dtype == np.float64
+  assert view.tolist() == matrix.tolist()
+
+
+def test_binary_snapshot_round_trip(tmp_path):
+  graph = build_admissible_graph(50, 200, seed=6)
+  filename = tmp_path / "graph.bin"
+  graph.save_binary(filename)
+
+  loaded = DirectedWeightedGraph.load_binary(filename)
+  csr = graph.freeze()
+  assert list(loaded.names) == csr.names
+  assert list(loaded.offsets) == list(csr.offsets)
+  assert list(loaded.targets) == list(csr.targets)
+  assert list(loaded.weights) == list(csr.weights)
+  assert list(loaded.x) == list(csr.x)
+
+  # Searches run directly on the mapped arrays
+  for goal in (3, 20, 49):
+    assert loaded.dijkstras_algorithm(0, goal) == csr.dijkstras_algorithm(0, goal)
+
+  # Workers map the snapshot file instead of receiving pickled arrays
+  matrix = loaded.distance_matrix([0, 1, 2], [10, 20], workers=2)
+  assert matrix.tolist() == csr.distance_matrix([0, 1, 2], [10, 20], workers=1).tolist()
+
+
+def test_binary_snapshot_rejects_bad_input(tmp_path):
+  graph = DirectedWeightedGraph()
+  graph.add_vertex("a", 0, 0)
+  with pytest.raises(TypeError):
+    graph.save_binary(tmp_path / "names.bin")
+
+  bogus = tmp_path / "bogus.bin"
+  bogus.write_bytes(b"not a snapshot" * 4)
+  with pytest.raises(ValueError):
+    DirectedWeightedGraph.load_binary(bogus)
+
+
+def test_snapshot_entry_point(tmp_path):
+  text = tmp_path / "graph.txt"
+  text.write_text("2 1\n1 0 0\n2 3 4\n1 2 5.5\n1 2\n")
+  binary = tmp_path / "graph.bin"
+  subprocess.run([sys.executable, "-m", "algorithms.csr_graph", str(text), str(binary)],
+                 cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))), check=True,
+                 capture_output=True)
+  assert DirectedWeightedGraph.load_binary(binary).dijkstras_algorithm(1, 2) == ([1, 2], 5.5, 2)
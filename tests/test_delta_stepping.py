@@ -0,0 +1,34 @@
+from algorithms.delta_stepping import delta_stepping
+from graph_factories import build_random_graph
+
+
+def assert_valid_tree(graph, distance, parent, expected):
+  """Same distances as Dijkstra & every parent edge is tight"""
+  assert distance.keys() == expected.keys()
+  for v_name, d in distance.items():
+    assert abs(d - expected[v_name]) < 1e-9
+    if parent[v_name] is not None:
+      weight = graph.vertex_map[parent[v_name]].neighbour_links[v_name]
+      assert abs(distance[parent[v_name]] + weight - d) < 1e-9
+
+
+def test_serial_matches_dijkstra():
+  graph = build_random_graph(300, 1500, seed=1)
+  expected, _ = graph.shortest_path_tree(0)
+  for delta in (None, 0.5, 3.0, 50.0):
+    distance, parent = delta_stepping(graph, 0, delta=delta, workers=1)
+    assert_valid_tree(graph, distance, parent, expected)
+    assert parent[0] is None
+
+
+def test_parallel_matches_dijkstra():
+  graph = build_random_graph(400, 2400, seed=2)
+  expected, _ = graph.shortest_path_tree(7)
+  # A threshold of 1 sends every bucket through the worker processes
+  distance, parent = delta_stepping(graph.freeze(), 7, workers=2, parallel_threshold=1)
+  assert_valid_tree(graph, distance, parent, expected)
+
+
+def test_missing_source():
+  graph = build_random_graph(5, 5, seed=3)
+  assert delta_stepping(graph, "missing", workers=1) == ({}, {})
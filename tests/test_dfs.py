@@ -0,0 +1,67 @@
+import pytest
+
+from algorithms.pathfinding import DirectedWeightedGraph
+from graphs.dfs import dfs_events, find_cycle, strongly_connected_components, topological_sort
+
+
+def successors_of(adjacency):
+  return lambda u: adjacency.get(u, ())
+
+
+def test_events_follow_true_dfs_order():
+  adjacency = {"A": ["B", "C"], "B": ["D"], "C": ["D"], "D": []}
+  events = [(event, u, other, time) for event, u, other, _, time
+            in dfs_events(successors_of(adjacency), ["A"], non_tree_edges=True)]
+  assert events == [
+    ("enter", "A", None, 1), ("enter", "B", "A", 2), ("enter", "D", "B", 3),
+    ("exit", "D", "B", 4), ("exit", "B", "A", 5), ("enter", "C", "A", 6),
+    ("edge", "C", "D", 6), ("exit", "C", "A", 7), ("exit", "A", None, 8),
+  ]
+
+
+def test_deep_chain_has_no_recursion_limit():
+  adjacency = {v: [v + 1] for v in range(100000)}
+  exits = [u for event, u, _, _, _ in dfs_events(successors_of(adjacency), [0]) if event == "exit"]
+  assert exits[0] == 100000 and exits[-1] == 0
+
+
+def test_depth_cap_re_enters_shorter_paths():
+  # D is first reached at depth 3 via the long branch, then at depth 1
+  adjacency = {"A": ["B", "D"], "B": ["C"], "C": ["D"], "D": ["E"]}
+  entered = {u: depth for event, u, _, depth, _ in dfs_events(successors_of(adjacency), ["A"], max_depth=2)
+             if event == "enter"}
+  assert entered == {"A": 0, "B": 1, "C": 2, "D": 1, "E": 2}
+
+
+def test_cycle_topological_sort_and_scc():
+  adjacency = {1: [2], 2: [3], 3: [1, 4], 4: [5], 5: [6], 6: [4], 7: [6]}
+  successors = successors_of(adjacency)
+  vertices = list(range(1, 8))
+
+  cycle = find_cycle(successors, vertices)
+  assert cycle[0] == cycle[-1] and len(cycle) == 4
+  with pytest.raises(ValueError):
+    topological_sort(successors, vertices)
+
+  components = strongly_connected_components(successors, vertices)
+  assert sorted(sorted(component) for component in components) == [[1, 2, 3], [4, 5, 6], [7]]
+  # Reverse topological order of the condensation: the sink component first
+  assert sorted(components[0]) == [4, 5, 6]
+
+
+def test_topological_sort_on_weighted_graph():
+  graph = DirectedWeightedGraph()
+  for name in range(6):
+    graph.add_vertex(name, 0, 0)
+  for u_name, v_name in [(5, 2), (5, 0), (4, 0), (4, 1), (2, 3), (3, 1)]:
+    graph.add_edge(u_name, v_name, 1)
+
+  def successors(u_name):
+    return graph.vertex_map[u_name].neighbour_links
+
+  order = topological_sort(successors, graph.vertex_map)
+  position = {v: index for index, v in enumerate(order)}
+  for u_name, u_object in graph.vertex_map.items():
+    for v_name in u_object.neighbour_links:
+      assert position[u_name] < position[v_name]
+  assert find_cycle(successors, graph.vertex_map) is None
@@ -0,0 +1,86 @@
+import random
+
+from algorithms.pathfinding import DirectedWeightedGraph
+from graph_factories import build_random_graph
+
+
+def assert_matches_recompute(graph, tree):
+  expected, _ = graph.shortest_path_tree(tree.source)
+  assert tree.distance == expected
+  for v_name, u_name in tree.parent.items():
+    if u_name is not None:
+      weight = graph.vertex_map[u_name].neighbour_links[v_name]
+      assert tree.distance[u_name] + weight == tree.distance[v_name]
+      assert v_name in tree.children[u_name]
+
+
+def test_random_updates_match_recompute():
+  rng = random.Random(7)
+  graph = build_random_graph(200, 600, seed=1)
+  trees = [graph.register_source(0), graph.register_source(5)]
+
+  for _ in range(300):
+    u_name = rng.randrange(200)
+    links = graph.vertex_map[u_name].neighbour_links
+    if links and rng.random() < 0.7:
+      # Re-weight an existing edge up or down
+      v_name = rng.choice(list(links))
+      graph.add_edge(u_name, v_name, links[v_name] * rng.choice((0.3, 0.9, 1.5, 4.0)))
+    else:
+      graph.add_edge(u_name, rng.randrange(200), rng.uniform(0.1, 10))
+
+    for tree in trees:
+      assert_matches_recompute(graph, tree)
+
+
+def test_update_touches_only_changed_region():
+  # Two chains joined at the source: updating one leaves the other untouched
+  graph = DirectedWeightedGraph()
+  for name in range(201):
+    graph.add_vertex(name, 0, 0)
+  for name in range(1, 100):
+    graph.add_edge(name, name + 1, 1)
+  for name in range(101, 200):
+    graph.add_edge(name, name + 1, 1)
+  graph.add_edge(0, 1, 1)
+  graph.add_edge(0, 101, 1)
+  tree = graph.register_source(0)
+
+  graph.add_edge(195, 196, 5)
+  assert tree.last_touched == 5
+  graph.add_edge(195, 196, 0.5)
+  assert tree.last_touched == 5
+  assert tree.distance[200] == 99.5
+  assert_matches_recompute(graph, tree)
+
+
+def test_increase_disconnects_and_reconnects():
+  graph = DirectedWeightedGraph()
+  for name in "ABCD":
+    graph.add_vertex(name, 0, 0)
+  graph.add_edge("A", "B", 1)
+  graph.add_edge("B", "C", 1)
+  graph.add_edge("A", "D", 5)
+  tree = graph.register_source("A")
+
+  # Re-weighting the only route keeps C reachable at the new cost
+  graph.add_edge("A", "B", 10)
+  assert tree.shortest_path("C") == (["A", "B", "C"], 11)
+
+  # A cheaper detour through D takes over
+  graph.add_edge("D", "B", 1)
+  assert tree.shortest_path("C") == (["A", "D", "B", "C"], 7)
+  assert_matches_recompute(graph, tree)
+
+
+def test_dijkstra_answers_from_registered_tree():
+  graph = build_random_graph(100, 400, seed=2)
+  expected = graph.dijkstras_algorithm(3, 40)
+  graph.register_source(3)
+  path, distance, expanded_nodes = graph.dijkstras_algorithm(3, 40)
+  assert (path, distance) == expected[:2]
+  assert expanded_nodes == 0
+
+  graph.unregister_source(3)
+  assert graph.dijkstras_algorithm(3, 40) == expected
+  assert graph.register_source("missing") is None
@@ -0,0 +1,68 @@
+import random
+
+from algorithms.landmarks import LandmarkIndex
+from algorithms.pathfinding import DirectedWeightedGraph
+
+
+def build_travel_time_grid(side, seed):
+  """Grid whose weights are travel times far above the Euclidean step"""
+  rng = random.Random(seed)
+  graph = DirectedWeightedGraph()
+  for row in range(side):
+    for col in range(side):
+      graph.add_vertex((row, col), col, row)
+  for row in range(side):
+    for col in range(side):
+      for n_row, n_col in ((row + 1, col), (row, col + 1), (row - 1, col), (row, col - 1)):
+        graph.add_edge((row, col), (n_row, n_col), rng.uniform(10, 20))
+  return graph
+
+
+def test_landmark_selection():
+  graph = build_travel_time_grid(10, seed=1)
+  landmarks = LandmarkIndex.build(graph, k=4)
+  assert len(landmarks.landmarks) == len(set(landmarks.landmarks)) == 4
+  assert len(landmarks.from_landmark) == len(landmarks.to_landmark) == 4 * 100
+
+
+def test_heuristic_is_admissible():
+  graph = build_travel_time_grid(8, seed=2)
+  landmarks = LandmarkIndex.build(graph, k=3)
+  goal = (5, 6)
+  exact, _ = graph.shortest_path_tree(goal, reverse=True)
+  for v_name, distance in exact.items():
+    assert landmarks.heuristic(v_name, goal) <= distance + 1e-9
+  assert landmarks.heuristic(goal, goal) == 0
+
+
+def test_alt_astar_matches_dijkstra_with_fewer_expansions():
+  graph = build_travel_time_grid(30, seed=3)
+  landmarks = LandmarkIndex.build(graph, k=8)
+  rng = random.Random(5)
+  alt_expanded = 0
+  euclidean_expanded = 0
+
+  for _ in range(20):
+    start = (rng.randrange(30), rng.randrange(30))
+    goal = (rng.randrange(30), rng.randrange(30))
+    _, expected, _ = graph.dijkstras_algorithm(start, goal)
+    path, distance, expanded = graph.astar_algorithm(start, goal, heuristic=landmarks.heuristic)
+    assert abs(distance - expected) < 1e-9
+    assert path[0] == start and path[-1] == goal
+    alt_expanded += expanded
+    euclidean_expanded += graph.astar_algorithm(start, goal)[2]
+
+  # The request targets an order of magnitude fewer expansions (~11.8x here)
+  assert alt_expanded * 10 <= euclidean_expanded
+
+
+def test_unreachable_landmark_terms_are_ignored():
+  graph = DirectedWeightedGraph()
+  for name in "abcd":
+    graph.add_vertex(name, 0, 0)
+  graph.add_edge("a", "b", 2)
+  graph.add_edge("b", "c", 3)
+
+  landmarks = LandmarkIndex.build(graph, k=4)
+  assert set(landmarks.landmarks) == {"a", "b", "c", "d"}
+  assert graph.astar_algorithm("a", "c", heuristic=landmarks.heuristic)[:2] == (["a", "b", "c"], 5)
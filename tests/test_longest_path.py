@@ -0,0 +1,74 @@
+
+from algorithms.longest_path import longest_path
+from algorithms.pathfinding import DirectedWeightedGraph
+from graph_factories import build_random_graph
+
+
+def exhaustive_longest(graph, start, goal):
+  """Reference: enumerate every simple path recursively"""
+  best = [None, float("-inf")]
+
+  def visit(u_name, path, distance):
+    if u_name == goal:
+      if distance > best[1]:
+        best[0], best[1] = path.copy(), distance
+      return
+    for v_name, weight in graph.vertex_map[u_name].neighbour_links.items():
+      if v_name not in path:
+        path.append(v_name)
+        visit(v_name, path, distance + weight)
+        path.pop()
+
+  visit(start, [start], 0)
+  return best[1]
+
+
+def test_cyclic_graphs_match_exhaustive_search():
+  for seed in range(6):
+    graph = build_random_graph(9, 30, seed, weights=(1, 30))
+    for goal in range(1, 9):
+      path, distance, complete = graph.longest_path(0, goal)
+      assert complete
+      assert distance == exhaustive_longest(graph, 0, goal)
+      if path is not None:
+        assert path[0] == 0 and path[-1] == goal and len(set(path)) == len(path)
+        assert sum(graph.vertex_map[u].neighbour_links[v] for u, v in zip(path, path[1:])) == distance
+
+
+def test_dag_uses_linear_dp():
+  graph = build_random_graph(40, 200, seed=1, acyclic=True, weights=(1, 30))
+  for goal in (10, 25, 39):
+    assert graph.depth_first_search(0, goal)[1] == exhaustive_longest(graph, 0, goal)
+
+
+def test_deep_dag_beyond_recursion_limit():
+  graph = DirectedWeightedGraph()
+  length = 50000
+  for name in range(length):
+    graph.add_vertex(name, 0, 0)
+  for name in range(length - 1):
+    graph.add_edge(name, name + 1, 1.0)
+    if name + 2 < length:
+      graph.add_edge(name, name + 2, 1.5)
+
+  path, distance = graph.depth_first_search(0, length - 1)
+  assert path[0] == 0 and path[-1] == length - 1
+  assert distance == length - 1
+
+
+def test_budget_stops_search_early():
+  graph = build_random_graph(30, 300, seed=3, weights=(1, 30))
+  path, distance, complete = graph.longest_path(0, 29, node_budget=50)
+  assert not complete
+  assert path is None or path[-1] == 29
+
+  # The CSR form shares the engine
+  assert graph.freeze().longest_path(0, 29, node_budget=50) == (path, distance, complete)
+
+
+def test_missing_and_unreachable_vertices():
+  graph = build_random_graph(5, 0, seed=0, weights=(1, 30))
+  assert graph.depth_first_search(0, 4) == (None, float("-inf"))
+  assert graph.depth_first_search(0, 99) == (None, float("-inf"))
+  assert graph.depth_first_search(2, 2) == ([2], 0)
+  assert longest_path(lambda u: [], "a", "b") == (None, float("-inf"), True)
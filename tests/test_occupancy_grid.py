@@ -0,0 +1,87 @@
+import random
+
+import pytest
+
+from algorithms.occupancy_grid import OccupancyGrid
+
+
+def random_grid(rng, width, height, density):
+  grid = OccupancyGrid(width, height)
+  for y in range(height):
+    for x in range(width):
+      if rng.random() < density:
+        grid.block(x, y)
+  return grid
+
+
+def assert_valid_path(grid, path, start, goal, distance):
+  assert path[0] == start and path[-1] == goal
+  total = 0.0
+  for a, b in zip(path, path[1:]):
+    moves = dict(grid.neighbours(*a))
+    assert b in moves
+    total += moves[b]
+  assert total == pytest.approx(distance)
+
+
+def test_costs_match_astar_on_random_grids():
+  rng = random.Random(3)
+  for _ in range(60):
+    width, height = rng.randint(2, 20), rng.randint(2, 20)
+    grid = random_grid(rng, width, height, rng.choice((0.0, 0.15, 0.3, 0.45)))
+    graph = grid.to_graph()
+
+    for _ in range(5):
+      start = (rng.randrange(width), rng.randrange(height))
+      goal = (rng.randrange(width), rng.randrange(height))
+      path, distance, _ = grid.jump_point_search(start, goal)
+      if not grid.is_free(*start) or not grid.is_free(*goal):
+        assert (path, distance) == (None, float("inf"))
+        continue
+
+      _, expected, _ = graph.astar_algorithm(start[1] * width + start[0],
+                                             goal[1] * width + goal[0])
+      assert distance == pytest.approx(expected)
+      if path is not None:
+        assert_valid_path(grid, path, start, goal, distance)
+
+
+def test_no_corner_cutting():
+  grid = OccupancyGrid.from_strings([
+    ".#",
+    "#.",
+  ])
+  assert grid.jump_point_search((0, 0), (1, 1)) == (None, float("inf"), 1)
+
+
+def test_open_map_expands_few_jump_points():
+  grid = OccupancyGrid(200, 200)
+  for y in range(40, 160):
+    grid.block(100, y)
+  graph = grid.to_graph()
+
+  path, distance, expanded = grid.jump_point_search((10, 100), (190, 100))
+  _, expected, astar_expanded = graph.astar_algorithm(100 * 200 + 10, 100 * 200 + 190)
+  assert distance == pytest.approx(expected)
+  assert_valid_path(grid, path, (10, 100), (190, 100), distance)
+  assert expanded * 100 < astar_expanded
+
+
+def test_from_graph_and_bitmap_size():
+  grid = OccupancyGrid.from_strings([
+    "....",
+    ".##.",
+    "....",
+  ])
+  graph = grid.to_graph()
+  assert len(graph.vertex_map) == 10
+  rebuilt = graph.to_grid()
+  assert [[rebuilt.is_free(x, y) for x in range(4)] for y in range(3)] == \
+         [[grid.is_free(x, y) for x in range(4)] for y in range(3)]
+  assert grid.jump_point_search((0, 0), (3, 2))[1] == 5 # The wall blocks every diagonal
+  assert grid.jump_point_search((0, 0), (3, 0))[1] == 3
+  assert rebuilt.memory_usage() == (6 * 5 + 7) // 8 # One bit per padded cell
+
+  graph.add_vertex("off-grid", 0.5, 1)
+  with pytest.raises(ValueError):
+    graph.to_grid()
@@ -1,3 +1,10 @@
+import gzip
+import random
+
+import pytest
+
+from algorithms.pathfinding import DirectedWeightedGraph, IndexedPriorityQueue, PriorityQueue, Vertex
+from graph_factories import build_admissible_graph
 
 def main():
   while True:
@@ -80,4 +87,283 @@ def main():
         break
 
 
+def build_sample_graph():
+  """Small graph with a cheap detour & an unreachable vertex"""
+  graph = DirectedWeightedGraph()
+  for name, x, y in [(1, 0, 0), (2, 1, 0), (3, 2, 0), (4, 3, 0), (5, 9, 9)]:
+    graph.add_vertex(name, x, y)
+
+  graph.add_edge(1, 2, 1.0)
+  graph.add_edge(2, 3, 1.0)
+  graph.add_edge(1, 3, 5.0)
+  graph.add_edge(3, 4, 1.0)
+  graph.add_edge(2, 4, 4.0)
+  return graph
+
+
+def test_dijkstra_shortest_path():
+  graph = build_sample_graph()
+  path, distance, expanded = graph.dijkstras_algorithm(1, 4)
+  assert path == [1, 2, 3, 4]
+  assert distance == 3.0
+  assert expanded == 4
+
+
+def test_dijkstra_stops_when_goal_settled():
+  graph = build_sample_graph()
+  # Goal is settled before vertices 3 & 4 are expanded
+  path, distance, expanded = graph.dijkstras_algorithm(1, 2)
+  assert path == [1, 2]
+  assert distance == 1.0
+  assert expanded == 2
+
+
+def test_dijkstra_no_path():
+  graph = build_sample_graph()
+  path, distance, expanded = graph.dijkstras_algorithm(1, 5)
+  assert path is None
+  assert distance == float("inf")
+  assert expanded == 4
+  assert graph.dijkstras_algorithm(1, 99) == (None, float("inf"), 0)
+
+def test_astar_shortest_path():
+  graph = build_sample_graph()
+  path, distance, expanded = graph.astar_algorithm(1, 4)
+  assert path == [1, 2, 3, 4]
+  assert distance == 3.0
+  assert expanded <= 4
+  assert graph.astar_algorithm(1, 5) == (None, float("inf"), 0)
+  assert graph.astar_algorithm(1, 99) == (None, float("inf"), 0)
+  assert graph.astar_algorithm(99, 1) == (None, float("inf"), 0)
+
+
+def test_priority_queue_orders_large_heap():
+  # Deep heaps must not depend on recursive sifting
+  values = list(range(5000))
+  random.Random(3).shuffle(values)
+  priority_queue = PriorityQueue()
+  for value in values:
+    priority_queue.enqueue(value)
+  assert [priority_queue.dequeue() for _ in values] == sorted(values)
+  assert priority_queue.dequeue() is None
+
+
+def test_indexed_priority_queue_decrease_key():
+  priority_queue = IndexedPriorityQueue()
+  for item, priority in [("a", 5), ("b", 3), ("c", 8), ("d", 1)]:
+    priority_queue.enqueue(item, priority)
+
+  assert priority_queue.contains("c")
+  assert priority_queue.peek() == (1, "d")
+
+  # Decrease moves the entry, non-improvements are ignored
+  priority_queue.decrease_key("c", 0)
+  priority_queue.enqueue("a", 9)
+  assert priority_queue.size == 4
+  assert priority_queue.peek() == (0, "c")
+
+  order = [priority_queue.dequeue() for _ in range(4)]
+  assert order == [(0, "c"), (1, "d"), (3, "b"), (5, "a")]
+  assert not priority_queue.contains("c")
+  assert priority_queue.is_empty()
+  assert priority_queue.dequeue() is None
+  assert priority_queue.peek() is None
+
+def path_length(graph, path):
+  """Sum edge weights along a path"""
+  return sum(graph.vertex_map[u].neighbour_links[v] for u, v in zip(path, path[1:]))
+
+
+def test_add_edge_maintains_reverse_links():
+  graph = build_sample_graph()
+  assert graph.vertex_map[4].reverse_links == {3: 1.0, 2: 4.0}
+  graph.add_edge(3, 4, 2.5)
+  assert graph.vertex_map[4].reverse_links[3] == 2.5
+
+
+def test_bidirectional_searches_match_dijkstra():
+  graph = build_admissible_graph(80, 320, seed=2)
+  rng = random.Random(4)
+
+  for _ in range(60):
+    start, goal = rng.randrange(80), rng.randrange(80)
+    _, expected, _ = graph.dijkstras_algorithm(start, goal)
+
+    for search in (graph.bidirectional_dijkstra, graph.bidirectional_astar):
+      path, distance, _ = search(start, goal)
+      if expected == float("inf"):
+        assert path is None and distance == float("inf")
+      else:
+        assert abs(distance - expected) < 1e-9
+        assert path[0] == start and path[-1] == goal
+        assert abs(path_length(graph, path) - distance) < 1e-9
+
+
+def test_bidirectional_dijkstra_expands_fewer_nodes():
+  graph = DirectedWeightedGraph()
+  side = 30
+  for row in range(side):
+    for col in range(side):
+      graph.add_vertex((row, col), col, row)
+  for row in range(side):
+    for col in range(side):
+      for n_row, n_col in ((row + 1, col), (row, col + 1), (row - 1, col), (row, col - 1)):
+        graph.add_edge((row, col), (n_row, n_col), 1.0)
+
+  start, goal = (15, 2), (15, 27)
+  _, distance, expanded = graph.dijkstras_algorithm(start, goal)
+  _, bi_distance, bi_expanded = graph.bidirectional_dijkstra(start, goal)
+  assert bi_distance == distance == 25.0
+  assert bi_expanded < expanded
+  assert graph.bidirectional_dijkstra(start, start) == ([start], 0, 0)
+
+def test_path_cache_hits_and_lru_eviction():
+  graph = build_sample_graph()
+  graph.enable_path_cache(max_sources=2)
+
+  assert graph.dijkstras_algorithm(1, 4)[:2] == ([1, 2, 3, 4], 3.0)
+  path, distance, expanded = graph.dijkstras_algorithm(1, 3)
+  assert (path, distance, expanded) == ([1, 2, 3], 2.0, 0)
+  assert graph.cache_info() == {"hits": 1, "misses": 1, "size": 1, "capacity": 2}
+
+  # Third source evicts the least recently used tree (source 2)
+  graph.dijkstras_algorithm(2, 4)
+  graph.dijkstras_algorithm(1, 4)
+  graph.dijkstras_algorithm(3, 4)
+  assert list(graph.path_cache) == [1, 3]
+
+
+def test_path_cache_invalidated_by_edge_changes():
+  graph = build_sample_graph()
+  graph.enable_path_cache()
+  graph.dijkstras_algorithm(1, 4)
+  graph.dijkstras_algorithm(3, 4)
+
+  # Shortcut improves routes from 1 but cannot affect the tree from 3
+  graph.add_edge(1, 4, 0.5)
+  assert list(graph.path_cache) == [3]
+  assert graph.dijkstras_algorithm(1, 4)[:2] == ([1, 4], 0.5)
+
+  # Raising the weight of a tree edge invalidates, an unused edge does not
+  graph.add_edge(2, 4, 9.0)
+  assert 1 in graph.path_cache
+  graph.add_edge(1, 4, 7.0)
+  assert 1 not in graph.path_cache
+  assert graph.dijkstras_algorithm(1, 4)[:2] == ([1, 2, 3, 4], 3.0)
+
+  # New vertices are unreachable until an edge reaches them
+  graph.add_vertex(6, 0, 0)
+  assert graph.dijkstras_algorithm(1, 6)[0] is None
+  graph.add_edge(4, 6, 1.0)
+  assert graph.dijkstras_algorithm(1, 6)[:2] == ([1, 2, 3, 4, 6], 4.0)
+
+SAMPLE_GRAPH_TEXT = """4 5
+1 0.0 0.0
+2 1.0 0.0
+3 2.0 0.5
+4 3.0 0.0
+1 2 1.5
+2 3 1.25
+1 3 4.0
+3 4 1.0
+2 9 7.0
+1 4
+"""
+
+
+def test_read_graph_streams_plain_and_gzip(tmp_path):
+  plain = tmp_path / "graph.txt"
+  plain.write_text(SAMPLE_GRAPH_TEXT)
+  packed = tmp_path / "graph.txt.gz"
+  packed.write_bytes(gzip.compress(SAMPLE_GRAPH_TEXT.encode()))
+
+  for filename, chunk_size in [(plain, 1 << 22), (plain, 3), (packed, 5)]:
+    graph, start, goal, vertices, edges = DirectedWeightedGraph.read_graph(filename, chunk_size)
+    assert (start, goal, vertices, edges) == (1, 4, 4, 5)
+    assert graph.vertex_map[3].x == 2.0 and graph.vertex_map[3].y == 0.5
+    assert graph.vertex_map[1].neighbour_links == {2: 1.5, 3: 4.0}
+    # Edge to the unknown vertex 9 is skipped, like add_edge
+    assert graph.vertex_map[2].neighbour_links == {3: 1.25}
+    assert graph.vertex_map[3].reverse_links == {2: 1.25, 1: 4.0}
+    assert graph.dijkstras_algorithm(start, goal)[:2] == ([1, 2, 3, 4], 3.75)
+    assert graph.load_stats["bytes"] == len(SAMPLE_GRAPH_TEXT)
+
+
+def test_vertices_are_slotted_and_read_graph_interns_names(tmp_path):
+  assert not hasattr(Vertex(1), "__dict__")
+
+  # Names above the small int cache parse to a new object per row
+  plain = tmp_path / "graph.txt"
+  plain.write_text("2 2\n1000 0 0\n1001 1 0\n1000 1001 1.0\n1001 1000 2.0\n1000 1001\n")
+  graph = DirectedWeightedGraph.read_graph(plain)[0]
+  u_object, v_object = graph.vertex_map[1000], graph.vertex_map[1001]
+  assert next(iter(u_object.neighbour_links)) is v_object.name
+  assert next(iter(v_object.reverse_links)) is u_object.name
+
+
+def test_add_edges_from_reports_summary():
+  graph = DirectedWeightedGraph()
+  for name in range(3):
+    graph.add_vertex(name, 0, 0)
+  graph.add_edge(0, 1, 5.0)
+  tree = graph.register_source(0)
+
+  summary = graph.add_edges_from([(0, 1, 1.0), (1, 2, 2.0), (1, 2, 1.5), (2, 9, 1.0), (7, 8, 1.0)])
+  assert summary == {
+    "rows": 5, "added": 1, "duplicates": 2, "dropped": 2,
+    "vertices_created": 0, "dropped_sample": [(2, 9, 1.0), (7, 8, 1.0)],
+  }
+  assert graph.vertex_map[1].neighbour_links == {2: 1.5}
+  assert graph.vertex_map[2].reverse_links == {1: 1.5}
+  assert tree.shortest_path(2) == ([0, 1, 2], 2.5)
+
+  summary = graph.add_edges_from([(2, 9, 1.0), (9, 9, 0.5)], create_vertices=True)
+  assert (summary["added"], summary["vertices_created"]) == (2, 1)
+  assert graph.dijkstras_algorithm(0, 9)[:2] == ([0, 1, 2, 9], 3.5)
+
+
+def test_from_arrays_matches_add_edge():
+  rng = random.Random(3)
+  rows = [(rng.randrange(50), rng.randrange(50), rng.uniform(1, 5)) for _ in range(300)]
+  expected = DirectedWeightedGraph()
+  for name in range(50):
+    expected.add_vertex(name, 0, 0)
+  for row in rows:
+    expected.add_edge(*row)
+
+  graph, summary = DirectedWeightedGraph.from_arrays(*zip(*rows))
+  assert summary["rows"] == 300 and summary["dropped"] == 0
+  for name, vertex in graph.vertex_map.items():
+    assert vertex.neighbour_links == expected.vertex_map[name].neighbour_links
+    assert vertex.reverse_links == expected.vertex_map[name].reverse_links
+
+
+def test_bulk_ingest_numpy_arrays():
+  np = pytest.importorskip("numpy")
+  u = np.array([0, 1, 2], dtype=np.int64)
+  v = np.array([1, 2, 0], dtype=np.int64)
+  weight = np.array([1.0, 2.0, 3.0])
+  graph, summary = DirectedWeightedGraph.from_arrays(u, v, weight)
+  assert summary["added"] == 3
+  assert all(type(name) is int for name in graph.vertex_map)
+
+  summary = graph.add_edges_from(np.array([[0, 2, 4.0]]))
+  assert summary["added"] == 1 and graph.vertex_map[0].neighbour_links[2] == 4.0
+
+
+def test_float_edge_array_keeps_integer_names(tmp_path):
+  np = pytest.importorskip("numpy")
+  graph = DirectedWeightedGraph()
+  summary = graph.add_edges_from(np.array([[0, 1, 1.5], [1, 2, 2.5], [0, 1, 1.0]]),
+                                 create_vertices=True)
+  assert (summary["added"], summary["duplicates"]) == (2, 1)
+  assert all(type(name) is int for name in graph.vertex_map)
+
+  graph.save_binary(tmp_path / "edges.bin")
+  csr = DirectedWeightedGraph.load_binary(tmp_path / "edges.bin")
+  assert list(csr.names) == [0, 1, 2]
+  assert csr.dijkstras_algorithm(0, 2)[:2] == ([0, 1, 2], 3.5)
+
+
 if __name__ == "__main__":
+  main()
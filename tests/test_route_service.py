@@ -0,0 +1,177 @@
+import asyncio
+import json
+
+import pytest
+
+from algorithms.pathfinding import DirectedWeightedGraph
+from algorithms.route_service import MAX_LINE_BYTES, RouteClient, RouteService, generate_load
+from benchmarks.workloads import generate
+
+
+def grid_graph(size=1600):
+  coordinates, edges = generate("grid", size, seed=3)
+  graph = DirectedWeightedGraph()
+  for name, (x, y) in enumerate(coordinates):
+    graph.add_vertex(name, x, y)
+  graph.add_edges_from(edges)
+  return graph
+
+
+def serve(graph, scenario, **options):
+  """Run scenario(service, client) against a single worker service on localhost"""
+  async def main():
+    async with RouteService(graph, workers=1, **options) as service:
+      client = await RouteClient.connect(*service.address)
+      try:
+        return await scenario(service, client)
+      finally:
+        await client.close()
+  return asyncio.run(main())
+
+
+def test_routes_match_dijkstra():
+  graph = grid_graph()
+  pairs = [(0, 399), (17, 250), (399, 0), (42, 42)]
+  assert len(graph.vertex_map) == 400
+
+  async def scenario(service, client):
+    routes = [await client.route(s, t) for s, t in pairs]
+    distances = await asyncio.gather(*(client.distance(s, t) for s, t in pairs))
+    matrix = await client.matrix([0, 17], [399, 250])
+    return routes, distances, matrix
+
+  routes, distances, matrix = serve(graph, scenario)
+  for (source, target), route, distance in zip(pairs, routes, distances):
+    path, expected, _ = graph.dijkstras_algorithm(source, target)
+    assert route["ok"] and route["distance"] == pytest.approx(expected)
+    assert route["path"][0] == source and route["path"][-1] == target
+    assert distance["distance"] == pytest.approx(expected)
+
+  assert matrix["distances"] == [
+    [pytest.approx(graph.dijkstras_algorithm(s, t)[1]) for t in (399, 250)] for s in (0, 17)]
+
+
+def test_unreachable_target_gives_null_route():
+  graph = DirectedWeightedGraph()
+  graph.add_vertex("a", 0, 0)
+  graph.add_vertex("b", 1, 0)
+  graph.add_vertex("c", 2, 0)
+  graph.add_edge("a", "b", 1.0)
+
+  async def scenario(service, client):
+    return await client.route("a", "c")
+
+  assert serve(graph, scenario) == {"id": 1, "ok": True, "distance": None, "path": None}
+
+
+def test_concurrent_requests_share_source_searches():
+  graph = grid_graph()
+
+  async def scenario(service, client):
+    responses = await asyncio.gather(*(client.distance(source, target)
+                                       for source in (0, 399) for target in range(0, 400, 10)))
+    return responses, service.stats
+
+  responses, stats = serve(graph, scenario, batch_window=0.05)
+  assert all(response["ok"] for response in responses)
+  assert stats["searches"] == 2 and stats["coalesced"] == len(responses) - 2
+
+
+def test_errors_are_reported_per_request():
+  graph = grid_graph()
+
+  async def scenario(service, client):
+    return (await client.route(0, "nowhere"),
+            await client.request("teleport"),
+            await client.request("route", source=0),
+            await client.route(0, 399, deadline_ms=0))
+
+  unknown, bad_op, missing, expired = serve(graph, scenario)
+  assert unknown["error"] == "unknown vertex 'nowhere'"
+  assert bad_op["error"] == "unknown op 'teleport'"
+  assert missing["error"] == "missing field 'target'"
+  assert expired["error"] == "deadline exceeded"
+
+
+def test_wrongly_typed_fields_get_an_error_reply():
+  graph = grid_graph()
+
+  async def scenario(service, client):
+    return (await client.route(0, 399, deadline_ms="5"),
+            await client.route([0], 399),
+            await client.matrix(0, [399]))
+
+  deadline, source, sources = serve(graph, scenario)
+  assert deadline == {"id": 1, "ok": False, "error": "deadline_ms must be a number, not '5'"}
+  assert source == {"id": 2, "ok": False, "error": "vertex must be a string or number, not [0]"}
+  assert sources == {"id": 3, "ok": False, "error": "'sources' must be a list"}
+
+
+def test_overlong_request_line_gets_a_reply():
+  graph = grid_graph()
+
+  async def scenario(service, client):
+    reader, writer = await asyncio.open_connection(*service.address)
+    writer.write(b'{"op": "route", "source": "' + b"x" * MAX_LINE_BYTES + b'"}\n')
+    await writer.drain()
+    reply = json.loads(await reader.readline())
+    closed = await reader.read() == b""
+    writer.close()
+    return reply, closed
+
+  reply, closed = serve(graph, scenario)
+  assert reply == {"id": None, "ok": False, "error": "request too long"}
+  assert closed
+
+
+def test_matrix_with_unknown_source_submits_no_work():
+  graph = grid_graph()
+
+  async def scenario(service, client):
+    response = await client.matrix([0, "nowhere", 17], [399])
+    return response, dict(service.stats), len(service._batches)
+
+  response, stats, batches = serve(graph, scenario, batch_window=0.05)
+  assert response["error"] == "unknown vertex 'nowhere'"
+  assert stats["searches"] == 0 and batches == 0
+
+
+def test_close_fails_requests_still_batching():
+  graph = grid_graph()
+
+  async def main():
+    service = RouteService(graph, workers=1, batch_window=60)
+    await service.start()
+    request = asyncio.ensure_future(service.execute({"id": 7, "op": "distance", "source": 0, "target": 5}))
+    await asyncio.sleep(0.01)
+    await service.close()
+    return await request, service._batches
+
+  response, batches = asyncio.run(main())
+  assert response == {"id": 7, "ok": False, "error": "service shutting down"}
+  assert batches == {}
+
+
+def test_overload_rejects_new_requests():
+  graph = grid_graph()
+
+  async def scenario(service, client):
+    responses = await asyncio.gather(*(client.distance(0, target) for target in range(5)))
+    stats = await client.request("stats")
+    return responses, stats["stats"]
+
+  responses, stats = serve(graph, scenario, max_pending=2)
+  assert [response.get("error") for response in responses].count("overloaded") == 3
+  assert stats["rejected"] == 3 and stats["pending"] == 0
+
+
+def test_generate_load_reports_outcomes():
+  graph = grid_graph()
+
+  async def scenario(service, client):
+    return await generate_load(service.address, graph.vertex_map, requests=60,
+                               connections=2, concurrency=8, matrix_every=10)
+
+  result = serve(graph, scenario)
+  assert result["outcomes"] == {"ok": 60}
+  assert result["p50"] <= result["p95"] <= result["p99"]
@@ -0,0 +1,118 @@
+import json
+
+from algorithms.search_stats import SearchStats
+from graphs.adjacency_list import Graph
+from graph_factories import build_random_graph
+
+
+def test_stats_do_not_change_results():
+  graph = build_random_graph(150, 600, seed=3, weights=(20.0, 30.0), placed=True)
+  stats = SearchStats()
+  for goal in range(1, 40):
+    assert graph.dijkstras_algorithm(0, goal, stats=stats) == graph.dijkstras_algorithm(0, goal)
+    assert graph.astar_algorithm(0, goal, stats=stats) == graph.astar_algorithm(0, goal)
+  assert stats.queries == 78
+
+
+def test_dijkstra_counters():
+  graph = build_random_graph(150, 600, seed=4, weights=(20.0, 30.0), placed=True)
+  stats = SearchStats()
+  path, distance, expanded = graph.dijkstras_algorithm(0, 90, stats=stats)
+
+  totals = stats.totals
+  assert totals["expanded"] == totals["pops"] == expanded
+  assert totals["improvements"] == totals["pushes"] + totals["decrease_keys"]
+  assert totals["pushes"] >= expanded - 1 # Every pop but the start was pushed
+  assert totals["relaxations"] >= totals["improvements"]
+  assert totals["peak_frontier"] >= 1
+  assert set(k for k in totals if k.startswith("phase_")) == {"phase_search_seconds",
+                                                              "phase_path_seconds"}
+
+
+def test_hooks_and_sampled_traces(tmp_path):
+  graph = build_random_graph(100, 400, seed=5, weights=(20.0, 30.0), placed=True)
+  expanded = []
+  improved = []
+  stats = SearchStats(sample_rate=1.0,
+                      on_expand=lambda query, v, priority: expanded.append(v),
+                      on_improve=lambda query, u, v, priority: improved.append(v))
+  _, _, expanded_nodes = graph.dijkstras_algorithm(0, 50, stats=stats)
+
+  assert len(expanded) == expanded_nodes
+  assert len(improved) == stats.totals["improvements"]
+  trace = stats.traces[0]
+  assert [vertex for vertex, _ in trace["events"]] == expanded
+  # Dijkstra settles vertices in non-decreasing distance order
+  priorities = [priority for _, priority in trace["events"]]
+  assert priorities == sorted(priorities)
+
+  filename = tmp_path / "traces.jsonl"
+  stats.dump_traces(filename)
+  lines = filename.read_text().splitlines()
+  assert len(lines) == 1
+  assert json.loads(lines[0])["method"] == "dijkstra"
+
+
+def test_sampling_is_seeded_and_bounded():
+  graph = build_random_graph(60, 200, seed=6, weights=(20.0, 30.0), placed=True)
+  runs = []
+  for _ in range(2):
+    stats = SearchStats(sample_rate=0.3, max_traces=5, seed=11)
+    for goal in range(1, 60):
+      graph.dijkstras_algorithm(0, goal, stats=stats)
+    runs.append([trace["goal"] for trace in stats.traces])
+  assert runs[0] == runs[1]
+  assert len(runs[0]) == 5
+
+
+def test_histograms_and_json():
+  graph = build_random_graph(100, 400, seed=7, weights=(20.0, 30.0), placed=True)
+  stats = SearchStats()
+  for goal in range(1, 30):
+    graph.dijkstras_algorithm(0, goal, stats=stats)
+
+  histogram = stats.histogram("expanded")
+  assert sum(queries for _, queries in histogram) == 29
+  assert all(bucket == 0 or bucket & (bucket - 1) == 0 for bucket, _ in histogram)
+  summary = json.loads(stats.to_json())
+  assert summary["queries"] == 29
+  assert summary["totals"]["expanded"] == stats.totals["expanded"]
+
+
+def test_cache_and_longest_path_phases():
+  graph = build_random_graph(12, 30, seed=8, weights=(20.0, 30.0), placed=True)
+  graph.enable_path_cache()
+  stats = SearchStats()
+  graph.dijkstras_algorithm(0, 5, stats=stats)
+  assert "phase_cache_seconds" in stats.totals
+
+  stats = SearchStats()
+  path, distance, complete = graph.longest_path(0, 5, stats=stats)
+  assert (path, distance, complete) == graph.longest_path(0, 5)
+  for phase in ("reduce", "topological", "search"):
+    assert f"phase_{phase}_seconds" in stats.totals
+
+
+def test_graph_traversals_finish_when_stopped_early():
+  graph = Graph()
+  for name in "ABCDEF":
+    graph.add_vertex(name)
+  for u_name, v_name in (("A", "B"), ("A", "C"), ("B", "D"), ("C", "E"), ("D", "F")):
+    graph.add_edge(u_name, v_name, 1)
+
+  stats = SearchStats()
+  order = [u_name for u_name, _, _ in graph.bfs("A", stats=stats)]
+  assert order == [u_name for u_name, _, _ in graph.bfs("A")]
+  assert stats.totals["expanded"] == 6
+  assert stats.totals["pushes"] == 5
+
+  stopped = graph.bfs("A", stats=stats)
+  next(stopped)
+  stopped.close()
+  assert stats.queries == 2
+
+  list(graph.dfs("A", stats=stats))
+  assert stats.queries == 3
+
+  graph.direction_optimizing_bfs("A", stats=stats)
+  assert stats.queries == 4
@@ -0,0 +1,89 @@
+import random
+
+import pytest
+
+from algorithms.pathfinding import DirectedWeightedGraph
+from algorithms.spatial_index import LEAF_SIZE, SpatialIndex
+
+
+def brute_force(points, x, y):
+  return sorted(((px - x) ** 2 + (py - y) ** 2, name) for name, px, py in points)
+
+
+def test_queries_match_brute_force_across_inserts():
+  rng = random.Random(2)
+  points = [(name, rng.uniform(0, 100), rng.uniform(0, 100)) for name in range(1500)]
+  # Clustered & duplicate coordinates stress equal split keys
+  points += [(1500 + i, 50.0, float(i % 3)) for i in range(40)]
+
+  index = SpatialIndex(points[:200])
+  for point in points[200:]:
+    index.insert(*point)
+  assert len(index) == len(points)
+
+  for _ in range(200):
+    x, y = rng.uniform(-10, 110), rng.uniform(-10, 110)
+    expected = brute_force(points, x, y)
+
+    _, distance = index.nearest(x, y)
+    assert distance ** 2 == pytest.approx(expected[0][0])
+
+    k_nearest = index.k_nearest(x, y, 5)
+    assert [d ** 2 for _, d in k_nearest] == pytest.approx([d for d, _ in expected[:5]])
+
+    within = index.within(x, y, 12)
+    assert sorted(name for name, _ in within) == sorted(n for d, n in expected if d <= 144)
+    assert [d for _, d in within] == sorted(d for _, d in within)
+
+
+def test_interleaved_inserts_keep_few_trees():
+  rng = random.Random(4)
+  points = [(name, rng.uniform(0, 100), rng.uniform(0, 100)) for name in range(2000)]
+  index = SpatialIndex(points[:1000])
+
+  for count, point in enumerate(points[1000:], 1001):
+    index.insert(*point)
+    if count % 50 == 0:
+      x, y = rng.uniform(0, 100), rng.uniform(0, 100)
+      assert index.nearest(x, y)[1] ** 2 == pytest.approx(brute_force(points[:count], x, y)[0][0])
+
+  # Queries scan a bounded pending list & O(log n) trees of doubling sizes
+  assert len(index.pending) < LEAF_SIZE and len(index) == 2000
+  sizes = [len(tree) for tree in index.trees]
+  assert all(larger > smaller for larger, smaller in zip(sizes, sizes[1:]))
+  assert len(sizes) <= 8
+
+
+def test_batches_match_single_queries():
+  rng = random.Random(3)
+  index = SpatialIndex((name, rng.random(), rng.random()) for name in range(500))
+  queries = [(rng.random(), rng.random()) for _ in range(100)]
+  assert index.nearest_many(queries) == [index.nearest(x, y) for x, y in queries]
+  assert index.k_nearest_many(queries, 3) == [index.k_nearest(x, y, 3) for x, y in queries]
+  assert index.within_many(queries, 0.1) == [index.within(x, y, 0.1) for x, y in queries]
+
+
+def test_empty_and_small_indexes():
+  index = SpatialIndex()
+  assert index.nearest(1, 2) == (None, float("inf"))
+  assert index.k_nearest(1, 2, 3) == []
+  assert index.within(1, 2, 5) == []
+
+  index.insert("a", 3, 4)
+  assert index.nearest(0, 0) == ("a", 5.0)
+  assert index.k_nearest(0, 0, 10) == [("a", 5.0)]
+
+
+def test_graph_index_follows_add_vertex():
+  graph = DirectedWeightedGraph()
+  for name in range(100):
+    graph.add_vertex(name, name % 10, name // 10)
+
+  assert graph.nearest_vertex(3.2, 4.9) == (53, pytest.approx(0.2236, abs=1e-4))
+
+  # Vertices added after the index was built are found straight away
+  graph.add_vertex("depot", 50, 50)
+  assert graph.nearest_vertex(49, 49)[0] == "depot"
+  graph.add_edges_from([("depot", "yard", 1.0)], create_vertices=True)
+  assert graph.nearest_vertex(0, 0.1)[0] in (0, "yard")
+  assert len(graph.spatial_index) == 102
@@ -0,0 +1,42 @@
+import pytest
+
+pytest.importorskip("numpy")
+
+from algorithms.vectorized_sssp import frontier_shortest_path, frontier_shortest_path_tree
+from graph_factories import build_random_graph
+
+
+def test_tree_matches_dijkstra_exactly():
+  graph = build_random_graph(400, 2400, seed=1)
+  expected, _ = graph.shortest_path_tree(3)
+  for delta in (None, 0.5, 4.0, float("inf")):
+    distance, parent = frontier_shortest_path_tree(graph, 3, delta=delta)
+    assert distance == expected
+    assert parent[3] is None
+
+    # Every parent edge is tight
+    for v_name, u_name in parent.items():
+      if u_name is not None:
+        weight = graph.vertex_map[u_name].neighbour_links[v_name]
+        assert distance[u_name] + weight == distance[v_name]
+
+
+def test_path_matches_dijkstra():
+  graph = build_random_graph(300, 1500, seed=2)
+  csr = graph.freeze()
+  for goal in range(0, 300, 17):
+    expected_path, expected_distance, _ = graph.dijkstras_algorithm(0, goal)
+    path, distance, _ = frontier_shortest_path(csr, 0, goal)
+    assert distance == expected_distance
+    if expected_path is None:
+      assert path is None
+    else:
+      assert path[0] == 0 and path[-1] == goal
+      total = sum(graph.vertex_map[u].neighbour_links[v] for u, v in zip(path, path[1:]))
+      assert abs(total - distance) < 1e-9
+
+
+def test_missing_vertices():
+  graph = build_random_graph(5, 5, seed=3)
+  assert frontier_shortest_path_tree(graph, "missing") == ({}, {})
+  assert frontier_shortest_path(graph, 0, "missing") == (None, float("inf"), 0)